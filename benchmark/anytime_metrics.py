@@ -0,0 +1,312 @@
+# This file is part of camino-benchmark
+# Copyright (C) 2026  Andrea Ghezzi, Wim Van Roy, Sebastian Sager, Moritz Diehl
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""
+Anytime performance of the solvers.
+
+The performance profiles of `create_plot.py` only use the final objective and
+time. Here the incumbents and bounds found during a solve are used to compute
+per instance
+
+- `time_to_first`: time of the first feasible solution,
+- `time_to_gap`: time at which the primal gap is below `--gap`,
+- `primal_integral`: integral of the primal gap over [0, time limit],
+- `primal_dual_integral`: integral of the primal-dual gap over [0, time limit],
+
+with the gaps of Berthold (2013), 1 without incumbent. The trajectories are
+read from the stats pickles of CAMINO and the iteration table of the SHOT
+logs (`<name>.log`, or the final bounds of the .osrl file if the log has no
+iteration rows). The pickles hold a snapshot per iteration only if the runs
+were made with `parallel_runner.py --trace`, otherwise only the final one.
+The other solvers, e.g. those run with AMPL, only report their final result
+in overview.json and are left out of the metrics and profiles:
+
+    python benchmark/anytime_metrics.py <results_dir> <key: cvx, noncvx> [--solvers ...]
+"""
+
+import os
+import re
+from argparse import ArgumentParser
+from datetime import datetime
+import numpy as np
+import pandas as pd
+from matplotlib import pyplot as plt
+from create_plot import latexify, plot_performance_profile, profile_curves
+from read_shot import read_values
+from result_status import MAX_ABS_VALUE
+from results_store import instance_set
+from stats_trace import load_trace, stats_files
+
+TIME_LIMIT = 300.0
+GAP_TOL = 1e-2
+EVENT_COLUMNS = ["solver", "name", "time", "primal", "dual"]
+METRICS = ["time_to_first", "time_to_gap", "primal_integral", "primal_dual_integral"]
+METRIC_TITLES = {
+    "time_to_first": "Time to first solution",
+    "time_to_gap": "Time to gap",
+    "primal_integral": "Primal integral",
+    "primal_dual_integral": "Primal-dual integral",
+}
+
+# Iteration row of SHOT, the columns are aligned with spaces and only the
+# header uses "│", e.g. "  12: MILP-O  1.23  5 | 60  1.2e3 | 1.3e3  ...";
+# rows of primal solutions have no iteration number, e.g. "  NLPFIX  1.25 ..."
+SHOT_ROW = re.compile(
+    r"^\s*(?:\d+:\s*)?[A-Za-z][\w-]*\s+(\d+\.?\d*(?:[eE][+-]?\d+)?)\s"
+)
+SHOT_PAIR = re.compile(r"(\S+)\s*\|\s*(\S+)")
+
+
+def camino_events(folder, solver):
+    """
+    Incumbents and bounds of the snapshots in the stats pickles of CAMINO.
+
+    Without `parallel_runner.py --trace` there is only the final snapshot.
+    """
+    trace = load_trace(
+        folder,
+        columns=["name", "snapshot", "time", "total_wall_time", "f_star", "lb", "ub"],
+    )
+    trace = trace.drop_duplicates(["name", "snapshot"])
+    # The time of a snapshot is reset at the end of the solve
+    time = trace["total_wall_time"].fillna(trace["time"])
+    # Some solvers, e.g. bonmin, only report the objective at the end
+    f_star = trace["f_star"].where(np.isfinite(trace["f_star"]))
+    primal = f_star.fillna(trace["ub"])
+    events = pd.DataFrame(
+        {
+            "solver": solver,
+            "name": trace["name"].astype(object),
+            "time": time.to_numpy(dtype=float),
+            "primal": primal.to_numpy(dtype=float),
+            "dual": trace["lb"].to_numpy(dtype=float),
+        }
+    )
+    # CAMINO solves the minimization form of maximization problems
+    objsense = instance_set(solver).set_index("name")["objsense"]
+    maximize = events["name"].map(objsense).eq("max").to_numpy()
+    events.loc[maximize, ["primal", "dual"]] *= -1
+    return events
+
+
+def shot_log_events(log_file):
+    """(time, dual, primal) of the iterations in a SHOT log."""
+    rows = []
+    with open(log_file, "r", errors="replace") as f:
+        for line in f:
+            match = SHOT_ROW.match(line)
+            if match is None:
+                continue
+            # Columns of "a | b": dual cuts (integers), objective, gap, solution
+            for pair in SHOT_PAIR.findall(line[match.end() :]):
+                if all(value.isdigit() for value in pair):
+                    continue
+                try:
+                    dual, primal = (float(value) for value in pair)
+                except ValueError:
+                    break
+                rows.append([float(match.group(1)), dual, primal])
+                break
+    return rows
+
+
+def shot_osrl_event(osrl_file):
+    """(time, dual, primal) of the final result in a .osrl file, None if unreadable."""
+    try:
+        values = read_values(osrl_file)
+        return [
+            float(values["Total"]),
+            float(values["DualObjectiveBound"]),
+            float(values["PrimalObjectiveBound"]),
+        ]
+    except Exception:
+        return None
+
+
+def shot_events(folder, solver):
+    """
+    Bounds of SHOT, from the logs or from the final results in the .osrl files.
+
+    The .osrl file is used for the instances whose log has no iteration rows,
+    e.g. SHOT was killed before the main iteration step.
+    """
+    files = {}
+    for entry in os.scandir(folder):
+        name, ext = os.path.splitext(entry.name)
+        if ext in (".log", ".osrl"):
+            files.setdefault(name, {})[ext] = entry.path
+    rows = []
+    for name, paths in sorted(files.items()):
+        log_rows = shot_log_events(paths[".log"]) if ".log" in paths else []
+        if len(log_rows) == 0 and ".osrl" in paths:
+            event = shot_osrl_event(paths[".osrl"])
+            log_rows = [] if event is None else [event]
+        rows.extend([name] + row for row in log_rows)
+    events = pd.DataFrame(rows, columns=["name", "time", "dual", "primal"])
+    events["solver"] = solver
+    return events[EVENT_COLUMNS]
+
+
+def read_events(folder, solver):
+    """
+    Events of a results folder, depending on the files it contains.
+
+    :return: None for the other solvers, e.g. of AMPL, whose overview.json
+        only holds the final result
+    """
+    if len(stats_files(folder)) > 0:
+        return camino_events(folder, solver)
+    if any(f.endswith((".osrl", ".log")) for f in os.listdir(folder)):
+        return shot_events(folder, solver)
+    return None
+
+
+def gap(a, b):
+    """
+    Relative gap between two arrays of values.
+
+    0 if both are zero, 1 if a value is missing or the signs differ.
+    """
+    with np.errstate(invalid="ignore", divide="ignore"):
+        scale = np.maximum(np.abs(a), np.abs(b))
+        value = np.where(scale == 0, 0.0, np.abs(a - b) / scale)
+    missing = ~np.isfinite(a) | ~np.isfinite(b) | (np.sign(a) * np.sign(b) < 0)
+    return np.where(missing, 1.0, np.minimum(value, 1.0))
+
+
+def anytime_metrics(events, reference, time_limit=TIME_LIMIT, gap_tol=GAP_TOL):
+    """
+    Compute the anytime metrics of all instances at once.
+
+    :param events: DataFrame with EVENT_COLUMNS, values in the sense of the problem
+    :param reference: DataFrame with name, primalbound and objsense
+    :return: DataFrame indexed by (solver, name) with METRICS and the final gaps
+    """
+    reference = reference.set_index("name")
+    events = events[events["name"].isin(reference.index)]
+    sense = np.where(reference["objsense"].eq("max"), -1.0, 1.0)
+    sense = pd.Series(sense, index=reference.index)
+
+    events = events.sort_values(["solver", "name", "time"], kind="stable")
+    events = events.reset_index(drop=True)
+    s = events["name"].map(sense).to_numpy()
+    # Work on the minimization form, huge values mean no incumbent or bound
+    primal = pd.Series(s * events["primal"].to_numpy(dtype=float))
+    dual = pd.Series(s * events["dual"].to_numpy(dtype=float))
+    primal[~(primal.abs() <= MAX_ABS_VALUE)] = np.nan
+    dual[~(dual.abs() <= MAX_ABS_VALUE)] = np.nan
+    groups = [events["solver"], events["name"]]
+    primal = primal.groupby(groups).cummin().groupby(groups).ffill().to_numpy()
+    dual = dual.groupby(groups).cummax().groupby(groups).ffill().to_numpy()
+    ref = s * events["name"].map(reference["primalbound"]).to_numpy(dtype=float)
+
+    time = np.clip(events["time"].to_numpy(dtype=float), 0, time_limit)
+    time[np.isnan(time)] = time_limit
+    codes, keys = pd.MultiIndex.from_frame(events[["solver", "name"]]).factorize()
+    last = np.r_[codes[1:] != codes[:-1], True]
+    first = np.r_[True, codes[1:] != codes[:-1]]
+    # The gap of an event holds until the next event or the time limit
+    dt = np.where(last, time_limit, np.r_[time[1:], time_limit]) - time
+    primal_gap = gap(primal, ref)
+    pd_gap = gap(primal, dual)
+    n = len(keys)
+
+    def first_time(mask):
+        found = np.full(n, np.inf)
+        np.minimum.at(found, codes[mask], time[mask])
+        found[found >= time_limit] = np.inf
+        return found
+
+    start = time[first]
+    metrics = pd.DataFrame(
+        {
+            "time_to_first": first_time(np.isfinite(primal)),
+            "time_to_gap": first_time(primal_gap <= gap_tol),
+            "primal_integral": start + np.bincount(codes, primal_gap * dt, n),
+            "primal_dual_integral": start + np.bincount(codes, pd_gap * dt, n),
+            "primal_gap": primal_gap[last],
+            "primal_dual_gap": pd_gap[last],
+        },
+        index=keys.set_names(["solver", "name"]),
+    )
+    # Instances without events never had an incumbent
+    full = pd.MultiIndex.from_product(
+        [events["solver"].unique(), reference.index], names=["solver", "name"]
+    )
+    metrics = metrics.reindex(full)
+    metrics[["time_to_first", "time_to_gap"]] = metrics[
+        ["time_to_first", "time_to_gap"]
+    ].fillna(np.inf)
+    metrics[["primal_integral", "primal_dual_integral"]] = metrics[
+        ["primal_integral", "primal_dual_integral"]
+    ].fillna(time_limit)
+    metrics[["primal_gap", "primal_dual_gap"]] = metrics[
+        ["primal_gap", "primal_dual_gap"]
+    ].fillna(1.0)
+    return metrics
+
+
+def metric_profiles(metrics, solvers, output, key, tau_max=10, legend_labels=None):
+    """Plot a performance profile of every metric, smaller is better."""
+    if legend_labels is None:
+        legend_labels = [s[len(key) + 1 :].replace("_", "-") for s in solvers]
+    date = datetime.now().strftime("%m-%d")
+    files = []
+    for metric in METRICS:
+        wide = metrics[metric].unstack("solver").reindex(columns=solvers)
+        curves = profile_curves(wide, solvers, tau_max)
+        filename = os.path.join(output, f"{date}_{key}_{metric}_profile.png")
+        fig, _ = plot_performance_profile(
+            curves,
+            filename,
+            tau_max=tau_max,
+            title=METRIC_TITLES[metric],
+            legend_labels=legend_labels,
+        )
+        plt.close(fig)
+        files.append(filename)
+    return files
+
+
+if __name__ == "__main__":
+    parser = ArgumentParser(description="Anytime metrics of the solvers")
+    parser.add_argument("results_dir", help="folder with a results folder per solver")
+    parser.add_argument("key", choices=["cvx", "noncvx"])
+    parser.add_argument(
+        "--solvers",
+        nargs="+",
+        help="results folders, default: all folders starting with the key",
+    )
+    parser.add_argument("--time-limit", type=float, default=TIME_LIMIT)
+    parser.add_argument(
+        "--gap", type=float, default=GAP_TOL, help="primal gap of time_to_gap"
+    )
+    parser.add_argument("--tau-max", type=float, default=10)
+    args = parser.parse_args()
+
+    solvers = args.solvers or sorted(
+        entry.name
+        for entry in os.scandir(args.results_dir)
+        if entry.is_dir() and entry.name.startswith(args.key + "_")
+    )
+    events = {s: read_events(os.path.join(args.results_dir, s), s) for s in solvers}
+    for solver in solvers:
+        if events[solver] is None:
+            print(f"Skipped {solver}, only the final result is known")
+    solvers = [s for s in solvers if events[s] is not None]
+    if len(solvers) == 0:
+        print("No solver with incumbents over time")
+        exit(1)
+    events = pd.concat([events[s] for s in solvers], ignore_index=True)
+    metrics = anytime_metrics(events, instance_set(args.key), args.time_limit, args.gap)
+    filename = os.path.join(args.results_dir, f"{args.key}_anytime.csv")
+    metrics.to_csv(filename)
+    print(f"Written {filename}")
+    print(metrics.groupby("solver")[METRICS].agg(lambda x: np.median(x)).to_string())
+
+    latexify(6, 4)
+    for f in metric_profiles(
+        metrics, solvers, args.results_dir, args.key, args.tau_max
+    ):
+        print(f"Written {f}")
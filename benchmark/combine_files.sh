@@ -11,6 +11,9 @@ fi
 path_to_output=$2
 mode=$1
 mkdir -p $path_to_output
+# Results are also added to the columnar store read by create_plot.py
+store=$path_to_output/store
+run=$(basename $path_to_output)
 
 case "$mode" in
     compare)
@@ -33,6 +36,12 @@ case "$mode" in
 
         python ./benchmark/join_csv_using_pandas.py $path_to_output/cvx.csv ./benchmark/convex_set_full.csv $path_to_output/cvx_bonmin.csv $path_to_output/cvx_sbmiqp.csv $path_to_output/cvx_sbmiqp_ee.csv  $path_to_output/cvx_shot.csv $path_to_output/cvx_gurobi.csv $path_to_output/cvx_scip.csv
         python ./benchmark/join_csv_using_pandas.py $path_to_output/noncvx.csv ./benchmark/nonconvex_set_full.csv $path_to_output/noncvx_bonmin.csv $path_to_output/noncvx_sbmiqp.csv $path_to_output/noncvx_sbmiqp_ee.csv  $path_to_output/noncvx_shot.csv $path_to_output/noncvx_gurobi.csv $path_to_output/noncvx_scip.csv
+
+        for key in cvx noncvx; do
+            python ./benchmark/results_store.py add $store $run \
+                ${key}_bonmin=$path_to_output/${key}_bonmin ${key}_sbmiqp=$path_to_output/${key}_sbmiqp ${key}_sbmiqp_ee=$path_to_output/${key}_sbmiqp_ee \
+                ${key}_gurobi=$path_to_output/${key}_gurobi ${key}_scip=$path_to_output/${key}_scip ${key}_shot=$path_to_output/${key}_shot.csv
+        done
         ;;
     alpha)
         # ============================== Combine files for comparing sbmiqp versions ==============================
@@ -44,6 +53,7 @@ case "$mode" in
         python ./benchmark/to_csv.py $path_to_output/overview075.json $path_to_output/cvx_sbmiqp_ee_075.csv
         python ./benchmark/to_csv.py $path_to_output/overview095.json $path_to_output/cvx_sbmiqp_ee_095.csv
         python ./benchmark/join_csv_using_pandas.py $path_to_output/cvx.csv ./benchmark/convex_set_full.csv $path_to_output/cvx_sbmiqp_ee_005.csv $path_to_output/cvx_sbmiqp_ee_025.csv $path_to_output/cvx_sbmiqp_ee_050.csv $path_to_output/cvx_sbmiqp_ee_075.csv $path_to_output/cvx_sbmiqp_ee_095.csv
+        python ./benchmark/results_store.py add $store $run $(for label in 005 025 050 075 095; do echo cvx_sbmiqp_ee_$label=$path_to_output/overview$label.json; done)
         ;;
     rho)
         echo "Running rho tuning mode..."
@@ -54,6 +64,7 @@ case "$mode" in
         python ./benchmark/to_csv.py $path_to_output/overview100.json  $path_to_output/noncvx_sbmiqp_100.csv
         python ./benchmark/to_csv.py $path_to_output/overview500.json  $path_to_output/noncvx_sbmiqp_500.csv
         python ./benchmark/join_csv_using_pandas.py $path_to_output/noncvx.csv ./benchmark/nonconvex_set_full.csv $path_to_output/noncvx_sbmiqp_010.csv $path_to_output/noncvx_sbmiqp_015.csv $path_to_output/noncvx_sbmiqp_050.csv $path_to_output/noncvx_sbmiqp_100.csv $path_to_output/noncvx_sbmiqp_500.csv
+        python ./benchmark/results_store.py add $store $run $(for label in 010 015 050 100 500; do echo noncvx_sbmiqp_$label=$path_to_output/overview$label.json; done)
         ;;
 
     *)
@@ -7,44 +7,9 @@ import pandas as pd
 import os
 import numpy as np
 import re
-
-
-def to_float(val):
-    """Convert to float."""
-    if type(val) == str:
-        if (
-            ("Objective" in val)
-            or ("feasible" in val)
-            or ("Error" in val)
-            or ("Calling" in val)
-            or ("g_val" in val)
-            or ("CRASH" in val)
-            or ("FAILED" in val)
-            or ("empty" in val)
-            or ("basic_string" in val)
-            or ("No objective" in val)
-            or ("Suffix values" in val)
-            or ("for indices" in val)
-            or ("has no attribute" in val)
-        ):
-            return np.inf
-        elif val == "-inf" or val == "-Infinity":
-            return np.inf
-        elif val == "NAN":
-            return np.inf
-        elif val == "0":
-            return np.inf
-        else:
-            val = float(val)
-            if abs(val) > 1e20:
-                return np.inf
-            else:
-                return float(val)
-    else:
-        if abs(val) > 1e20:
-            return np.inf
-        return float(val)
-
+from experiment import analysis, load_spec
+from results_store import read_table
+from result_status import normalize
 
 TIME_LIMIT = 300
 
@@ -52,35 +17,21 @@ if __name__ == "__main__":
 
     if len(argv) != 4:
         print(
-            "Usage: python convert_to_latex_table.py <data_file.csv> <key> <solve_time>"
+            "Usage: python convert_to_latex_table.py <data_file.csv | store> <key> <solve_time>"
         )
         print("key: cvx or noncvx")
         print("solve_time: solvetime or totaltime")
         exit(1)
 
-    data = pd.read_csv(argv[1])
-    SAVE_DIRECTORY = os.path.dirname(argv[1])
+    SAVE_DIRECTORY = os.path.dirname(os.path.normpath(argv[1]))
     key = argv[2]
     assert key == "cvx" or key == "noncvx"
     solve_time = argv[3]
     assert solve_time == "solvetime" or solve_time == "totaltime"
 
-    solvers = [
-        f"{key}_bonmin",
-        f"{key}_gurobi",
-        f"{key}_scip",
-        f"{key}_shot",
-        f"{key}_sbmiqp",
-        f"{key}_sbmiqp_ee",
-    ]
-    solver_names = [
-        "Bonmin",
-        "Gurobi",
-        "SCIP",
-        "SHOT",
-        "S-B-MIQP",
-        "S-B-MIQP-ee",
-    ]
+    spec = load_spec()
+    solvers, solver_names, _, _, _ = analysis(spec, "compare", key)
+    data = read_table(argv[1], solvers, ["obj", "calc_time", "solver_time"])
     total_entries = data.shape[0]
 
     # Some data cleaning
@@ -91,8 +42,7 @@ if __name__ == "__main__":
             if "sbmiqp" in solvers_calctime[i]:
                 solvers_calctime[i] = solvers_calctime[i].split(".")[0] + ".solver_time"
 
-    data[solvers_calctime] = data[solvers_calctime].map(to_float)
-    data[solvers_obj] = data[solvers_obj].map(to_float)
+    normalize(data, solvers_calctime + solvers_obj)
 
     data["min.calctime"] = np.min(data[solvers_calctime], axis=1)
     data.set_index("name", inplace=True)
@@ -131,17 +81,10 @@ if __name__ == "__main__":
     df = df.sort_index(axis=1, level=0)
 
     # Desired display order and names
-    order = ["Bonmin", "Gurobi", "SCIP", "SHOT", "S-B-MIQP", "S-B-MIQP-ee"]
+    order = solver_names
 
     # Map the “raw” solver keys to the display names
-    raw_to_display = {
-        "bonmin": "Bonmin",
-        "gurobi": "Gurobi",
-        "scip": "SCIP",
-        "shot": "SHOT",
-        "sbmiqp": "S-B-MIQP",
-        "sbmiqp_ee": "S-B-MIQP-ee",
-    }
+    raw_to_display = {s[len(key) + 1 :]: n for s, n in zip(solvers, solver_names)}
 
     # 1) Rename level‑0 (solver) of the MultiIndex
     df.columns = df.columns.set_levels(
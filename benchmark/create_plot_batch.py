@@ -0,0 +1,192 @@
+# This file is part of camino-benchmark
+# Copyright (C) 2026  Andrea Ghezzi, Wim Van Roy, Sebastian Sager, Moritz Diehl
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""
+Create all performance profiles of one or more result tables at once.
+
+Each table is read and cleaned once. The profiles of every requested
+analysis, for the wall time (solvetime and totaltime) and the objective, are
+computed in the main process and the figures are rendered by a pool of worker
+processes. The generated files are listed in `manifest.json` next to them.
+
+    python benchmark/create_plot_batch.py <data_file.csv | store> ... [--workers N]
+"""
+
+import json
+import os
+from argparse import ArgumentParser
+from datetime import datetime
+from multiprocessing import Pool
+import pandas as pd
+from matplotlib import pyplot as plt
+from create_plot import (
+    analysis_instances,
+    clean_data,
+    latexify,
+    plot_performance_profile,
+    print_summary,
+    profile_curves,
+    select_solvers,
+    time_columns,
+)
+from experiment import load_spec
+from result_status import normalize
+from results_store import load, load_wide
+
+ANALYSES = ["compare", "alpha", "rho"]
+SOLVE_TIMES = ["totaltime", "solvetime"]
+KEYS = ["cvx", "noncvx"]
+METRICS = ["obj", "calc_time", "solver_time"]
+
+
+def read_tables(source, keys, analyses):
+    """
+    Read the tables of a merged csv file or a store.
+
+    :return: dict of key -> (table indexed by name, status, available analyses)
+    """
+    if os.path.isdir(source):
+        stored = set(load(source, columns=[])["solver"])
+    else:
+        # A merged csv contains the results of a single key
+        name = os.path.basename(source)
+        keys = [key for key in keys if name.startswith(key)]
+        columns = pd.read_csv(source, nrows=0).columns
+        stored = {col.split(".")[0] for col in columns if "." in col}
+
+    tables = {}
+    for key in keys:
+        available = [
+            analysis
+            for analysis in analyses
+            if set(select_solvers(key, analysis)[0]) <= stored
+        ]
+        if len(available) == 0:
+            continue
+        solvers = sorted({s for a in available for s in select_solvers(key, a)[0]})
+        if os.path.isdir(source):
+            data = load_wide(source, solvers, METRICS)
+        else:
+            data = pd.read_csv(source)
+        cols = [f"{s}.{m}" for s in solvers for m in METRICS if f"{s}.{m}" in data]
+        data = data.set_index("name")
+        status = normalize(data, cols)
+        tables[key] = (data, status, available)
+    return tables
+
+
+def profile_specs(data, status, key, analysis, solve_times, output, date):
+    """Compute the profiles of an analysis, returns the figures to render."""
+    solvers, solver_names, TAU_MAX, YLIM_LIST = select_solvers(key, analysis)
+    instances = analysis_instances(analysis)
+    if instances is not None:
+        data = data.loc[data.index.isin(instances)]
+        status = status.loc[data.index]
+    solvers_obj = [f"{solver}.obj" for solver in solvers]
+
+    specs = []
+    for solve_time in solve_times:
+        solvers_calctime = time_columns(solvers, solve_time)
+        cleaned = clean_data(data.copy(), solvers, solvers_calctime)
+        print(f"=== {key} {analysis} {solve_time} ===")
+        print_summary(cleaned, solvers, solvers_calctime, status)
+        profiles = [
+            (
+                "calc_time",
+                solve_time,
+                solvers_calctime,
+                f"{key}_calc_time_profile_nsol{len(solver_names)}_{solve_time}",
+                "Wall time",
+            )
+        ]
+        # The objective does not depend on the time column
+        if solve_time == solve_times[0]:
+            profiles.append(
+                (
+                    "obj",
+                    None,
+                    solvers_obj,
+                    f"{key}_obj_profile_nsol{len(solver_names)}",
+                    "Objective",
+                )
+            )
+        for metric, time_kind, columns, name, title in profiles:
+            i = 0 if metric == "calc_time" else 1
+            curves = profile_curves(cleaned, columns, TAU_MAX[i])
+            specs.append(
+                {
+                    "plot": {
+                        "curves": curves,
+                        "filename": os.path.join(output, f"{date}_{name}.png"),
+                        "ylim": YLIM_LIST[i],
+                        "tau_max": TAU_MAX[i],
+                        "title": title,
+                        "legend_labels": solver_names,
+                    },
+                    "key": key,
+                    "analysis": analysis,
+                    "metric": metric,
+                    "solve_time": time_kind,
+                    "solvers": solvers,
+                    "solved": {s: float(c[1][-1]) for s, c in zip(solvers, curves)},
+                }
+            )
+    return specs
+
+
+def render(plot):
+    """Render a single figure, executed in a worker process."""
+    fig, _ = plot_performance_profile(**plot)
+    plt.close(fig)
+    return plot["filename"]
+
+
+if __name__ == "__main__":
+    parser = ArgumentParser(description="Create all performance profiles")
+    parser.add_argument("sources", nargs="+", help="merged csv files or stores")
+    parser.add_argument("--key", nargs="+", choices=KEYS, default=KEYS)
+    parser.add_argument(
+        "--analysis",
+        nargs="+",
+        choices=list(load_spec()["experiments"]),
+        default=ANALYSES,
+    )
+    parser.add_argument(
+        "--solve-time", nargs="+", choices=SOLVE_TIMES, default=SOLVE_TIMES
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=os.cpu_count(),
+        help="number of processes rendering figures (default: number of cores)",
+    )
+    args = parser.parse_args()
+
+    date = datetime.now().strftime("%m-%d")
+    manifests = {}
+    for source in args.sources:
+        output = os.path.dirname(os.path.normpath(source))
+        tables = read_tables(source, args.key, args.analysis)
+        if len(tables) == 0:
+            print(f"Warning: No analysis found in {source}")
+        for key, (data, status, available) in tables.items():
+            for analysis in available:
+                for spec in profile_specs(
+                    data, status, key, analysis, args.solve_time, output, date
+                ):
+                    spec["source"] = source
+                    manifests.setdefault(output, []).append(spec)
+
+    plots = [spec.pop("plot") for specs in manifests.values() for spec in specs]
+    with Pool(args.workers, initializer=latexify, initargs=(6, 4)) as pool:
+        files = pool.map(render, plots)
+
+    for spec, filename in zip(
+        [spec for specs in manifests.values() for spec in specs], files
+    ):
+        spec["file"] = os.path.basename(filename)
+    for output, specs in manifests.items():
+        with open(os.path.join(output, "manifest.json"), "w") as f:
+            json.dump(specs, f, indent=2)
+        print(f"Written {len(specs)} figures to {output}, cf. manifest.json")
@@ -0,0 +1,443 @@
+# This file is part of camino-benchmark
+# Copyright (C) 2026  Andrea Ghezzi, Wim Van Roy, Sebastian Sager, Moritz Diehl
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""
+Progress dashboard of the runs of one or more experiments.
+
+Every results folder of the experiments, cf. experiment.plan, is watched:
+the new records of its journal are read at every refresh and the jobs being
+solved are read from the `running.json` files of the runners (parallel
+runner, run_shot.py, using_amplpy.py, racing.py). Shown are, per results
+folder, the finished, failed, running and queued instances and the estimated
+CPU time left, and in total the throughput (instances per hour), the
+utilization of every core and the ETA. The ETA schedules the expected times
+of the running and queued instances, taken from previous results as in
+scheduler.py and scaled by the ratio of actual to expected time of the
+instances finished so far, on the workers of the runners:
+
+    python benchmark/dashboard.py <path_to_save_results> compare [alpha ...] [--port 8000]
+
+With `--port` the dashboard is also served at http://127.0.0.1:<port>, and
+the numbers as json at /status.json. The server only listens on the loopback
+interface; use `--host 0.0.0.0` to serve it to other machines.
+"""
+
+import glob
+import html
+import json
+import os
+import socket
+import threading
+from argparse import ArgumentParser
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from time import sleep, time
+from experiment import camino_defaults, load_spec, plan
+from journal import (
+    JOURNAL_NAME,
+    OVERVIEW_NAME,
+    PROGRESS_NAME,
+    RUNNING_NAME,
+    JournalReader,
+    instance_name,
+    load_overview,
+)
+from scheduler import RuntimeEstimator, predict_makespan
+
+INTERVAL = 5
+# Window of the recent throughput in seconds
+RECENT = 600
+# Bounds of the ratio of actual to expected time
+CALIBRATION = (0.1, 10.0)
+# Only reachable from the machine itself unless --host is given
+HOST = "127.0.0.1"
+
+
+def record_failed(record):
+    """True for a record of a failed solve of any runner."""
+    return (
+        record.get("dual_obj") in ("FAILED", "CRASH", "KILLED")
+        or record.get("obj") == "FAILED"
+        or record.get("status", "OK") != "OK"
+    )
+
+
+def record_time(record):
+    """Wall time of a record, None if it is not a number."""
+    for column in ["wall_time", "calc_time"]:
+        try:
+            return float(record[column])
+        except (KeyError, TypeError, ValueError):
+            continue
+    return None
+
+
+def format_duration(seconds):
+    """Duration as 1d02h, 3h05m or 4m12s."""
+    seconds = int(round(seconds))
+    days, hours = divmod(seconds // 3600, 24)
+    minutes, seconds = divmod(seconds % 3600, 60)
+    if days > 0:
+        return f"{days}d{hours:02d}h"
+    if hours > 0:
+        return f"{hours}h{minutes:02d}m"
+    return f"{minutes}m{seconds:02d}s"
+
+
+def planned_groups(spec, experiments):
+    """Results folders of the experiments and their instances."""
+    groups = {}
+    for cell in plan(spec, experiments, defaults=camino_defaults()):
+        for target in cell.targets:
+            names = groups.setdefault(target.group, [])
+            if cell.name not in names:
+                names.append(cell.name)
+    return groups
+
+
+class GroupState:
+    """Finished instances of a results folder."""
+
+    def __init__(self, folder, group, names):
+        self.folder = os.path.abspath(folder)
+        self.group = group
+        self.names = names
+        self.records = {}
+        self.arrivals = []
+        self.reader = JournalReader(os.path.join(folder, JOURNAL_NAME))
+        self.legacy = False
+        self.total = len(names)
+
+    def refresh(self, now, initial=False):
+        """Read the new records, their arrival time counts for the throughput."""
+        records = self.reader.read()
+        journal = os.path.join(self.folder, JOURNAL_NAME)
+        if not os.path.exists(journal) and not self.legacy:
+            # Finished before the journal existed
+            records = self.legacy_records()
+        planned = set(self.names)
+        for record in records:
+            name = instance_name(record["path"])
+            if name not in planned:
+                continue
+            if name not in self.records and not initial:
+                self.arrivals.append(now)
+            self.records[name] = record
+        progress = os.path.join(self.folder, PROGRESS_NAME)
+        if os.path.exists(progress):
+            with open(progress, "r") as f:
+                # Runs on a subset of the instances have a smaller total
+                self.total = json.load(f)["total"]
+
+    def legacy_records(self):
+        """Records of an overview.json or of the .osrl files of SHOT."""
+        overview = os.path.join(self.folder, OVERVIEW_NAME)
+        if os.path.exists(overview):
+            self.legacy = True
+            data = load_overview(overview)["data"]
+            return [dict(zip(data[0], row)) for row in data[1:]]
+        osrl = glob.glob(os.path.join(self.folder, "*.osrl"))
+        self.legacy = len(osrl) > 0
+        return [{"path": f, "status": "OK"} for f in osrl]
+
+    def failed(self):
+        return sum(record_failed(r) for r in self.records.values())
+
+    def remaining(self):
+        """Instances not finished, in the order of the plan."""
+        return [name for name in self.names if name not in self.records]
+
+
+def alive(runner):
+    """True if the runner of a running.json is still running."""
+    if runner.get("host") != socket.gethostname():
+        # Cannot be checked on another host
+        return True
+    try:
+        os.kill(runner["pid"], 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass
+    return True
+
+
+def read_running(results_dir):
+    """Live runners below the results folder."""
+    runners = []
+    pattern = os.path.join(results_dir, "**", RUNNING_NAME)
+    for filename in glob.glob(pattern, recursive=True):
+        try:
+            with open(filename, "r") as f:
+                runner = json.load(f)
+        except (OSError, ValueError):
+            continue
+        if alive(runner):
+            runners.append(runner)
+    return runners
+
+
+def cpu_times():
+    """(busy, total) jiffies of every core, None if /proc/stat is not available."""
+    try:
+        with open("/proc/stat", "r") as f:
+            lines = [
+                line.split() for line in f if line[:3] == "cpu" and line[3].isdigit()
+            ]
+    except OSError:
+        return None
+    times = []
+    for fields in lines:
+        values = [int(v) for v in fields[1:9]]
+        times.append((sum(values) - values[3] - values[4], sum(values)))
+    return times
+
+
+def utilization(previous, current):
+    """Busy fraction of every core between two calls of cpu_times."""
+    if previous is None or current is None or len(previous) != len(current):
+        return None
+    return [
+        (busy - busy0) / max(total - total0, 1)
+        for (busy0, total0), (busy, total) in zip(previous, current)
+    ]
+
+
+class Dashboard:
+    """
+    State of the runs of the experiments.
+
+    :param groups: results folder -> planned instances, cf. planned_groups
+    :param workers: workers assumed while no runner is running
+    """
+
+    def __init__(self, results_dir, groups, estimator, time_limit, workers):
+        self.results_dir = results_dir
+        self.groups = {
+            group: GroupState(os.path.join(results_dir, group), group, names)
+            for group, names in groups.items()
+        }
+        self.estimator = estimator
+        self.time_limit = time_limit
+        self.workers = workers
+        self.start = time()
+        self.cpu = cpu_times()
+        for state in self.groups.values():
+            state.refresh(self.start, initial=True)
+
+    def estimate(self, group, name):
+        return self.estimator.estimate(group.split("/")[0], name)
+
+    def calibration(self):
+        """Ratio of actual to expected time of the finished instances."""
+        actual = expected = 0.0
+        for state in self.groups.values():
+            for name, record in state.records.items():
+                t = record_time(record)
+                if t is not None and not record_failed(record):
+                    actual += min(t, self.time_limit)
+                    expected += self.estimate(state.group, name)
+        if expected == 0:
+            return 1.0
+        return min(max(actual / expected, CALIBRATION[0]), CALIBRATION[1])
+
+    def refresh(self):
+        """Read the new results and compute the status."""
+        now = time()
+        for state in self.groups.values():
+            state.refresh(now)
+        cpu = cpu_times()
+        cores = utilization(self.cpu, cpu)
+        self.cpu = cpu
+
+        runners = read_running(self.results_dir)
+        running = {}
+        for runner in runners:
+            for job in runner["jobs"]:
+                running[job["folder"], job["name"]] = now - job["start"]
+        workers = sum(r["workers"] for r in runners) or self.workers
+        factor = self.calibration()
+
+        rows = []
+        left_running, left_queued = [], []
+        for group, state in self.groups.items():
+            remaining = state.remaining()
+            # Runs on a subset of the instances do not solve all planned ones
+            todo = max(state.total - len(state.records), 0)
+            active = [n for n in remaining if (state.folder, n) in running]
+            queued = [n for n in remaining if (state.folder, n) not in running]
+            queued = queued[: max(todo - len(active), 0)]
+            work = 0.0
+            for name in active:
+                expected = self.estimate(group, name) * factor
+                elapsed = running[state.folder, name]
+                left = max(expected - elapsed, 0.1 * expected)
+                left = min(left, max(self.time_limit - elapsed, 0.0))
+                left_running.append(left)
+                work += left
+            for name in queued:
+                left_queued.append(self.estimate(group, name) * factor)
+                work += left_queued[-1]
+            rows.append(
+                {
+                    "group": group,
+                    "done": len(state.records),
+                    "total": state.total,
+                    "failed": state.failed(),
+                    "running": len(active),
+                    "queued": len(queued),
+                    "work_left": work,
+                }
+            )
+
+        # Running jobs first, the runners start the longest queued jobs first
+        durations = left_running + sorted(left_queued, reverse=True)
+        eta = predict_makespan(durations, workers) if durations else 0.0
+        arrivals = [t for s in self.groups.values() for t in s.arrivals]
+        recent = [t for t in arrivals if t > now - RECENT]
+        window = min(RECENT, now - self.start)
+        return {
+            "time": now,
+            "groups": rows,
+            "done": sum(r["done"] for r in rows),
+            "total": sum(r["total"] for r in rows),
+            "failed": sum(r["failed"] for r in rows),
+            "running": sum(r["running"] for r in rows),
+            "queued": sum(r["queued"] for r in rows),
+            "runners": len(runners),
+            "workers": workers,
+            "throughput_recent": len(recent) / window * 3600 if window > 0 else 0.0,
+            "throughput_session": len(arrivals) / max(now - self.start, 1) * 3600,
+            "calibration": factor,
+            "eta": eta,
+            "cores": cores,
+        }
+
+
+def render(status):
+    """Text of the dashboard."""
+    width = max([len(r["group"]) for r in status["groups"]] + [5])
+    now = datetime.fromtimestamp(status["time"])
+    lines = [
+        f"{now:%Y-%m-%d %H:%M:%S}  {status['runners']} runners, {status['workers']} workers",
+        "",
+        f"{'group':<{width}}  {'done':>11}  {'failed':>6}  {'running':>7}  {'queued':>6}  {'CPU left':>8}",
+    ]
+    for row in status["groups"] + [dict(status, group="total")]:
+        if row["group"] == "total":
+            lines.append("-" * len(lines[-1]))
+            row = dict(row, work_left=sum(r["work_left"] for r in status["groups"]))
+        done = f"{row['done']}/{row['total']}"
+        lines.append(
+            f"{row['group']:<{width}}  {done:>11}  {row['failed']:>6}  {row['running']:>7}"
+            f"  {row['queued']:>6}  {format_duration(row['work_left']):>8}"
+        )
+    finish = datetime.fromtimestamp(status["time"] + status["eta"])
+    lines += [
+        "",
+        f"Throughput {status['throughput_recent']:.1f}/h (last {RECENT // 60} min), "
+        f"{status['throughput_session']:.1f}/h (since start of the dashboard)",
+        f"ETA {format_duration(status['eta'])} ({finish:%a %H:%M}), "
+        f"times {status['calibration']:.2f}x the history",
+    ]
+    if status["cores"] is not None:
+        cores = status["cores"]
+        lines.append(f"CPU {100 * sum(cores) / len(cores):.0f}% on {len(cores)} cores")
+        for i in range(0, len(cores), 16):
+            lines.append(" ".join(f"{100 * c:3.0f}" for c in cores[i : i + 16]))
+    return "\n".join(lines)
+
+
+def serve(port, latest, host=HOST):
+    """
+    Serve the latest text and status of the dashboard in a background thread.
+
+    :param host: interface to listen on, "0.0.0.0" for all
+    :return: the server
+    """
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path == "/status.json":
+                body = json.dumps(latest["status"]).encode()
+                content_type = "application/json"
+            else:
+                body = (
+                    f'<html><head><meta http-equiv="refresh" content="{INTERVAL}">'
+                    f"<title>camino-benchmark</title></head>"
+                    f"<body><pre>{html.escape(latest['text'])}</pre></body></html>"
+                ).encode()
+                content_type = "text/html"
+            self.send_response(200)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer((host, port), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    host, port = server.server_address[:2]
+    print(f"Serving the dashboard at http://{host}:{port}")
+    return server
+
+
+if __name__ == "__main__":
+    parser = ArgumentParser(description="Progress dashboard of the benchmark runs")
+    parser.add_argument("results_dir", help="output folder of the runs")
+    parser.add_argument("experiments", nargs="+", help="experiments of the spec")
+    parser.add_argument(
+        "--interval", type=float, default=INTERVAL, help="seconds between refreshes"
+    )
+    parser.add_argument("--port", type=int, default=None, help="also serve over HTTP")
+    parser.add_argument(
+        "--host",
+        default=HOST,
+        help=f"interface of --port, 0.0.0.0 for all (default: {HOST})",
+    )
+    parser.add_argument(
+        "--history",
+        nargs="*",
+        default=None,
+        help="csv/json files with previous calc_time columns (default: results/*)",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=os.cpu_count(),
+        help="workers assumed while no runner is running (default: number of cores)",
+    )
+    parser.add_argument(
+        "--spec", default=None, help="experiment spec (default: experiments.json)"
+    )
+    parser.add_argument(
+        "--repetitions", type=int, default=None, help="(default: from the spec)"
+    )
+    parser.add_argument("--once", action="store_true", help="print once and exit")
+    args = parser.parse_args()
+
+    spec = load_spec(args.spec)
+    if args.repetitions is not None:
+        spec["repetitions"] = args.repetitions
+    dashboard = Dashboard(
+        args.results_dir,
+        planned_groups(spec, args.experiments),
+        RuntimeEstimator(args.history),
+        spec["time_limit"],
+        args.workers,
+    )
+    latest = {"text": "", "status": {}}
+    if args.port is not None:
+        serve(args.port, latest, args.host)
+    while True:
+        status = dashboard.refresh()
+        latest["status"], latest["text"] = status, render(status)
+        if args.once:
+            print(latest["text"])
+            break
+        # Clear the terminal
+        print("\033[2J\033[H" + latest["text"], flush=True)
+        sleep(args.interval)
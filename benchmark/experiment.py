@@ -0,0 +1,200 @@
+# This file is part of camino-benchmark
+# Copyright (C) 2026  Andrea Ghezzi, Wim Van Roy, Sebastian Sager, Moritz Diehl
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""
+Declarative experiment spec, cf. `experiments.json`.
+
+The spec defines
+
+- `instance_sets`: a csv file of instances (`file`), optionally restricted to
+  the names in `include_file` and without the names in `exclude`; `key` is
+  the prefix of the results folders (cvx, noncvx),
+- `solvers`: the `runner` (camino, shot, ampl) with its `algorithm` or
+  `solver`, `settings`, the instances it skips (`exclude`) and the `label`
+  in the figures; solvers without runner are only used in the analysis,
+- `experiments`: the instance sets and solvers of a mode and the axes of its
+  performance profiles,
+- the `time_limit` and the number of `repetitions`.
+
+The planner expands experiments into the cells of the job matrix. Cells that
+solve the same instance with the same solver, settings and time limit are
+computed once and their result is copied to every results folder using them:
+
+    python benchmark/experiment.py compare alpha rho
+"""
+
+import json
+import os
+import re
+from collections import namedtuple
+from sys import argv
+import pandas as pd
+
+BENCHMARK_DIR = os.path.dirname(os.path.abspath(__file__))
+SPEC_FILE = os.path.join(BENCHMARK_DIR, "experiments.json")
+
+# A result of the job matrix and the results folders (group, idx) it goes to
+Cell = namedtuple(
+    "Cell", ["runner", "solver", "config", "name", "repetition", "targets"]
+)
+Target = namedtuple("Target", ["group", "idx", "solver"])
+
+
+def repetition_folder(group, repetition):
+    """Results folder of a repetition, the first one is the folder of the group."""
+    return group if repetition == 0 else f"{group}/rep{repetition}"
+
+
+def load_spec(filename=None):
+    """Load an experiment spec, by default benchmark/experiments.json."""
+    with open(filename or SPEC_FILE, "r") as f:
+        spec = json.load(f)
+    spec["directory"] = os.path.dirname(os.path.abspath(filename or SPEC_FILE))
+    return spec
+
+
+def read_names(filename):
+    """Instance names in a csv file with a name column or a list of files."""
+    if filename.endswith(".csv"):
+        return list(pd.read_csv(filename)["name"])
+    with open(filename, "r") as f:
+        paths = f.read().split()
+    return [re.sub(r"\.\w+$", "", os.path.basename(p)) for p in paths]
+
+
+def set_instances(spec, set_name, solver=None):
+    """
+    Instances of an instance set, in the order of its files.
+
+    :param solver: solver whose excluded instances are removed
+    """
+    definition = spec["instance_sets"][set_name]
+    names = read_names(os.path.join(spec["directory"], definition["file"]))
+    if "include_file" in definition:
+        known = set(names)
+        include = read_names(
+            os.path.join(spec["directory"], definition["include_file"])
+        )
+        names = [name for name in include if name in known]
+    exclude = set(definition.get("exclude", []))
+    if solver is not None:
+        exclude |= set(spec["solvers"][solver].get("exclude", []))
+    return [name for name in names if name not in exclude]
+
+
+def set_key(spec, set_name):
+    """Prefix of the results folders of an instance set, e.g. cvx."""
+    return spec["instance_sets"][set_name]["key"]
+
+
+def key_sets(spec, key):
+    """Instance sets with a given key."""
+    return [name for name, s in spec["instance_sets"].items() if s["key"] == key]
+
+
+def run_config(spec, solver, defaults=None):
+    """
+    Everything that determines the result of a solver, as a canonical string.
+
+    :param defaults: default values of the settings, settings equal to their
+        default are dropped such that e.g. alpha=0.5 is the same as no alpha
+    """
+    definition = spec["solvers"][solver]
+    settings = dict(definition.get("settings", {}))
+    if defaults is not None:
+        settings = {
+            k: v for k, v in settings.items() if k not in defaults or defaults[k] != v
+        }
+    config = {
+        key: definition[key]
+        for key in ["runner", "algorithm", "solver", "options"]
+        if key in definition
+    }
+    config["settings"] = settings
+    config["time_limit"] = definition.get("time_limit", spec["time_limit"])
+    return json.dumps(config, sort_keys=True)
+
+
+def plan(spec, experiments, runner=None, instances=None, defaults=None):
+    """
+    Expand experiments into the deduplicated job matrix.
+
+    :param experiments: names of the experiments
+    :param runner: only plan the solvers of this runner, None for all
+    :param instances: names of the instances to keep, None for all
+    :param defaults: default settings of the solvers, cf. run_config
+    :return: list of Cell, in the order of the experiments
+    """
+    cells = {}
+    for experiment in experiments:
+        definition = spec["experiments"][experiment]
+        for set_name in definition["sets"]:
+            key = set_key(spec, set_name)
+            for solver in definition["solvers"]:
+                solver_runner = spec["solvers"][solver].get("runner")
+                if solver_runner is None or runner not in (None, solver_runner):
+                    continue
+                group = f"{key}_{solver}"
+                config = run_config(spec, solver, defaults)
+                names = set_instances(spec, set_name, solver)
+                if instances is not None:
+                    names = [name for name in names if name in instances]
+                for repetition in range(spec.get("repetitions", 1)):
+                    folder = repetition_folder(group, repetition)
+                    for idx, name in enumerate(names):
+                        cell = cells.setdefault(
+                            (config, name, repetition),
+                            Cell(solver_runner, solver, config, name, repetition, []),
+                        )
+                        target = Target(folder, idx, solver)
+                        if target not in cell.targets:
+                            cell.targets.append(target)
+    return list(cells.values())
+
+
+def camino_defaults():
+    """Default settings of CAMINO, None if it is not installed."""
+    try:
+        from camino.settings import Settings
+    except ImportError:
+        return None
+    return {k: getattr(Settings, k) for k in dir(Settings) if k.isupper()}
+
+
+def analysis_instances(spec, experiment):
+    """Instances used in the analysis of an experiment, None for all."""
+    definition = spec["experiments"][experiment]
+    if "analysis_set" not in definition:
+        return None
+    return set_instances(spec, definition["analysis_set"])
+
+
+def analysis(spec, experiment, key):
+    """
+    Solvers and axes of the performance profiles of an experiment.
+
+    :return: (solvers, labels, tau_max, ylim, instances or None for all)
+    """
+    definition = spec["experiments"][experiment]
+    solvers = [f"{key}_{solver}" for solver in definition["solvers"]]
+    labels = [spec["solvers"][solver]["label"] for solver in definition["solvers"]]
+    plot = definition["plot"].get(key, definition["plot"].get("default"))
+    tau_max = tuple(plot["tau_max"])
+    ylim = [tuple(lim) for lim in plot["ylim"]]
+    return solvers, labels, tau_max, ylim, analysis_instances(spec, experiment)
+
+
+if __name__ == "__main__":
+    if len(argv) < 2:
+        print("Usage: python experiment.py <experiment> [<experiment> ...]")
+        exit(1)
+
+    spec = load_spec()
+    cells = plan(spec, argv[1:], defaults=camino_defaults())
+    targets = sum(len(cell.targets) for cell in cells)
+    print(f"{len(cells)} cells to compute for {targets} results")
+    for cell in cells:
+        if len(cell.targets) > 1:
+            groups = ", ".join(f"{t.group}[{t.idx}]" for t in cell.targets)
+            print(f"{cell.name}: {groups}")
@@ -1,85 +1,93 @@
 import pandas as pd
 import numpy as np
+from concurrent.futures import ThreadPoolExecutor
 from sys import argv
 from os import path
-import csv
-
-if len(argv) <= 3:
-    print("Usage: output dataset-csv csvfiles")
-    exit(0)
-
-csv_out = argv[1]
-dataset = argv[2]
-other_csvs = argv[3:]
-if path.exists(csv_out):
-    raise Exception(f"CSV already exists: {csv_out}")
-
-# 1. Read the main dataset
-df_merged = pd.read_csv(dataset)
-
-# 2. Iterate through other CSVs and merge them one by one
-for f in other_csvs:
-    if path.exists(f):
-        # Read the current file
-        df_current = pd.read_csv(f)
-        df_current["path"] = df_current["path"].map(lambda x: x.split(".")[0])
-
-        # --- Fix columns for failed rows ---
-        # Identify rows where 'obj' is -inf
-        is_failed = (
-            (df_current["obj"] == float("-inf"))
-            | (df_current["obj"] == "NAN")
-            | (df_current["obj"] == "FAILED")
-        )
-
-        if is_failed.any():
-            # Set 'obj' to inf for these rows
-            df_current.loc[is_failed, "obj"] = np.inf
-
-            # Set the rest of the row (excluding 'path' which is needed for merge) to NaN
-            # Columns are: index(id)=0, path=1, obj=2, dual_obj=3...
-            # We select columns starting from index 3 ('dual_obj')
-            cols_to_nan = df_current.columns[3:]
-            df_current.loc[is_failed, cols_to_nan] = np.nan
-
-        # Rename columns starting from index 2 (skipping 'id' and 'path')
-        # df_current.columns[2:] selects the 3rd column onwards
-        cols_prefix = f.split("/")[-1].split(".")[0]
-        cols_to_rename = {col: f"{cols_prefix}.{col}" for col in df_current.columns[2:]}
-        df_current = df_current.rename(columns=cols_to_rename)
-        # 1. Drop the 'id' column, as we don't need it in the final merged table
-        df_current = df_current.drop(columns=["id"])
-
-        # 2. Set 'path' as the index. We will use this to merge,
-        # but it won't be added as a column in the final result.
-        df_current = df_current.set_index("path")
-
-        # 3. Merge. We match df_merged['name'] with df_current's index ('path').
-        # Since 'path' is no longer a column in df_current, no 'path_x'/'path_y' are created.
-        df_merged = pd.merge(
-            df_merged, df_current, how="left", left_on="name", right_index=True
-        )
-    else:
-        print(f"Warning: File not found: {f}")
-
-# 3. Post-processing: Flip signs for maximization problems
-#    for specific solvers (sbmiqp, sbmiqp_ee, bonmin)
-obj_cols = [col for col in df_merged.columns.tolist() if "obj" in col]
-target_solvers = ["sbmiqp", "sbmiqp_ee", "bonmin"]
-obj_cols = [
-    col for col in obj_cols if "sbmiqp" in col or "sbmiqp_ee" in col or "bonmin" in col
-]
-
-# Create a mask where objsense is 'max'
-mask_max = df_merged["objsense"] == "max"
-df_merged.loc[mask_max, obj_cols] *= -1
-
-# Fill nan in cols obj and dualobj with inf
-obj_cols = [col for col in df_merged.columns.tolist() if "obj" in col]
-df_merged[obj_cols] = df_merged[obj_cols].fillna(np.inf)
-
-# 4. Set 'name' as the index
-df_merged = df_merged.set_index("name")
-
-# 5. Save the output
-df_merged.to_csv(csv_out)
+
+# Solvers reporting the objective of the minimization form of the problem
+FLIP_SOLVERS = ["sbmiqp", "sbmiqp_ee", "bonmin"]
+
+
+def read_solver_table(filename):
+    """
+    Read the results of one solver, indexed by instance name.
+
+    Columns are prefixed with the name of the file, e.g. cvx_bonmin.obj.
+    """
+    df_current = pd.read_csv(filename)
+    # Keep the messages of failed runs as plain python strings
+    df_current = df_current.astype(
+        {
+            col: object
+            for col in df_current.columns
+            if pd.api.types.is_string_dtype(df_current[col])
+        }
+    )
+    df_current["path"] = df_current["path"].map(lambda x: x.split(".")[0])
+
+    # --- Fix columns for failed rows ---
+    is_failed = (
+        (df_current["obj"] == float("-inf"))
+        | (df_current["obj"] == "NAN")
+        | (df_current["obj"] == "FAILED")
+    )
+    if is_failed.any():
+        # Columns are: index(id)=0, path=1, obj=2, dual_obj=3...
+        df_current.loc[is_failed, "obj"] = np.inf
+        df_current.loc[is_failed, df_current.columns[3:]] = np.nan
+
+    cols_prefix = path.basename(filename).split(".")[0]
+    cols_to_rename = {col: f"{cols_prefix}.{col}" for col in df_current.columns[2:]}
+    df_current = df_current.rename(columns=cols_to_rename).drop(columns=["id"])
+    df_current = df_current.set_index("path")
+    return df_current[~df_current.index.duplicated()]
+
+
+def flip_sign(columns):
+    """Flip the sign of the numbers in columns, other values are kept."""
+    numbers = columns.apply(pd.to_numeric, errors="coerce")
+    return columns.mask(numbers.notna(), -numbers)
+
+
+def join_tables(dataset, filenames):
+    """
+    Join the results of all solvers to the instances of the dataset.
+
+    The solver tables are read in parallel and aligned on the instance name
+    in a single step.
+    """
+    df_merged = pd.read_csv(dataset)
+    existing = []
+    for f in filenames:
+        if path.exists(f):
+            existing.append(f)
+        else:
+            print(f"Warning: File not found: {f}")
+    with ThreadPoolExecutor() as pool:
+        tables = list(pool.map(read_solver_table, existing))
+    if len(tables) > 0:
+        df_merged = df_merged.join(pd.concat(tables, axis=1), on="name")
+
+    # Flip signs for maximization problems for specific solvers
+    obj_cols = [col for col in df_merged.columns if "obj" in col]
+    flip_cols = [col for col in obj_cols if any(s in col for s in FLIP_SOLVERS)]
+    mask_max = df_merged["objsense"] == "max"
+    df_merged.loc[mask_max, flip_cols] = flip_sign(df_merged.loc[mask_max, flip_cols])
+
+    # Fill nan in cols obj and dualobj with inf
+    df_merged[obj_cols] = df_merged[obj_cols].fillna(np.inf)
+    return df_merged.set_index("name")
+
+
+if __name__ == "__main__":
+    if len(argv) <= 3:
+        print("Usage: output dataset-csv csvfiles")
+        exit(0)
+
+    csv_out = argv[1]
+    dataset = argv[2]
+    other_csvs = argv[3:]
+    if path.exists(csv_out):
+        raise Exception(f"CSV already exists: {csv_out}")
+
+    join_tables(dataset, other_csvs).to_csv(csv_out)
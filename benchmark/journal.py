@@ -0,0 +1,240 @@
+# This file is part of camino-benchmark
+# Copyright (C) 2026  Andrea Ghezzi, Wim Van Roy, Sebastian Sager, Moritz Diehl
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""
+Append-only result journal.
+
+A results folder contains
+
+- `journal.jsonl`: one JSON record per finished instance, only appended to,
+- `progress.json`: the small progress header (time, done, estimates, ...).
+
+The runners write the jobs they are solving to `running.json` in their output
+folder, cf. dashboard.py.
+
+Saving a result therefore costs O(1) instead of rewriting the full table. The
+legacy `overview.json` is materialized on demand with `compact`:
+
+    python benchmark/journal.py <results_folder>
+"""
+
+import json
+import os
+import socket
+from sys import argv
+from time import time
+from camino.utils.data import write_json, read_json
+
+JOURNAL_NAME = "journal.jsonl"
+PROGRESS_NAME = "progress.json"
+OVERVIEW_NAME = "overview.json"
+RUNNING_NAME = "running.json"
+
+
+def append_record(journal_file, record):
+    """Append a single record to the journal."""
+    with open(journal_file, "a") as f:
+        f.write(json.dumps(record) + "\n")
+        f.flush()
+
+
+def read_records(journal_file):
+    """Read all complete records of a journal."""
+    records = []
+    if not os.path.exists(journal_file):
+        return records
+    with open(journal_file, "r") as f:
+        for line in f:
+            try:
+                records.append(json.loads(line))
+            except json.JSONDecodeError:
+                # Last line of a run that was killed while writing
+                pass
+    return records
+
+
+class JournalReader:
+    """Read the records appended to a journal since the last read."""
+
+    def __init__(self, journal_file):
+        self.journal_file = journal_file
+        self.offset = 0
+        self.partial = ""
+
+    def read(self):
+        """New complete records, the last line is incomplete while it is written."""
+        if not os.path.exists(self.journal_file):
+            return []
+        with open(self.journal_file, "r") as f:
+            f.seek(self.offset)
+            text = self.partial + f.read()
+            self.offset = f.tell()
+        lines = text.split("\n")
+        self.partial = lines.pop()
+        records = []
+        for line in lines:
+            try:
+                records.append(json.loads(line))
+            except json.JSONDecodeError:
+                pass
+        return records
+
+
+def instance_name(problem_path):
+    """Name of an instance from its path, e.g. /a/b/batch.mod -> batch."""
+    return os.path.basename(problem_path).split(".")[0]
+
+
+def progress_header(time_now, done, total, algorithm, columns):
+    """Progress header in the format of overview.json, without the data."""
+    total_time = time_now / max(done, 1) * total
+    return {
+        "time": time_now,
+        "total": total,
+        "done": done,
+        "progress": done / total,
+        "time_remaining_est": total_time - time_now,
+        "time_total_est": total_time,
+        "algorithm": algorithm,
+        "columns": columns,
+    }
+
+
+class Journal:
+    """Journal of the results of one solver in one results folder."""
+
+    def __init__(self, folder, algorithm, total, columns):
+        self.folder = folder
+        self.journal_file = os.path.join(folder, JOURNAL_NAME)
+        self.progress_file = os.path.join(folder, PROGRESS_NAME)
+        self.algorithm = algorithm
+        self.total = total
+        self.columns = columns
+        self.start = time()
+        os.makedirs(folder, exist_ok=True)
+        overview_file = os.path.join(folder, OVERVIEW_NAME)
+        if os.path.exists(self.progress_file):
+            self.start -= read_json(self.progress_file)["time"]
+        elif os.path.exists(overview_file) and not os.path.exists(self.journal_file):
+            # Continue a run started before the journal existed
+            data = read_json(overview_file)
+            self.start -= data["time"]
+            for row in data["data"][1:]:
+                append_record(self.journal_file, dict(zip(data["data"][0], row)))
+        self.records = {}
+        for record in read_records(self.journal_file):
+            self.records[record["id"]] = record
+
+    def add(self, record):
+        """Append a record and update the progress header."""
+        append_record(self.journal_file, record)
+        self.records[record["id"]] = record
+        write_json(
+            progress_header(
+                time() - self.start,
+                len(self.records),
+                self.total,
+                self.algorithm,
+                self.columns,
+            ),
+            self.progress_file,
+        )
+
+    def compact(self):
+        """Write overview.json."""
+        return compact(self.folder)
+
+
+class RunningJobs:
+    """
+    Jobs being solved by a runner, kept in `running.json` of its output folder.
+
+    :param folder: output folder of the runner
+    :param workers: number of concurrent solves of the runner
+    """
+
+    def __init__(self, folder, workers):
+        self.filename = os.path.join(folder, RUNNING_NAME)
+        self.workers = workers
+        self.jobs = {}
+        os.makedirs(folder, exist_ok=True)
+
+    def start(self, folder, name):
+        """A job writing to the results folder `folder` started."""
+        self.jobs[os.path.abspath(folder), name] = time()
+        self._write()
+
+    def stop(self, folder, name):
+        """A job finished."""
+        self.jobs.pop((os.path.abspath(folder), name), None)
+        self._write()
+
+    def close(self):
+        """The runner finished."""
+        if os.path.exists(self.filename):
+            os.remove(self.filename)
+
+    def _write(self):
+        data = {
+            "host": socket.gethostname(),
+            "pid": os.getpid(),
+            "workers": self.workers,
+            "jobs": [
+                {"folder": folder, "name": name, "start": start}
+                for (folder, name), start in self.jobs.items()
+            ],
+        }
+        tmp = f"{self.filename}.{os.getpid()}.tmp"
+        write_json(data, tmp)
+        os.replace(tmp, self.filename)
+
+
+def load_overview(source):
+    """
+    Load results in the overview.json format.
+
+    :param source: an overview.json, a journal.jsonl or a results folder
+    :return: dict with the progress fields and the table in "data"
+    """
+    if os.path.isdir(source):
+        folder = source
+    elif source.endswith(".jsonl"):
+        folder = os.path.dirname(source)
+    else:
+        return read_json(source)
+
+    journal_file = os.path.join(folder, JOURNAL_NAME)
+    progress_file = os.path.join(folder, PROGRESS_NAME)
+    if not os.path.exists(journal_file):
+        return read_json(os.path.join(folder, OVERVIEW_NAME))
+    records = {}
+    for record in read_records(journal_file):
+        records[record["id"]] = record
+    if os.path.exists(progress_file):
+        overview = read_json(progress_file)
+        columns = overview.pop("columns")
+    else:
+        columns = list(next(iter(records.values())).keys()) if records else []
+        overview = {}
+    overview["data"] = [columns] + [
+        [records[i][col] for col in columns if col in records[i]]
+        for i in sorted(records)
+    ]
+    return overview
+
+
+def compact(folder):
+    """Materialize the legacy overview.json of a results folder."""
+    target = os.path.join(folder, OVERVIEW_NAME)
+    write_json(load_overview(folder), target)
+    return target
+
+
+if __name__ == "__main__":
+    if len(argv) < 2:
+        print("Usage: python journal.py <results_folder> [<results_folder> ...]")
+        exit(1)
+
+    for folder in argv[1:]:
+        print(f"Written {compact(folder)}")
@@ -0,0 +1,310 @@
+# This file is part of camino-benchmark
+# Copyright (C) 2026  Andrea Ghezzi, Wim Van Roy, Sebastian Sager, Moritz Diehl
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""
+Performance profiles of a running benchmark.
+
+The results folders `<key>_<solver>` of the solvers of an analysis are
+tailed: only the records appended to `journal.jsonl` since the last refresh
+are read (the whole `overview.json` or the new SHOT .osrl files for folders
+without journal). The rows of the new records are written to the
+problems x solvers matrices of the times and objectives, and only the
+performance ratios of these rows are updated, the whole row only where the
+new value changes the best one of the problem. Every `--interval` seconds the
+counts of success, fail, time-out and pending are printed and the profiles
+are written to `live_<key>_calc_time_<solve_time>.png` and
+`live_<key>_obj.png` in the results folder:
+
+    python benchmark/live_profile.py <results_dir> <key> <solve_time> <analysis> [--interval 10]
+
+The profiles are computed on the problems finished by all solvers, cleaned
+as in create_plot.py. The objectives of S-B-MIQP and Bonmin are not flipped
+for maximization problems before join_csv_using_pandas.py, here this is done
+with the `objsense` of the instance set.
+"""
+
+import os
+from argparse import ArgumentParser
+from time import sleep, time
+import numpy as np
+import pandas as pd
+from matplotlib import pyplot as plt
+from create_plot import (
+    latexify,
+    performance_ratios,
+    plot_performance_profile,
+    profile_steps,
+    select_solvers,
+    time_columns,
+)
+from camino.utils.data import read_json
+from experiment import analysis_instances, key_sets, load_spec, set_instances
+from join_csv_using_pandas import FLIP_SOLVERS
+from journal import JOURNAL_NAME, OVERVIEW_NAME, JournalReader, instance_name
+from read_shot import get_data
+from result_status import parse_column
+
+INTERVAL = 10
+METRICS = ["obj", "calc_time", "solver_time"]
+
+
+class ResultTail:
+    """New results of a results folder since the last read."""
+
+    def __init__(self, folder):
+        self.folder = folder
+        self.journal_file = os.path.join(folder, JOURNAL_NAME)
+        self.journal = JournalReader(self.journal_file)
+        self.stamp = None
+        self.osrl = set()
+
+    def read(self):
+        """
+        Read the new results.
+
+        :return: DataFrame with the name and METRICS of the new results
+        """
+        if os.path.exists(self.journal_file):
+            records = self.journal.read()
+        elif os.path.exists(os.path.join(self.folder, OVERVIEW_NAME)):
+            records = self._read_overview()
+        else:
+            records = []
+        rows = [self._row(record) for record in records]
+        rows += self._read_osrl(records)
+        return pd.DataFrame(rows, columns=["name"] + METRICS, dtype=object)
+
+    def _read_overview(self):
+        filename = os.path.join(self.folder, OVERVIEW_NAME)
+        stamp = os.stat(filename).st_mtime_ns
+        if stamp == self.stamp:
+            return []
+        self.stamp = stamp
+        data = read_json(filename)["data"]
+        return [dict(zip(data[0], row)) for row in data[1:]]
+
+    def _row(self, record):
+        name = instance_name(record["path"])
+        if "status" in record:
+            # SHOT, the results are in the osrl file
+            self.osrl.add(name)
+            osrl_file = os.path.join(self.folder, name + ".osrl")
+            _, obj, _, calc_time, *_ = get_data(name, osrl_file)
+            if record["status"] != "OK":
+                obj = record["status"]
+            return [name, obj, calc_time, None]
+        return [name] + [record.get(metric) for metric in METRICS]
+
+    def _read_osrl(self, records):
+        """Results of SHOT folders without journal."""
+        if len(records) > 0 or os.path.exists(self.journal_file):
+            return []
+        rows = []
+        for entry in os.scandir(self.folder):
+            name = entry.name[:-5]
+            if entry.name.endswith(".osrl") and name not in self.osrl:
+                self.osrl.add(name)
+                _, obj, _, calc_time, *_ = get_data(name, entry.path)
+                rows.append([name, obj, calc_time, None])
+        return rows
+
+
+class LiveProfile:
+    """
+    Performance ratios of a problems x solvers matrix that is filled row by row.
+
+    :param names: problems
+    :param solvers: solvers, e.g. cvx_bonmin
+    :param time_limit: times above are clipped, cf. create_plot.clean_data
+    """
+
+    def __init__(self, names, solvers, time_limit):
+        self.names = list(names)
+        self.rows = {name: i for i, name in enumerate(self.names)}
+        self.solvers = list(solvers)
+        self.time_limit = time_limit
+        shape = (len(self.names), len(self.solvers))
+        self.done = np.zeros(shape, dtype=bool)
+        self.values = {"time": np.full(shape, np.inf), "obj": np.full(shape, np.inf)}
+        self.ratios = {"time": np.full(shape, np.inf), "obj": np.full(shape, np.inf)}
+        self.best = {"time": np.full(len(self.names), np.inf)}
+        self.best["obj"] = self.best["time"].copy()
+
+    def update(self, solver, names, obj, calc_time):
+        """
+        Add the results of a solver, cleaned as in create_plot.clean_data.
+
+        :param names: problems of the results, others are ignored
+        :param obj: objectives, inf for failures
+        :param calc_time: times, inf for failures
+        """
+        j = self.solvers.index(solver)
+        keep = np.array([name in self.rows for name in names], dtype=bool)
+        rows = np.array([self.rows[n] for n in np.asarray(names)[keep]], dtype=int)
+        obj, calc_time = np.asarray(obj)[keep], np.asarray(calc_time)[keep].copy()
+        if "shot" in solver:
+            calc_time[obj == np.inf] = np.inf
+        if "gurobi" in solver or "scip" in solver:
+            failed = (np.abs(obj) > 1e10) | (obj == 0)
+            calc_time[failed] = np.inf
+            obj = np.where(failed, np.inf, obj)
+        calc_time = np.where(
+            np.isfinite(calc_time), np.minimum(calc_time, self.time_limit), calc_time
+        )
+        self.done[rows, j] = True
+        self._set("time", rows, j, calc_time)
+        self._set("obj", rows, j, obj)
+
+    def _set(self, metric, rows, j, new):
+        values, ratios, best = (
+            self.values[metric],
+            self.ratios[metric],
+            self.best[metric],
+        )
+        old = values[rows, j]
+        values[rows, j] = new
+        # The best value of a row changes if it improves or the old best is replaced
+        changed = (new < best[rows]) | ((old == best[rows]) & (new != old))
+        full = np.unique(rows[changed])
+        if len(full) > 0:
+            finite = np.where(np.isfinite(values[full]), values[full], np.inf)
+            best[full] = finite.min(axis=1)
+            ratios[full] = performance_ratios(values[full])
+        cell = rows[~changed]
+        if len(cell) > 0:
+            b, v = best[cell], values[cell, j]
+            with np.errstate(invalid="ignore", divide="ignore"):
+                r = np.where(b <= 0, v - b + 1, v / b)
+            ratios[cell, j] = np.where(np.isfinite(v) & np.isfinite(b), r, np.inf)
+
+    def finished(self):
+        """Problems finished by all solvers."""
+        return self.done.all(axis=1)
+
+    def curves(self, metric, tau_max):
+        """Profiles of the problems finished by all solvers."""
+        ratios = self.ratios[metric][self.finished()]
+        if len(ratios) == 0:
+            return [(np.array([1.0, tau_max]), np.zeros(2)) for _ in self.solvers]
+        return [profile_steps(ratios[:, j], tau_max) for j in range(len(self.solvers))]
+
+    def summary(self):
+        """Counts of success, fail, time-out and pending of every solver."""
+        time = self.values["time"]
+        failed = self.done & (self.values["obj"] == np.inf)
+        timeout = self.done & ~failed & (time >= self.time_limit)
+        return pd.DataFrame(
+            {
+                "success": (self.done & ~failed & ~timeout).sum(axis=0),
+                "fail": failed.sum(axis=0),
+                "time-out": timeout.sum(axis=0),
+                "pending": (~self.done).sum(axis=0),
+            },
+            index=self.solvers,
+        )
+
+
+def instance_sets(spec, analysis, key):
+    """Problems of an analysis and the objective sense of every problem."""
+    names, maximize = [], set()
+    for set_name in key_sets(spec, key):
+        if set_name not in spec["experiments"][analysis]["sets"]:
+            continue
+        definition = spec["instance_sets"][set_name]
+        data = pd.read_csv(os.path.join(spec["directory"], definition["file"]))
+        maximize |= set(data.loc[data["objsense"] == "max", "name"])
+        names += [n for n in set_instances(spec, set_name) if n not in names]
+    instances = analysis_instances(spec, analysis)
+    if instances is not None:
+        names = [name for name in names if name in set(instances)]
+    return names, maximize
+
+
+def skipped(spec, names, solver, key):
+    """Problems of the analysis the solver does not run, counted as failed."""
+    definition = spec["solvers"].get(solver[len(key) + 1 :], {})
+    return [name for name in names if name in set(definition.get("exclude", []))]
+
+
+if __name__ == "__main__":
+    parser = ArgumentParser(
+        description="Live performance profiles of a running benchmark"
+    )
+    parser.add_argument("results_dir", help="folder with a results folder per solver")
+    parser.add_argument("key", choices=["cvx", "noncvx"])
+    parser.add_argument("solve_time", choices=["solvetime", "totaltime"])
+    parser.add_argument("analysis", help="experiment of experiments.json")
+    parser.add_argument(
+        "--interval", type=float, default=INTERVAL, help="seconds between refreshes"
+    )
+    parser.add_argument("--once", action="store_true", help="refresh only once")
+    args = parser.parse_args()
+
+    spec = load_spec()
+    solvers, solver_names, TAU_MAX, YLIM_LIST = select_solvers(
+        args.key, args.analysis, spec
+    )
+    columns = [col.split(".")[1] for col in time_columns(solvers, args.solve_time)]
+    names, maximize = instance_sets(spec, args.analysis, args.key)
+    live = LiveProfile(names, solvers, spec["time_limit"])
+    for solver in solvers:
+        excluded = skipped(spec, names, solver, args.key)
+        live.update(
+            solver,
+            excluded,
+            np.full(len(excluded), np.inf),
+            np.full(len(excluded), np.inf),
+        )
+    tails = {s: ResultTail(os.path.join(args.results_dir, s)) for s in solvers}
+
+    latexify(6, 4)
+    pd.set_option("display.width", 200)
+    while True:
+        start = time()
+        new = 0
+        for j, solver in enumerate(solvers):
+            table = tails[solver].read()
+            if len(table) == 0:
+                continue
+            new += len(table)
+            obj, _ = parse_column(table["obj"])
+            calc_time, _ = parse_column(table[columns[j]])
+            obj = obj.to_numpy(copy=True)
+            if any(flip in solver for flip in FLIP_SOLVERS):
+                flip = table["name"].isin(maximize).to_numpy()
+                obj[flip] = np.where(np.isfinite(obj[flip]), -obj[flip], obj[flip])
+            live.update(solver, table["name"].to_numpy(), obj, calc_time.to_numpy())
+
+        if new > 0 or args.once:
+            finished = live.finished().sum()
+            print(
+                f"=== {new} new results, {finished}/{len(names)} problems finished by all solvers"
+            )
+            print(live.summary().to_string())
+            for metric, title, suffix, tau_max, ylim in [
+                (
+                    "time",
+                    "Wall time",
+                    f"calc_time_{args.solve_time}",
+                    TAU_MAX[0],
+                    YLIM_LIST[0],
+                ),
+                ("obj", "Objective", "obj", TAU_MAX[1], YLIM_LIST[1]),
+            ]:
+                filename = os.path.join(
+                    args.results_dir, f"live_{args.key}_{suffix}.png"
+                )
+                fig, _ = plot_performance_profile(
+                    live.curves(metric, tau_max),
+                    filename,
+                    ylim=ylim,
+                    tau_max=tau_max,
+                    title=f"{title}, {finished} problems",
+                    legend_labels=solver_names,
+                )
+                plt.close(fig)
+            print(f"Refreshed in {time() - start:.2f}s")
+        if args.once or live.done.all():
+            break
+        sleep(max(args.interval - (time() - start), 0))
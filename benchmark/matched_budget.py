@@ -0,0 +1,141 @@
+# This file is part of camino-benchmark
+# Copyright (C) 2026  Andrea Ghezzi, Wim Van Roy, Sebastian Sager, Moritz Diehl
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""
+Time limits matched to the times of a reference solver.
+
+In the matched-budget mode of `using_amplpy.py` every instance gets the
+calc time of the reference solver (e.g. S-B-MIQP on the nonconvex set) as its
+time limit. The reference is read from
+
+- a results folder, overview.json or journal.jsonl of the reference solver,
+  also while the reference is still running: an instance is scheduled as
+  soon as its reference time is in the journal,
+- a results store, cf. results_store.py, with `--match-solver`,
+- a json file of `<solver>.calc_time` columns, e.g. the snapshot
+  `wall_time_noncvx_sbmiqp.json` used in the paper.
+
+Failed reference solves get the time limit of the spec. The budget of
+every instance is kept in the `time_limit` column of the results:
+
+    python benchmark/using_amplpy.py noncvx scip <path_to_mod_files> <results> --match <results>/noncvx_sbmiqp
+"""
+
+import json
+import os
+import numpy as np
+from journal import JOURNAL_NAME, PROGRESS_NAME, OVERVIEW_NAME, instance_name
+from result_status import to_numbers
+from results_store import load, read_source
+
+# Seconds between two reads of a running reference
+POLL_INTERVAL = 10
+
+
+def is_store(source):
+    """True for a results store, a folder of Parquet files."""
+    return os.path.isdir(source) and any(
+        f.endswith(".parquet") for f in os.listdir(source)
+    )
+
+
+def reference_folder(source):
+    """Results folder of a running reference, None for static sources."""
+    if is_store(source):
+        return None
+    if source.endswith(".jsonl"):
+        return os.path.dirname(source)
+    if source.endswith(".json"):
+        return None
+    # A folder, possibly of a reference that has not started yet
+    return source
+
+
+def budgets(names, obj, calc_time, time_limit):
+    """Time limit per instance, the time limit of the spec for failed solves."""
+    obj, calc_time = to_numbers(obj), to_numbers(calc_time)
+    failed = ~np.isfinite(obj) | ~np.isfinite(calc_time) | (calc_time < 0)
+    values = np.where(failed, time_limit, np.minimum(calc_time, time_limit))
+    return dict(zip(names, values.tolist()))
+
+
+class ReferenceTimes:
+    """
+    Calc times of a reference solver, re-read while the reference is running.
+
+    :param source: results folder, overview.json, journal.jsonl, store or json
+    :param solver: column of the reference in a store or json, e.g. noncvx_sbmiqp
+    :param time_limit: budget of the instances whose reference failed
+    """
+
+    def __init__(self, source, solver, time_limit):
+        self.source = source
+        self.solver = solver
+        self.time_limit = float(time_limit)
+        self.folder = reference_folder(source)
+        self.times = {}
+        self.complete = False
+        self._stamp = None
+        self.poll()
+
+    def _read_static(self):
+        if is_store(self.source):
+            data = load(self.source, ["obj", "calc_time"], solvers=[self.solver])
+            return budgets(
+                data["name"], data["obj"], data["calc_time"], self.time_limit
+            )
+        with open(self.source, "r") as f:
+            data = json.load(f)
+        if f"{self.solver}.calc_time" in data:
+            times = data[f"{self.solver}.calc_time"]
+            return {name: min(float(t), self.time_limit) for name, t in times.items()}
+        return self._read_results(self.source)
+
+    def _read_results(self, source):
+        table = read_source(source)
+        names = table["path"].map(instance_name)
+        return budgets(names, table["obj"], table["calc_time"], self.time_limit)
+
+    def poll(self):
+        """Read new reference times, True if there are new ones."""
+        if self.complete:
+            return False
+        if self.folder is None:
+            self.times = self._read_static()
+            self.complete = True
+            return True
+
+        journal_file = os.path.join(self.folder, JOURNAL_NAME)
+        progress_file = os.path.join(self.folder, PROGRESS_NAME)
+        if not os.path.exists(journal_file):
+            if os.path.exists(os.path.join(self.folder, OVERVIEW_NAME)):
+                # Finished before the journal existed
+                self.times = self._read_results(self.folder)
+                self.complete = True
+                return True
+            return False
+        # The progress is written after the journal, both are checked
+        stamp = [os.stat(journal_file).st_mtime_ns]
+        if os.path.exists(progress_file):
+            stamp.append(os.stat(progress_file).st_mtime_ns)
+        if stamp == self._stamp:
+            return False
+        self._stamp = stamp
+        self.times = self._read_results(self.folder)
+        if os.path.exists(progress_file):
+            with open(progress_file, "r") as f:
+                progress = json.load(f)
+            self.complete = progress["done"] >= progress["total"]
+        return True
+
+    def budget(self, name):
+        """
+        Time limit of an instance.
+
+        :return: the matched time limit, the time limit of the spec for
+            instances missing in a complete reference, None while waiting
+        """
+        if name in self.times:
+            return self.times[name]
+        return self.time_limit if self.complete else None
@@ -0,0 +1,223 @@
+# This file is part of camino-benchmark
+# Copyright (C) 2026  Andrea Ghezzi, Wim Van Roy, Sebastian Sager, Moritz Diehl
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""
+Merge the shards of a benchmark run into the standard results layout.
+
+With `--shard i/N` the parallel runner writes only its part of the matrix to
+`<path_to_output>/shard_<i>_of_<N>`, together with `shard.json`, the cells
+of the shard and the fingerprint of the partition. The shard folders are
+disjoint, so they can be written to a shared filesystem or copied back with
+rsync. The journals of all shards are then merged into
+`<path_to_output>/<group>`, the stats pickles are copied along:
+
+    python benchmark/merge_shards.py <path_to_save_results> [<shard_folder> ...]
+
+A record is a duplicate if the same cell is already merged with the same
+result (e.g. a shard run twice, or merged again), it is then skipped. A
+record is a conflict if it belongs to another instance than the cell of the
+partition, or if the same cell was solved with another result. Nothing is
+written if there are conflicts, unless `--resolve owner` keeps the result of
+the shard the cell is assigned to. The merge can be repeated while shards are
+still running; the cells missing in all shards are listed.
+"""
+
+import glob
+import os
+from argparse import ArgumentParser
+from collections import Counter, defaultdict
+from shutil import copyfile
+from time import time
+from camino.utils.data import read_json
+from journal import (
+    JOURNAL_NAME,
+    OVERVIEW_NAME,
+    PROGRESS_NAME,
+    Journal,
+    instance_name,
+    load_overview,
+    read_records,
+)
+from parallel_runner import HEADER, SHARD_MANIFEST, export_sweep_overviews
+
+# Files of a cell copied with its record
+CELL_FILES = ["stats_{}.pkl", "profile_{}.folded"]
+
+
+def find_shards(path_to_output):
+    """Shard folders in the output folder."""
+    return sorted(glob.glob(os.path.join(path_to_output, "shard_*_of_*")))
+
+
+def read_manifests(folders):
+    """
+    Read the manifests of the shards and check they are of the same partition.
+
+    :return: dict of shard folder to manifest
+    """
+    manifests = {}
+    for folder in folders:
+        filename = os.path.join(folder, SHARD_MANIFEST)
+        if not os.path.exists(filename):
+            raise ValueError(f"{folder} is not a shard, {SHARD_MANIFEST} is missing")
+        manifests[folder] = read_json(filename)
+    fingerprints = {m["fingerprint"] for m in manifests.values()}
+    if len(fingerprints) > 1:
+        # E.g. other history files or instances on one of the machines
+        raise ValueError(
+            "The shards are of different partitions: "
+            + ", ".join(f"{f} {m['fingerprint'][:12]}" for f, m in manifests.items())
+        )
+    return manifests
+
+
+def shard_records(folder):
+    """Records of a results folder, from the journal or overview.json."""
+    if os.path.exists(os.path.join(folder, JOURNAL_NAME)):
+        return read_records(os.path.join(folder, JOURNAL_NAME))
+    if os.path.exists(os.path.join(folder, OVERVIEW_NAME)):
+        data = load_overview(folder)["data"]
+        return [dict(zip(data[0], row)) for row in data[1:]]
+    return []
+
+
+def same_result(a, b):
+    """True if two records of a cell have the same result, the paths may differ."""
+    keys = (set(a) | set(b)) - {"path"}
+    return all(a.get(key) == b.get(key) for key in keys)
+
+
+def merge_group(group, owners, sources, existing, resolve):
+    """
+    Merge the records of a group.
+
+    :param owners: dict of idx to (instance, owning shard) of the partition
+    :param sources: list of (shard folder, shard, records) of the group
+    :param existing: dict of idx to record already in the merged folder
+    :param resolve: None to only report conflicts, "owner" to keep the
+        record of the owning shard
+    :return: (dict of idx to (record, shard folder) to add, counts, conflicts)
+    """
+    merged = {idx: (record, None) for idx, record in existing.items()}
+    new = {}
+    counts = Counter()
+    conflicts = []
+    for folder, shard, records in sources:
+        for record in records:
+            idx = record["id"]
+            name = instance_name(record["path"])
+            if idx not in owners or owners[idx][0] != name:
+                conflicts.append(
+                    f"{group} {idx}: {name} of {folder} is not in the partition"
+                )
+                continue
+            if idx not in merged:
+                merged[idx] = new[idx] = (record, folder)
+                counts["merged"] += 1
+            elif same_result(merged[idx][0], record):
+                counts["duplicates"] += 1
+            else:
+                counts["conflicts"] += 1
+                if resolve == "owner":
+                    if shard == owners[idx][1]:
+                        merged[idx] = new[idx] = (record, folder)
+                else:
+                    conflicts.append(
+                        f"{group} {idx}: {name} of {folder} differs from "
+                        f"{merged[idx][1] or 'the merged result'}"
+                    )
+    counts["missing"] = len(set(owners) - set(merged))
+    return new, counts, conflicts
+
+
+if __name__ == "__main__":
+    parser = ArgumentParser(description="Merge the shards of a benchmark run")
+    parser.add_argument("path_to_output", help="folder of the merged results")
+    parser.add_argument(
+        "shards",
+        nargs="*",
+        help="shard folders (default: <path_to_output>/shard_*_of_*)",
+    )
+    parser.add_argument(
+        "--resolve",
+        choices=["owner"],
+        default=None,
+        help="keep the result of the shard a conflicting cell is assigned to",
+    )
+    args = parser.parse_args()
+
+    folders = args.shards or find_shards(args.path_to_output)
+    if len(folders) == 0:
+        print(f"No shards in {args.path_to_output}")
+        exit(1)
+    manifests = read_manifests(folders)
+    first = next(iter(manifests.values()))
+    shards = first["shards"]
+    found = Counter(m["shard"] for m in manifests.values())
+    for shard in range(1, shards + 1):
+        if found[shard] == 0:
+            print(f"Warning: Shard {shard}/{shards} is missing")
+        elif found[shard] > 1:
+            print(f"Warning: Shard {shard}/{shards} is given {found[shard]} times")
+
+    owners = defaultdict(dict)
+    algorithms, totals = {}, Counter()
+    for manifest in manifests.values():
+        for group, idx, name in manifest["cells"]:
+            owners[group][idx] = (name, manifest["shard"])
+        for group, definition in manifest["groups"].items():
+            algorithms[group] = definition["algorithm"]
+    for group in owners:
+        totals[group] = len(owners[group])
+
+    plans, conflicts = {}, []
+    total_counts = Counter()
+    for group in sorted(owners):
+        target = os.path.join(args.path_to_output, group)
+        existing = {r["id"]: r for r in shard_records(target)}
+        sources = [
+            (folder, m["shard"], shard_records(os.path.join(folder, group)))
+            for folder, m in manifests.items()
+        ]
+        new, counts, group_conflicts = merge_group(
+            group, owners[group], sources, existing, args.resolve
+        )
+        plans[group] = new
+        conflicts += group_conflicts
+        total_counts += counts
+        print(
+            f"{group}: {counts['merged']} merged, {counts['duplicates']} duplicates, "
+            f"{counts['conflicts']} conflicts, {counts['missing']} missing"
+        )
+    if len(conflicts) > 0:
+        for conflict in conflicts:
+            print(f"CONFLICT {conflict}")
+        print(f"{len(conflicts)} conflicts, nothing written (cf. --resolve owner)")
+        exit(1)
+
+    for group, new in plans.items():
+        target = os.path.join(args.path_to_output, group)
+        journal = Journal(target, algorithms[group], totals[group], HEADER)
+        # The run time is the one of the slowest shard
+        times = [
+            read_json(os.path.join(folder, group, PROGRESS_NAME))["time"]
+            for folder in manifests
+            if os.path.exists(os.path.join(folder, group, PROGRESS_NAME))
+        ]
+        if len(times) > 0:
+            journal.start = time() - max(times)
+        for idx, (record, folder) in sorted(new.items()):
+            for pattern in CELL_FILES:
+                source = os.path.join(folder, group, pattern.format(idx))
+                if os.path.exists(source):
+                    copyfile(source, os.path.join(target, pattern.format(idx)))
+            journal.add(record)
+        journal.compact()
+    for mode in first["modes"]:
+        if mode in ("alpha", "rho"):
+            export_sweep_overviews(first["spec"], mode, args.path_to_output)
+    print(
+        f"Merged {total_counts['merged']} results of {len(manifests)} shards into "
+        f"{args.path_to_output}, {total_counts['missing']} missing"
+    )
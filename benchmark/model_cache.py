@@ -0,0 +1,156 @@
+# This file is part of camino-benchmark
+# Copyright (C) 2026  Andrea Ghezzi, Wim Van Roy, Sebastian Sager, Moritz Diehl
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""
+Cache of the CasADi problems loaded from .nl files.
+
+CAMINO parses every .nl file and builds the CasADi problem again for every
+solver and setting, e.g. five times for the alpha sweep. Here the output of
+the nl loader of CAMINO (problem, data, settings) is pickled once per
+instance, keyed on the content of the .nl file and the versions of CasADi
+and CAMINO, and the parallel runner loads the pickle instead. The models of
+the instance sets of the spec are built beforehand with
+
+    python benchmark/model_cache.py <path_to_dir_with_minlplib_nl_files> [--sets cvx noncvx]
+
+otherwise they are built by the first solve of an instance. The cache lives
+in the `models` folder of the result cache, cf. result_cache.py; set
+CAMINO_BENCHMARK_MODEL_CACHE to another folder, or to "off" to disable it.
+"""
+
+import hashlib
+import os
+import pickle
+from argparse import ArgumentParser
+from multiprocessing import Pool
+from time import time
+from experiment import load_spec, set_instances
+from result_cache import CACHE_ENV, DEFAULT_CACHE_DIR, file_hash, package_version
+
+MODEL_CACHE_ENV = "CAMINO_BENCHMARK_MODEL_CACHE"
+
+
+def model_key(nl_file, version):
+    """Key of the model of a .nl file, None if the file does not exist."""
+    if not os.path.exists(nl_file):
+        return None
+    content = f"{file_hash(nl_file)} {version}"
+    return hashlib.sha256(content.encode()).hexdigest()
+
+
+class ModelCache:
+    """Pickled output of the nl loader of CAMINO, stored by key."""
+
+    def __init__(self, folder):
+        self.folder = folder
+        self.version = package_version("casadi", "caminopy")
+
+    def _path(self, key):
+        return os.path.join(self.folder, key[:2], key + ".pkl")
+
+    def get(self, nl_file):
+        """(problem, data, settings) of a .nl file, None on a miss."""
+        import casadi as ca
+
+        key = model_key(nl_file, self.version)
+        if key is None or not os.path.exists(self._path(key)):
+            return None
+        try:
+            with open(self._path(key), "rb") as f, ca.global_unpickle_context():
+                return pickle.load(f)
+        except Exception as e:
+            print(f"Warning: Could not load the cached model of {nl_file}: {e}")
+            return None
+
+    def put(self, nl_file, model):
+        """Store the (problem, data, settings) of a .nl file."""
+        import casadi as ca
+
+        key = model_key(nl_file, self.version)
+        if key is None:
+            return
+        target = self._path(key)
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        # Concurrent solves of the same instance may write the same model
+        tmp = f"{target}.{os.getpid()}.tmp"
+        with open(tmp, "wb") as f, ca.global_pickle_context():
+            pickle.dump(model, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, target)
+
+
+def default_model_cache():
+    """Model cache configured by the environment, None when disabled."""
+    folder = os.environ.get(MODEL_CACHE_ENV)
+    if folder is None:
+        folder = os.environ.get(CACHE_ENV, DEFAULT_CACHE_DIR)
+        if folder.lower() == "off":
+            return None
+        folder = os.path.join(folder, "models")
+    if folder.lower() == "off":
+        return None
+    return ModelCache(folder)
+
+
+def cached_loader(load_problem, cache):
+    """Wrap the nl loader of CAMINO to read and fill the model cache."""
+    if cache is None:
+        return load_problem
+
+    def load(nl_file, *args):
+        if len(args) > 0:
+            # Compiled models are not pickled
+            return load_problem(nl_file, *args)
+        model = cache.get(nl_file)
+        if model is None:
+            model = load_problem(nl_file)
+            cache.put(nl_file, model)
+        return model
+
+    return load
+
+
+def build_model(nl_file):
+    """Build the model of a .nl file, executed in a worker process."""
+    from camino.problems.problem_collection import PROBLEMS
+
+    cache = default_model_cache()
+    t = time()
+    try:
+        if cache.get(nl_file) is not None:
+            return nl_file, "CACHED", time() - t
+        cache.put(nl_file, PROBLEMS["nl_file"](nl_file))
+        return nl_file, "BUILT", time() - t
+    except Exception as e:
+        return nl_file, f"FAILED ({e})", time() - t
+
+
+if __name__ == "__main__":
+    parser = ArgumentParser(description="Build the model cache of the nl files")
+    parser.add_argument("path_to_file", help="folder with the nl instances")
+    parser.add_argument(
+        "--sets",
+        nargs="+",
+        default=None,
+        help="instance sets of the spec (default: all)",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=os.cpu_count(),
+        help="number of models built at the same time (default: number of cores)",
+    )
+    args = parser.parse_args()
+
+    if default_model_cache() is None:
+        print(f"The model cache is disabled, cf. {MODEL_CACHE_ENV}")
+        exit(1)
+    spec = load_spec()
+    names = []
+    for set_name in args.sets or spec["instance_sets"]:
+        names += [n for n in set_instances(spec, set_name) if n not in names]
+    nl_files = [os.path.join(args.path_to_file, name + ".nl") for name in names]
+
+    with Pool(args.workers) as pool:
+        for nl_file, status, duration in pool.imap_unordered(build_model, nl_files):
+            print(f"{status} {os.path.basename(nl_file)}, took {duration:.2f}s")
@@ -0,0 +1,579 @@
+# This file is part of camino-benchmark
+# Copyright (C) 2026  Andrea Ghezzi, Wim Van Roy, Sebastian Sager, Moritz Diehl
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""
+Run the CAMINO benchmark matrix on a pool of worker processes.
+
+The (solver x instance x config) matrix of one or more modes is expanded into a flat job
+list and every job is solved in its own single-threaded process. The results
+of each solver/config are written in the same layout as `camino batch`, i.e.
+`<group>/overview.json` and `<group>/stats_<i>.pkl`, so that
+`combine_files.sh` can be used on the output folder unchanged. While running,
+results are appended to `<group>/journal.jsonl`, cf. journal.py.
+
+The matrix is read from the experiment spec, cf. experiment.py; a cell shared
+by several solvers/configs is solved once and copied to each of their folders.
+Repeated solves (`--repetitions k`) are run in rounds and written to
+`<group>/rep<r>`, cf. repetitions.py. With `--profile` every solve is run
+under a sampling profiler, cf. sampling_profiler.py. The nl loader of CAMINO
+turns off `WITH_LOG_DATA`, so the stats pickles only hold the final snapshot;
+with `--trace` a snapshot is saved per iteration, as needed by stats_trace.py
+and anytime_metrics.py. The CasADi problems of the .nl files are loaded from
+the model cache, cf. model_cache.py.
+
+With `--shard i/N` only the i-th of N parts of the matrix is run, written to
+`<path_to_output>/shard_<i>_of_<N>`; the shards are merged with
+merge_shards.py.
+"""
+
+import csv
+import hashlib
+import json
+import os
+import socket
+from argparse import ArgumentParser, ArgumentTypeError
+from collections import Counter, namedtuple
+from multiprocessing import Pipe, Process
+from multiprocessing.connection import wait
+from shutil import copyfile
+from time import time
+from camino.utils.data import write_json
+from experiment import camino_defaults, load_spec, plan, set_key
+from journal import Journal, RunningJobs, instance_name
+from model_cache import cached_loader, default_model_cache
+from result_cache import cache_key, default_cache, package_version
+from sampling_profiler import INTERVAL, SamplingProfiler
+from scheduler import (
+    RuntimeEstimator,
+    order_longest_first,
+    partition_longest_first,
+    predict_makespan,
+)
+
+HEADER = [
+    "id",
+    "path",
+    "obj",
+    "dual_obj",
+    "load_time",
+    "calc_time",
+    "solver_time",
+    "python_time",
+    "iter_nr",
+    "NLP_runs",
+    "FNLP_runs",
+    "MIQP_runs",
+    "MILP_runs",
+]
+
+# Time limit set by camino for nl files
+TIME_LIMIT = 300
+
+# Keep every solve on a single core, cf. "threads=1" in the paper setup
+SINGLE_THREAD_ENV = {
+    "OMP_NUM_THREADS": "1",
+    "OPENBLAS_NUM_THREADS": "1",
+    "MKL_NUM_THREADS": "1",
+}
+
+SHARD_MANIFEST = "shard.json"
+
+# A cell of the job matrix, its result is also copied to the (group, idx) in copies
+Job = namedtuple(
+    "Job",
+    [
+        "group",
+        "idx",
+        "nl_file",
+        "algorithm",
+        "settings",
+        "time_limit",
+        "repetition",
+        "copies",
+    ],
+)
+
+
+def read_instances(filename):
+    """Read the instance names of a subset, e.g. written by select_instances.py."""
+    with open(filename, "r") as f:
+        return {row["name"] for row in csv.DictReader(f)}
+
+
+def expand_jobs(spec, modes, path_to_file, instances=None):
+    """
+    Expand benchmark modes of the experiment spec into the list of jobs to solve.
+
+    Cells with the same solver, settings and instance are solved once, cf.
+    experiment.plan.
+
+    :param modes: names of the experiments, e.g. ["compare", "alpha"]
+    :param instances: names of the instances to keep, None for all
+    """
+    for mode in modes:
+        if mode not in spec["experiments"]:
+            raise ValueError(f"mode must be one of {', '.join(spec['experiments'])}!")
+    jobs = []
+    for cell in plan(spec, modes, "camino", instances, camino_defaults()):
+        solver = spec["solvers"][cell.solver]
+        first, *others = cell.targets
+        jobs.append(
+            Job(
+                first.group,
+                first.idx,
+                os.path.join(path_to_file, cell.name + ".nl"),
+                solver["algorithm"],
+                solver.get("settings", {}),
+                solver.get("time_limit", spec["time_limit"]),
+                cell.repetition,
+                [(t.group, t.idx) for t in others],
+            )
+        )
+    return jobs
+
+
+def trace_jobs(jobs):
+    """
+    Save a stats snapshot per iteration, cf. stats_trace.py.
+
+    The setting is part of the job settings, i.e. of the cache key, such that
+    traced and untraced results are cached separately.
+    """
+    return [
+        job._replace(settings=dict(job.settings, WITH_LOG_DATA=True)) for job in jobs
+    ]
+
+
+def interleave_repetitions(jobs, estimates):
+    """
+    Run the repetitions in rounds, every round solves each job once.
+
+    Repetitions of the same job are spread over the run such that a slow
+    period of the machine does not hit all samples of an instance.
+    """
+    order = sorted(range(len(jobs)), key=lambda i: jobs[i].repetition)
+    return [jobs[i] for i in order], [estimates[i] for i in order]
+
+
+def parse_shard(text):
+    """Parse the `i/N` of --shard, the shards are numbered 1 to N."""
+    try:
+        shard, shards = (int(part) for part in text.split("/"))
+    except ValueError:
+        raise ArgumentTypeError(f"shard must be of the form i/N, got {text}")
+    if not 1 <= shard <= shards:
+        raise ArgumentTypeError(f"shard must be in 1..{shards}, got {shard}")
+    return shard, shards
+
+
+def shard_folder(path_to_output, shard, shards):
+    """Output folder of a shard."""
+    return os.path.join(path_to_output, f"shard_{shard}_of_{shards}")
+
+
+def shard_jobs(jobs, estimates, shards):
+    """
+    Split the jobs into shards of about the same expected time.
+
+    All jobs of an instance are put in the same shard, such that the solvers
+    are compared on the same machine. The partition only depends on the jobs
+    and the estimates, i.e. on the spec and the history files.
+
+    :return: (shard in 1..shards of every job, fingerprint of the partition)
+    """
+    names = sorted({instance_name(job.nl_file) for job in jobs})
+    totals = Counter()
+    for job, estimate in zip(jobs, estimates):
+        totals[instance_name(job.nl_file)] += estimate
+    # Rounded such that all machines see the same order
+    parts = partition_longest_first(
+        names, [round(totals[name], 3) for name in names], shards
+    )
+    part = dict(zip(names, parts))
+    assignment = [part[instance_name(job.nl_file)] + 1 for job in jobs]
+    cells = sorted(
+        [group, idx, instance_name(job.nl_file), s]
+        for job, s in zip(jobs, assignment)
+        for group, idx in [job[:2]] + job.copies
+    )
+    fingerprint = hashlib.sha256(json.dumps(cells).encode()).hexdigest()
+    return assignment, fingerprint
+
+
+def write_shard_manifest(folder, shard, shards, fingerprint, spec, modes, jobs):
+    """Write the cells of a shard to `shard.json`, read by merge_shards.py."""
+    groups = {}
+    cells = []
+    for job in jobs:
+        for group, idx in [job[:2]] + job.copies:
+            groups.setdefault(group, {"algorithm": job.algorithm, "total": 0})
+            groups[group]["total"] += 1
+            cells.append([group, idx, instance_name(job.nl_file)])
+    os.makedirs(folder, exist_ok=True)
+    write_json(
+        {
+            "shard": shard,
+            "shards": shards,
+            "fingerprint": fingerprint,
+            "host": socket.gethostname(),
+            "modes": modes,
+            "spec": spec,
+            "groups": groups,
+            "cells": cells,
+        },
+        os.path.join(folder, SHARD_MANIFEST),
+    )
+
+
+def failed_row(job, reason):
+    """Row of a failed solve, same format as `camino batch`."""
+    return [job.idx, job.nl_file, float("-inf"), "FAILED", reason]
+
+
+def job_key(job, version):
+    """Key of a job in the result cache."""
+    return cache_key(
+        job.nl_file,
+        job.algorithm,
+        version,
+        job.settings,
+        job.time_limit,
+        job.repetition,
+    )
+
+
+def fan_out(job, record, target, journals):
+    """Copy the result of a job to the other results folders using it."""
+    pkl = os.path.join(target, job.group, f"stats_{job.idx}.pkl")
+    for group, idx in job.copies:
+        if idx in journals[group].records:
+            continue
+        if os.path.exists(pkl):
+            copyfile(pkl, os.path.join(target, group, f"stats_{idx}.pkl"))
+        journals[group].add(dict(record, id=idx))
+
+
+def restore_cached(job, cache, key, target):
+    """Restore the result of a job from the cache, None on a miss."""
+    cached = cache.get(key) if cache is not None else None
+    if cached is None:
+        return None
+    pkl = os.path.join(target, job.group, f"stats_{job.idx}.pkl")
+    cache.restore(key, "stats.pkl", pkl)
+    return dict(cached, id=job.idx, path=job.nl_file)
+
+
+def store_cached(job, cache, key, record, target):
+    """
+    Store the result of a job in the cache, crashed jobs are not stored.
+
+    The reason of a failed row is in the load_time column, cf. failed_row.
+    """
+    if cache is None or (
+        record.get("dual_obj") == "FAILED" and record.get("load_time") == "CRASH"
+    ):
+        return
+    pkl = os.path.join(target, job.group, f"stats_{job.idx}.pkl")
+    cache.put(key, record, {"stats.pkl": pkl} if os.path.exists(pkl) else None)
+
+
+def set_time_limit(s, time_limit):
+    """
+    Set the time limit of the settings returned by the nl loader of CAMINO.
+
+    The loader derives the time limits of ipopt, gurobi and bonmin from its
+    own time limit, these are scaled along.
+    """
+    scale = time_limit / s.TIME_LIMIT
+    for options, key in [
+        (s.IPOPT_SETTINGS, "ipopt.max_cpu_time"),
+        (s.MIP_SETTINGS_ALL["gurobi"], "gurobi.TimeLimit"),
+        (s.BONMIN_SETTINGS, "bonmin.time_limit"),
+    ]:
+        if key in options:
+            options[key] = options[key] * scale
+    s.TIME_LIMIT = time_limit
+
+
+def with_settings(load_problem, settings, time_limit=TIME_LIMIT):
+    """Wrap a problem loader to overwrite the returned settings."""
+
+    def load(*args):
+        problem, data, s = load_problem(*args)
+        set_time_limit(s, time_limit)
+        for key, value in settings.items():
+            setattr(s, key, value)
+        s.MIP_SETTINGS_ALL["gurobi"]["gurobi.Threads"] = 1
+        return problem, data, s
+
+    return load
+
+
+def solve_job(job, target, conn, profile_interval=None):
+    """
+    Solve a single job, executed in a worker process.
+
+    :param profile_interval: sample the stack every profile_interval seconds
+        and write <group>/profile_<idx>.folded, cf. sampling_profiler.py
+    """
+    os.environ.update(SINGLE_THREAD_ENV)
+    from camino.runner import runner
+    from camino.problems.problem_collection import PROBLEMS
+
+    load_problem = cached_loader(PROBLEMS["nl_file"], default_model_cache())
+    PROBLEMS["nl_file"] = with_settings(load_problem, job.settings, job.time_limit)
+    profiler = None
+    if profile_interval is not None:
+        profiler = SamplingProfiler(profile_interval)
+        profiler.start()
+    try:
+        stats, data = runner(job.algorithm, "nl_file", None, [job.nl_file])
+        stats["x_star"] = data.x_sol
+        stats["f_star"] = data.obj_val
+        stats.save(os.path.join(target, job.group, f"stats_{job.idx}.pkl"))
+        row = [
+            job.idx,
+            job.nl_file,
+            float(data.obj_val),
+            float(stats.data["lb"]),
+            stats["total_time_loading"],
+            stats["total_wall_time"],
+            stats["solver_wall_time"],
+            stats["python_wall_time"],
+            stats["iter_nr"],
+            stats["NLP.runs"],
+            stats["FC-NLP.runs"],
+            stats["BR-MIQP.runs"],
+            stats["LB-MILP.runs"],
+        ]
+    except Exception as e:
+        print(f"{e}")
+        row = failed_row(job, f"{e}")
+    if profiler is not None:
+        profiler.stop()
+        profiler.write(os.path.join(target, job.group, f"profile_{job.idx}.folded"))
+    conn.send(row)
+    conn.close()
+
+
+def run_jobs(jobs, workers, target, on_result, profile_interval=None, on_start=None):
+    """
+    Run the jobs on at most `workers` concurrent processes.
+
+    Every job is solved in a fresh process such that a crashing solver only
+    loses its own instance, which is then recorded as CRASH.
+
+    :param profile_interval: run the solves under the sampling profiler
+    :param on_start: called with every job when its process is started
+    """
+    pending = list(jobs)
+    running = {}
+    while pending or running:
+        while pending and len(running) < workers:
+            job = pending.pop(0)
+            recv_conn, send_conn = Pipe(duplex=False)
+            process = Process(
+                target=solve_job, args=(job, target, send_conn, profile_interval)
+            )
+            process.start()
+            send_conn.close()
+            running[process.sentinel] = (process, recv_conn, job)
+            if on_start is not None:
+                on_start(job)
+
+        for sentinel in wait(list(running.keys())):
+            process, recv_conn, job = running.pop(sentinel)
+            try:
+                row = recv_conn.recv()
+            except EOFError:
+                row = failed_row(job, "CRASH")
+            process.join()
+            recv_conn.close()
+            on_result(job, row)
+
+
+def export_sweep_overviews(spec, mode, path_to_output):
+    """Copy the overviews of a sweep to the names used by combine_files.sh."""
+    definition = spec["experiments"][mode]
+    for set_name in definition["sets"]:
+        for solver in definition["solvers"]:
+            label = solver.rsplit("_", 1)[1]
+            group = f"{set_key(spec, set_name)}_{solver}"
+            source = os.path.join(path_to_output, group, "overview.json")
+            if os.path.exists(source):
+                copyfile(source, os.path.join(path_to_output, f"overview{label}.json"))
+
+
+if __name__ == "__main__":
+    parser = ArgumentParser(description="Run the CAMINO benchmark in parallel")
+    parser.add_argument(
+        "modes", nargs="+", help="experiments of the spec, e.g. compare alpha rho"
+    )
+    parser.add_argument("path_to_file", help="folder with the nl instances")
+    parser.add_argument("path_to_output", help="folder to save the results")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=os.cpu_count(),
+        help="number of concurrent solves (default: number of cores)",
+    )
+    parser.add_argument(
+        "--order",
+        choices=["ljf", "input"],
+        default="ljf",
+        help="run the longest expected jobs first (ljf) or keep the input order",
+    )
+    parser.add_argument(
+        "--history",
+        nargs="*",
+        default=None,
+        help="csv/json files with previous calc_time columns (default: results/*)",
+    )
+    parser.add_argument(
+        "--instances",
+        default=None,
+        help="csv file with the instances to run, e.g. from select_instances.py",
+    )
+    parser.add_argument(
+        "--spec", default=None, help="experiment spec (default: experiments.json)"
+    )
+    parser.add_argument(
+        "--repetitions",
+        type=int,
+        default=None,
+        help="solve every instance k times, in <group>/rep<r> (default: from the spec)",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="sample the Python stacks of every solve, cf. sampling_profiler.py",
+    )
+    parser.add_argument(
+        "--profile-interval",
+        type=float,
+        default=INTERVAL,
+        help="sampling interval of --profile in seconds",
+    )
+    parser.add_argument(
+        "--trace",
+        action="store_true",
+        help="save a stats snapshot per iteration, cf. stats_trace.py",
+    )
+    parser.add_argument(
+        "--shard",
+        type=parse_shard,
+        default=None,
+        help="run only the i-th of N parts of the matrix (i/N), cf. merge_shards.py",
+    )
+    parser.add_argument(
+        "--dry-run", action="store_true", help="only print the job list"
+    )
+    args = parser.parse_args()
+
+    spec = load_spec(args.spec)
+    if args.repetitions is not None:
+        spec["repetitions"] = args.repetitions
+    instances = None if args.instances is None else read_instances(args.instances)
+    jobs = expand_jobs(spec, args.modes, args.path_to_file, instances)
+    if args.trace:
+        jobs = trace_jobs(jobs)
+    estimator = RuntimeEstimator(args.history)
+    estimates = [
+        estimator.estimate(job.group.split("/")[0], os.path.basename(job.nl_file)[:-3])
+        for job in jobs
+    ]
+    if args.shard is not None:
+        shard, shards = args.shard
+        assignment, fingerprint = shard_jobs(jobs, estimates, shards)
+        loads = [0.0] * shards
+        for s, estimate in zip(assignment, estimates):
+            loads[s - 1] += estimate
+        print(
+            f"Shard {shard}/{shards}: {assignment.count(shard)}/{len(jobs)} jobs, "
+            f"expected {loads[shard - 1]:.0f}s "
+            f"(shards {min(loads):.0f}s to {max(loads):.0f}s)"
+        )
+        keep = [s == shard for s in assignment]
+        jobs = [job for job, k in zip(jobs, keep) if k]
+        estimates = [estimate for estimate, k in zip(estimates, keep) if k]
+        args.path_to_output = shard_folder(args.path_to_output, shard, shards)
+        if not args.dry_run:
+            write_shard_manifest(
+                args.path_to_output, shard, shards, fingerprint, spec, args.modes, jobs
+            )
+    if args.order == "ljf":
+        jobs, estimates = order_longest_first(jobs, estimates)
+    jobs, estimates = interleave_repetitions(jobs, estimates)
+    if args.dry_run:
+        for job, estimate in zip(jobs, estimates):
+            print(f"{job.group}\t{job.idx}\t{job.algorithm}\t{job.nl_file}\t{estimate}")
+        exit(0)
+
+    targets = [(job, group) for job in jobs for group, _ in [job[:2]] + job.copies]
+    totals = Counter(group for _, group in targets)
+    journals = {}
+    for job, group in targets:
+        if group not in journals:
+            journals[group] = Journal(
+                os.path.join(args.path_to_output, group),
+                job.algorithm,
+                totals[group],
+                HEADER,
+            )
+    # Profiled solves are run again and their perturbed times are not cached
+    cache = None if args.profile else default_cache()
+    version = package_version("caminopy", "casadi")
+    keys = {}
+    todo = []
+    for job, estimate in zip(jobs, estimates):
+        if job.idx in journals[job.group].records:
+            record = journals[job.group].records[job.idx]
+            fan_out(job, record, args.path_to_output, journals)
+            continue
+        keys[job.group, job.idx] = job_key(job, version)
+        record = restore_cached(
+            job, cache, keys[job.group, job.idx], args.path_to_output
+        )
+        if record is not None:
+            journals[job.group].add(record)
+            fan_out(job, record, args.path_to_output, journals)
+        else:
+            todo.append((job, estimate))
+    predicted = predict_makespan([estimate for _, estimate in todo], args.workers)
+    print(f"{len(todo)}/{len(jobs)} jobs to run on {args.workers} workers")
+    print(f"Predicted makespan {predicted:.1f}s")
+
+    running = RunningJobs(args.path_to_output, args.workers)
+
+    def on_start(job):
+        folder = os.path.join(args.path_to_output, job.group)
+        running.start(folder, instance_name(job.nl_file))
+
+    def on_result(job, row):
+        folder = os.path.join(args.path_to_output, job.group)
+        running.stop(folder, instance_name(job.nl_file))
+        record = dict(zip(HEADER, row))
+        journals[job.group].add(record)
+        store_cached(job, cache, keys[job.group, job.idx], record, args.path_to_output)
+        fan_out(job, record, args.path_to_output, journals)
+        print(f"DONE {job.group} {os.path.basename(job.nl_file)}: {row[2]}")
+
+    start = time()
+    run_jobs(
+        [job for job, _ in todo],
+        args.workers,
+        args.path_to_output,
+        on_result,
+        args.profile_interval if args.profile else None,
+        on_start,
+    )
+    running.close()
+    print(f"Makespan predicted {predicted:.1f}s, actual {time() - start:.1f}s")
+
+    for journal in journals.values():
+        journal.compact()
+    for mode in args.modes:
+        # The overviews of a sweep are exported when the shards are merged
+        if mode in ("alpha", "rho") and args.shard is None:
+            export_sweep_overviews(spec, mode, args.path_to_output)
@@ -0,0 +1,321 @@
+# This file is part of camino-benchmark
+# Copyright (C) 2026  Andrea Ghezzi, Wim Van Roy, Sebastian Sager, Moritz Diehl
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""
+Racing of the configurations of a sweep, e.g. the alpha and rho modes.
+
+All configurations of an experiment are run on a shuffled stream of the
+instances, block by block. After every block the scores of the solved
+instances are compared with a Friedman test; if the configurations differ,
+every configuration that is worse than the best one in a one-sided Wilcoxon
+signed-rank test on the paired log time ratios is dropped from the race
+(F-Race). The score of an instance is the calc time, or twice the time limit
+if the solve failed or its objective is worse than the best one found.
+
+    python benchmark/racing.py alpha <path_to_dir_with_minlplib_nl_files> <path_to_save_results> --workers <nr_of_cores>
+
+The results are written to the same folders as parallel_runner.py and
+the course of the race to `race_<mode>.json`.
+"""
+
+import json
+import math
+import os
+import random
+from argparse import ArgumentParser
+import numpy as np
+import pandas as pd
+from experiment import load_spec, set_key
+from journal import Journal, RunningJobs, instance_name
+from parallel_runner import (
+    HEADER,
+    expand_jobs,
+    export_sweep_overviews,
+    fan_out,
+    job_key,
+    restore_cached,
+    run_jobs,
+    store_cached,
+)
+from result_cache import default_cache, package_version
+from result_status import to_numbers
+
+BLOCK = 10
+# Instances solved by all configurations before the first test
+MIN_INSTANCES = 20
+LEVEL = 0.05
+# Relative tolerance of the objective to the best one of an instance
+OBJ_TOL = 1e-2
+
+
+def chi2_sf(x, df):
+    """Survival function of the chi-squared distribution."""
+    if x <= 0:
+        return 1.0
+    if df == 1:
+        return math.erfc(math.sqrt(x / 2))
+    if df == 2:
+        return math.exp(-x / 2)
+    # Wilson-Hilferty approximation
+    z = ((x / df) ** (1 / 3) - (1 - 2 / (9 * df))) / math.sqrt(2 / (9 * df))
+    return 0.5 * math.erfc(z / math.sqrt(2))
+
+
+def friedman(scores):
+    """
+    Friedman test of the configurations, with the correction for ties.
+
+    :param scores: array of instances x configurations, lower is better
+    :return: (mean rank of every configuration, p-value)
+    """
+    n, k = scores.shape
+    ranks = pd.DataFrame(scores).rank(axis=1).to_numpy()
+    rank_sums = ranks.sum(axis=0)
+    statistic = 12 / (n * k * (k + 1)) * np.sum(rank_sums**2) - 3 * n * (k + 1)
+    ties = sum(
+        np.sum(counts**3 - counts)
+        for counts in (np.unique(row, return_counts=True)[1] for row in scores)
+    )
+    correction = 1 - ties / (n * (k**3 - k))
+    if correction <= 0:
+        # All configurations tie on every instance
+        return rank_sums / n, 1.0
+    return rank_sums / n, chi2_sf(statistic / correction, k - 1)
+
+
+def wilcoxon(differences):
+    """
+    One-sided Wilcoxon signed-rank test, normal approximation.
+
+    :return: p-value of the hypothesis that the differences are positive
+    """
+    d = differences[np.abs(differences) > 1e-12]
+    n = len(d)
+    if n == 0:
+        return 1.0
+    ranks = pd.Series(np.abs(d)).rank().to_numpy()
+    w_plus = ranks[d > 0].sum()
+    _, counts = np.unique(np.abs(d), return_counts=True)
+    variance = n * (n + 1) * (2 * n + 1) / 24 - np.sum(counts**3 - counts) / 48
+    if variance <= 0:
+        return 1.0
+    z = (w_plus - n * (n + 1) / 4) / math.sqrt(variance)
+    return 0.5 * math.erfc(z / math.sqrt(2))
+
+
+def instance_scores(obj, calc_time, time_limit):
+    """
+    Scores of the configurations on one instance, lower is better.
+
+    :param obj: objectives of the configurations, non-finite if failed
+    :param calc_time: calc times of the configurations
+    """
+    solved = np.isfinite(obj) & np.isfinite(calc_time)
+    if not solved.any():
+        return np.full(len(obj), 2.0 * time_limit)
+    best = np.min(obj[solved])
+    solved &= obj <= best + OBJ_TOL * max(abs(best), 1.0)
+    return np.where(solved, np.clip(calc_time, 1e-3, time_limit), 2.0 * time_limit)
+
+
+def record_scores(records, time_limit):
+    """
+    Scores of the configurations on one instance from their journal records.
+
+    :param records: records of the configurations, failed records only have
+        the columns up to load_time, i.e. no calc_time
+    """
+    obj, calc_time = (
+        to_numbers(pd.Series([r.get(col) for r in records], dtype=object))
+        for col in ["obj", "calc_time"]
+    )
+    return instance_scores(obj, calc_time, time_limit)
+
+
+def dominated(scores, configs, level=LEVEL):
+    """
+    Configurations to drop from the race.
+
+    :param scores: array of instances x configurations
+    :return: (configurations to drop, mean ranks, p-value of the Friedman test)
+    """
+    mean_ranks, p = friedman(scores)
+    if p >= level:
+        return [], mean_ranks, p
+    best = int(np.argmin(mean_ranks))
+    drop = []
+    for j, config in enumerate(configs):
+        if j == best:
+            continue
+        if wilcoxon(np.log(scores[:, j]) - np.log(scores[:, best])) < level:
+            drop.append(config)
+    return drop, mean_ranks, p
+
+
+def race_stream(spec, mode, jobs, seed):
+    """
+    Stream of the instances of a mode and the job of every configuration.
+
+    :return: (configurations, list of (instance, {configuration: (job, group, idx)}))
+    """
+    configs = spec["experiments"][mode]["solvers"]
+    targets = {}
+    for job in jobs:
+        for group, idx in [(job.group, job.idx)] + job.copies:
+            targets[group, instance_name(job.nl_file)] = (job, group, idx)
+    stream = []
+    for set_name in spec["experiments"][mode]["sets"]:
+        key = set_key(spec, set_name)
+        groups = {f"{key}_{config}" for config in configs}
+        names = sorted({name for group, name in targets if group in groups})
+        for name in names:
+            entry = {
+                config: targets[f"{key}_{config}", name]
+                for config in configs
+                if (f"{key}_{config}", name) in targets
+            }
+            # Instances skipped by a configuration are not raced
+            if len(entry) == len(configs):
+                stream.append((f"{key}/{name}", entry))
+    random.Random(seed).shuffle(stream)
+    return configs, stream
+
+
+if __name__ == "__main__":
+    parser = ArgumentParser(description="Race the configurations of a sweep")
+    parser.add_argument("mode", help="experiment of the spec, e.g. alpha or rho")
+    parser.add_argument("path_to_file", help="folder with the nl instances")
+    parser.add_argument("path_to_output", help="folder to save the results")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=os.cpu_count(),
+        help="number of concurrent solves (default: number of cores)",
+    )
+    parser.add_argument(
+        "--block", type=int, default=BLOCK, help="instances between two tests"
+    )
+    parser.add_argument(
+        "--min-instances",
+        type=int,
+        default=MIN_INSTANCES,
+        help="instances solved before the first test",
+    )
+    parser.add_argument("--level", type=float, default=LEVEL, help="significance")
+    parser.add_argument("--seed", type=int, default=0, help="order of the instances")
+    parser.add_argument(
+        "--finish",
+        action="store_true",
+        help="solve the remaining instances with the last configuration left",
+    )
+    parser.add_argument(
+        "--spec", default=None, help="experiment spec (default: experiments.json)"
+    )
+    args = parser.parse_args()
+
+    spec = load_spec(args.spec)
+    spec["repetitions"] = 1
+    jobs = expand_jobs(spec, [args.mode], args.path_to_file)
+    configs, stream = race_stream(spec, args.mode, jobs, args.seed)
+    print(f"Racing {len(configs)} configurations on {len(stream)} instances")
+
+    journals = {}
+    for job in jobs:
+        for group, _ in [(job.group, job.idx)] + job.copies:
+            if group not in journals:
+                total = sum(
+                    1 for _, entry in stream for t in entry.values() if t[1] == group
+                )
+                journals[group] = Journal(
+                    os.path.join(args.path_to_output, group),
+                    job.algorithm,
+                    total,
+                    HEADER,
+                )
+    cache = default_cache()
+    version = package_version("caminopy", "casadi")
+
+    running = RunningJobs(args.path_to_output, args.workers)
+
+    def on_start(job):
+        folder = os.path.join(args.path_to_output, job.group)
+        running.start(folder, instance_name(job.nl_file))
+
+    def on_result(job, row):
+        folder = os.path.join(args.path_to_output, job.group)
+        running.stop(folder, instance_name(job.nl_file))
+        record = dict(zip(HEADER, row))
+        journals[job.group].add(record)
+        store_cached(job, cache, job_key(job, version), record, args.path_to_output)
+        fan_out(job, record, args.path_to_output, journals)
+        print(f"DONE {job.group} {os.path.basename(job.nl_file)}: {row[2]}")
+
+    def solve(entries):
+        """Solve the jobs of the entries that are not in the journals yet."""
+        todo = []
+        for job, group, idx in entries:
+            if idx in journals[group].records or job in todo:
+                continue
+            record = restore_cached(
+                job, cache, job_key(job, version), args.path_to_output
+            )
+            if record is not None:
+                journals[job.group].add(record)
+                fan_out(job, record, args.path_to_output, journals)
+            else:
+                todo.append(job)
+        run_jobs(todo, args.workers, args.path_to_output, on_result, None, on_start)
+
+    alive = list(configs)
+    rows = []
+    history = []
+    position = 0
+    while position < len(stream) and len(alive) > 1:
+        block = stream[position : position + args.block]
+        position += len(block)
+        solve([entry[config] for _, entry in block for config in alive])
+        for _, entry in block:
+            records = [journals[g].records[i] for _, g, i in (entry[c] for c in alive)]
+            scores = record_scores(records, entry[alive[0]][0].time_limit)
+            rows.append(dict(zip(alive, scores)))
+
+        if position < args.min_instances:
+            continue
+        scores = np.array([[row[config] for config in alive] for row in rows])
+        drop, mean_ranks, p = dominated(scores, alive, args.level)
+        history.append(
+            {
+                "instances": position,
+                "alive": list(alive),
+                "mean_ranks": dict(zip(alive, mean_ranks.tolist())),
+                "p_friedman": p,
+                "dropped": drop,
+            }
+        )
+        print(
+            f"{position} instances: Friedman p={p:.3g}, mean ranks "
+            + ", ".join(f"{c} {r:.2f}" for c, r in zip(alive, mean_ranks))
+        )
+        for config in drop:
+            print(f"Dropped {config}")
+            alive.remove(config)
+
+    if args.finish and position < len(stream):
+        print(f"Solving the remaining {len(stream) - position} instances with {alive}")
+        solve([entry[config] for _, entry in stream[position:] for config in alive])
+
+    solved = sum(len(journal.records) for journal in journals.values())
+    full = len(configs) * len(stream)
+    print(f"Left {', '.join(alive)} after {position} instances")
+    print(f"Solved {solved} of the {full} jobs of the full sweep ({solved / full:.2f})")
+    filename = os.path.join(args.path_to_output, f"race_{args.mode}.json")
+    with open(filename, "w") as f:
+        json.dump(
+            {"alive": alive, "instances": position, "history": history}, f, indent=2
+        )
+    running.close()
+    for journal in journals.values():
+        journal.compact()
+    export_sweep_overviews(spec, args.mode, args.path_to_output)
+    print(f"Written {filename}")
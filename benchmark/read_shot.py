@@ -4,32 +4,54 @@
 
 
 from lxml import etree as ET
-import re
+from multiprocessing import Pool
 from sys import argv
 import csv
 from os import path
 
-default_parser = ET.XMLParser(remove_blank_text=True)
+# Values of <other name=...> in the results
+OTHER_NAMES = [
+    "PrimalObjectiveBound",
+    "DualObjectiveBound",
+    "NumberOfNLPProblems",
+    "NumberOfFeasibleMILPProblems",
+    "NumberOfFeasibleMIQPProblems",
+    "NumberOfOptimalMILPProblems",
+    "NumberOfOptimalMIQPProblems",
+    "NumberOfLPProblems",
+    "NumberOfQPProblems",
+]
+# Values of <time type=...> in the results
+TIME_TYPES = ["Total", "ProblemInitialization"]
+MIP_COUNTS = OTHER_NAMES[3:7]
+RELAXED_MIP_COUNTS = OTHER_NAMES[7:9]
 
 
-def read_config(config_path):
+def read_values(osrl_file):
     """
-    Read configuration.
+    Read the required values of an osrl file in a single pass.
 
-    :param config_path: path
-    :return: ET
-    """
-    # Remove xmlns
-    with open(config_path, "r", encoding="utf-8") as f:
-        f.readline()
-        content = "<osrl>" + f.read()
-    if len(content) < 10:
-        return None
+    Only the <other> and <time> elements are built, parsing stops as soon as
+    all values are found, i.e. before the solution.
 
-    content = re.sub(r" xmlns=[\"'][^']+['\"]", "", content, count=4)
-    content = re.sub(r"<\?xml[^>]+>", "", content)
-    # Parse xml
-    return ET.XML(content, parser=default_parser)
+    :param osrl_file: path
+    :return: dict of name -> text, the first occurrence is kept
+    """
+    values = {}
+    wanted = len(OTHER_NAMES) + len(TIME_TYPES)
+    for _, elem in ET.iterparse(osrl_file, tag=("{*}other", "{*}time"), huge_tree=True):
+        if ET.QName(elem).localname == "other":
+            name = elem.get("name")
+            if name in OTHER_NAMES and name not in values:
+                values[name] = elem.get("value")
+        else:
+            name = elem.get("type")
+            if name in TIME_TYPES and name not in values:
+                values[name] = elem.text
+        elem.clear(keep_tail=False)
+        if len(values) == wanted:
+            break
+    return values
 
 
 def get_data(name, osrl_file):
@@ -37,61 +59,61 @@ def get_data(name, osrl_file):
     if not path.exists(osrl_file):
         return [name, "NAN", "NAN", "NAN", "NAN", "NAN", "NAN"]
 
-    tree = read_config(osrl_file)
     try:
-        primal = tree.find(".//other[@name='PrimalObjectiveBound']").attrib["value"]
-        dual = tree.find(".//other[@name='DualObjectiveBound']").attrib["value"]
-        time_total = float(tree.find(".//time[@type='Total']").text)
-        time_setup = float(tree.find(".//time[@type='ProblemInitialization']").text)
-        nlp = tree.find(".//other[@name='NumberOfNLPProblems']").attrib["value"]
-        mip = (
-            tree.find(".//other[@name='NumberOfFeasibleMILPProblems']").attrib["value"]
-            + tree.find(".//other[@name='NumberOfFeasibleMIQPProblems']").attrib[
-                "value"
-            ]
-            + tree.find(".//other[@name='NumberOfOptimalMILPProblems']").attrib["value"]
-            + tree.find(".//other[@name='NumberOfOptimalMIQPProblems']").attrib["value"]
-        )
-        relaxed_mip = (
-            tree.find(".//other[@name='NumberOfLPProblems']").attrib["value"]
-            + tree.find(".//other[@name='NumberOfQPProblems']").attrib["value"]
-        )
+        values = read_values(osrl_file)
+        primal = values["PrimalObjectiveBound"]
+        dual = values["DualObjectiveBound"]
+        time_total = float(values["Total"])
+        time_setup = float(values["ProblemInitialization"])
+        nlp = values["NumberOfNLPProblems"]
+        mip = sum(int(values[key]) for key in MIP_COUNTS)
+        relaxed_mip = sum(int(values[key]) for key in RELAXED_MIP_COUNTS)
         return [name, primal, dual, str(time_total - time_setup), nlp, mip, relaxed_mip]
     except Exception:
         return [name, "NAN", "NAN", "NAN", "NAN", "NAN", "NAN"]
 
 
-if len(argv) != 4:
-    print(argv)
-    print(
-        "Usage: python read_shot.py <problem_list> <base_path-output-files> <output_path>"
-    )
-    exit(1)
-
-
-with open(argv[1], "r") as f:
-    problems = [key.split(".")[0].split(",")[0] for key in f.readlines()]
-if problems[0] == "name":
-    problems = problems[1:]
-
-base_path = argv[2]
-output_path = argv[3]
-data = [
-    [
-        "id",
-        "path",
-        "obj",
-        "dual_obj",
-        "calc_time",
-        "NLP_runs",
-        "MIP_runs",
-        "relaxed_MIP_runs",
+def read_directory(base_path, problems, workers=None):
+    """
+    Read the osrl files of all problems in a pool of processes.
+
+    :return: rows in the order of problems
+    """
+    args = [(name, path.join(base_path, name + ".osrl")) for name in problems]
+    with Pool(workers) as pool:
+        return pool.starmap(get_data, args, chunksize=16)
+
+
+if __name__ == "__main__":
+    if len(argv) != 4:
+        print(argv)
+        print(
+            "Usage: python read_shot.py <problem_list> <base_path-output-files> <output_path>"
+        )
+        exit(1)
+
+    with open(argv[1], "r") as f:
+        problems = [key.split(".")[0].split(",")[0] for key in f.readlines()]
+    if problems[0] == "name":
+        problems = problems[1:]
+
+    base_path = argv[2]
+    output_path = argv[3]
+    data = [
+        [
+            "id",
+            "path",
+            "obj",
+            "dual_obj",
+            "calc_time",
+            "NLP_runs",
+            "MIP_runs",
+            "relaxed_MIP_runs",
+        ]
     ]
-]
-for i, name in enumerate(problems):
-    osrl_file = base_path + "/" + name + ".osrl"
-    data.append([i] + get_data(name, osrl_file))
+    for i, row in enumerate(read_directory(base_path, problems)):
+        data.append([i] + row)
 
-with open(output_path, "w") as f:
-    writer = csv.writer(f)
-    writer.writerows(data)
+    with open(output_path, "w") as f:
+        writer = csv.writer(f)
+        writer.writerows(data)
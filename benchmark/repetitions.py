@@ -0,0 +1,248 @@
+# This file is part of camino-benchmark
+# Copyright (C) 2026  Andrea Ghezzi, Wim Van Roy, Sebastian Sager, Moritz Diehl
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""
+Timing statistics of repeated runs.
+
+With `repetitions` in experiments.json, or `--repetitions k` of
+parallel_runner.py and run_shot.py, every (solver, instance) is solved k
+times in interleaved rounds, the first repetition in `<group>/` and the
+others in `<group>/rep<r>/`. All samples are collected here and the time
+profile uses the median (or a trimmed mean) of the samples of an instance,
+with bootstrap confidence bands obtained by resampling the repetitions:
+
+    python benchmark/repetitions.py <results_dir> <key> <solve_time> <analysis>
+
+The samples are written to `<key>_samples.csv` and the statistic of every
+instance to `<key>_repeated.csv` in the results folder.
+"""
+
+import os
+import re
+import warnings
+from argparse import ArgumentParser
+from datetime import datetime
+import numpy as np
+import pandas as pd
+from matplotlib import pyplot as plt
+from create_plot import (
+    analysis_instances,
+    clean_data,
+    latexify,
+    performance_ratios,
+    plot_performance_profile,
+    profile_curves,
+    select_solvers,
+    time_columns,
+)
+from journal import instance_name
+from read_shot import read_directory
+from result_status import normalize
+from results_store import read_source
+
+SAMPLE_COLUMNS = ["solver", "name", "repetition", "obj", "calc_time", "solver_time"]
+STATISTICS = ["median", "trimmed"]
+# Fraction of the samples removed at both ends by the trimmed mean
+TRIM = 0.2
+N_BOOTSTRAP = 1000
+LEVEL = 0.95
+
+
+def repetition_folders(folder):
+    """(repetition, folder) of a results folder and its rep<r> subfolders."""
+    folders = [(0, folder)]
+    for entry in os.scandir(folder):
+        match = re.fullmatch(r"rep(\d+)", entry.name)
+        if entry.is_dir() and match is not None:
+            folders.append((int(match.group(1)), entry.path))
+    return sorted(folders)
+
+
+def read_folder(folder):
+    """Results of a single repetition, SHOT .osrl files or an overview."""
+    names = sorted(f[:-5] for f in os.listdir(folder) if f.endswith(".osrl"))
+    if len(names) > 0:
+        rows = [row[:4] for row in read_directory(folder, names)]
+        table = pd.DataFrame(rows, columns=["name", "obj", "dual_obj", "calc_time"])
+    else:
+        table = read_source(folder)
+        table["name"] = table["path"].map(instance_name)
+    return table.reindex(columns=["name", "obj", "calc_time", "solver_time"])
+
+
+def read_samples(results_dir, solvers):
+    """
+    Read the results of all repetitions of the solvers.
+
+    :return: long DataFrame with SAMPLE_COLUMNS, values as read
+    """
+    frames = []
+    for solver in solvers:
+        folder = os.path.join(results_dir, solver)
+        if not os.path.isdir(folder):
+            print(f"Warning: No results of {solver} in {results_dir}")
+            continue
+        for repetition, rep_folder in repetition_folders(folder):
+            table = read_folder(rep_folder)
+            table["solver"] = solver
+            table["repetition"] = repetition
+            frames.append(table)
+    return pd.concat(frames, ignore_index=True)[SAMPLE_COLUMNS]
+
+
+def sample_values(samples, solvers, solve_time, names):
+    """
+    Cleaned times of all samples, cf. create_plot.clean_data.
+
+    :return: array of instances x solvers x repetitions, NaN for missing samples
+    """
+    columns = time_columns(solvers, solve_time)
+    metrics = ["obj", "calc_time", "solver_time"]
+    repetitions = sorted(samples["repetition"].unique())
+    values = np.full((len(names), len(solvers), len(repetitions)), np.nan)
+    for r, repetition in enumerate(repetitions):
+        run = samples[samples["repetition"] == repetition]
+        run = run.drop_duplicates(["solver", "name"])
+        wide = run.set_index(["name", "solver"])[metrics].unstack("solver")
+        wide.columns = [f"{solver}.{metric}" for metric, solver in wide.columns]
+        wide = wide.reindex(
+            index=names, columns=[f"{s}.{m}" for s in solvers for m in metrics]
+        )
+        present = wide[columns].notna().to_numpy()
+        normalize(wide, list(wide.columns))
+        clean_data(wide, solvers, columns)
+        values[:, :, r] = np.where(present, wide[columns].to_numpy(dtype=float), np.nan)
+    return values
+
+
+def trimmed_mean(values, trim=TRIM):
+    """Mean along the last axis without the fraction `trim` of samples at both ends."""
+    ordered = np.sort(values, axis=-1)
+    count = np.sum(~np.isnan(values), axis=-1, keepdims=True)
+    cut = np.floor(trim * count)
+    rank = np.arange(values.shape[-1])
+    keep = (rank >= cut) & (rank < count - cut)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return np.where(keep, ordered, 0).sum(axis=-1) / keep.sum(axis=-1)
+
+
+def aggregate(values, statistic="median", trim=TRIM):
+    """Statistic of the samples along the last axis, NaN samples are ignored."""
+    if statistic == "trimmed":
+        return trimmed_mean(values, trim)
+    with warnings.catch_warnings():
+        # Instances without any sample
+        warnings.simplefilter("ignore", RuntimeWarning)
+        return np.nanmedian(values, axis=-1)
+
+
+def bootstrap_bands(
+    values,
+    tau,
+    statistic="median",
+    trim=TRIM,
+    n_boot=N_BOOTSTRAP,
+    level=LEVEL,
+    seed=0,
+):
+    """
+    Confidence bands of the performance profiles by resampling the repetitions.
+
+    :param values: array of instances x solvers x repetitions
+    :param tau: performance ratios at which the bands are evaluated
+    :return: list of (tau, lower, upper) for every solver
+    """
+    rng = np.random.default_rng(seed)
+    n, n_solvers, k = values.shape
+    # Draw from the available samples only, these come first after sorting
+    ordered = np.sort(values, axis=2)
+    count = np.sum(~np.isnan(values), axis=2, keepdims=True)
+    fractions = np.empty((n_boot, n_solvers, len(tau)))
+    for b in range(n_boot):
+        draw = (rng.random(values.shape) * count).astype(int)
+        resampled = aggregate(
+            np.take_along_axis(ordered, draw, axis=2), statistic, trim
+        )
+        ratios = np.sort(performance_ratios(resampled), axis=0)
+        for j in range(n_solvers):
+            fractions[b, j] = np.searchsorted(ratios[:, j], tau, "right") / n
+    alpha = (1 - level) / 2
+    lower, upper = np.quantile(fractions, [alpha, 1 - alpha], axis=0)
+    return [(tau, lower[j], upper[j]) for j in range(n_solvers)]
+
+
+if __name__ == "__main__":
+    parser = ArgumentParser(description="Time profiles of repeated runs")
+    parser.add_argument("results_dir", help="folder with a results folder per solver")
+    parser.add_argument("key", choices=["cvx", "noncvx"])
+    parser.add_argument("solve_time", choices=["solvetime", "totaltime"])
+    parser.add_argument("analysis", help="experiment of experiments.json")
+    parser.add_argument("--statistic", choices=STATISTICS, default="median")
+    parser.add_argument(
+        "--trim", type=float, default=TRIM, help="trimmed fraction at both ends"
+    )
+    parser.add_argument("--bootstrap", type=int, default=N_BOOTSTRAP)
+    parser.add_argument("--level", type=float, default=LEVEL)
+    args = parser.parse_args()
+
+    solvers, solver_names, TAU_MAX, YLIM_LIST = select_solvers(args.key, args.analysis)
+    samples = read_samples(args.results_dir, solvers)
+    filename = os.path.join(args.results_dir, f"{args.key}_samples.csv")
+    samples.to_csv(filename, index=False)
+    print(f"Written {filename}")
+
+    names = sorted(samples["name"].dropna().unique())
+    instances = analysis_instances(args.analysis)
+    if instances is not None:
+        names = [name for name in names if name in set(instances)]
+    values = sample_values(samples, solvers, args.solve_time, names)
+    columns = time_columns(solvers, args.solve_time)
+    repeated = pd.DataFrame(
+        aggregate(values, args.statistic, args.trim),
+        index=pd.Index(names, name="name"),
+        columns=columns,
+    )
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", RuntimeWarning)
+        q1, q3 = np.nanquantile(values, [0.25, 0.75], axis=2)
+    for j, col in enumerate(columns):
+        repeated[f"{col}_iqr"] = q3[:, j] - q1[:, j]
+        repeated[f"{col}_samples"] = np.sum(~np.isnan(values[:, j]), axis=1)
+    filename = os.path.join(args.results_dir, f"{args.key}_repeated.csv")
+    repeated.to_csv(filename)
+    print(f"Written {filename}")
+
+    for j, solver in enumerate(solvers):
+        with np.errstate(invalid="ignore", divide="ignore"):
+            spread = repeated[f"{columns[j]}_iqr"] / repeated[columns[j]]
+        print(
+            f"{solver}: \t\t {repeated[f'{columns[j]}_samples'].max()} repetitions"
+            " | median relative IQR "
+            f"{np.nanmedian(spread[np.isfinite(spread)]):.3f} | "
+            f"relative IQR > 0.1 on {(spread > 0.1).sum()} instances"
+        )
+
+    latexify(6, 4)
+    curves = profile_curves(repeated, columns, TAU_MAX[0])
+    tau = np.geomspace(1, TAU_MAX[0], 400)
+    bands = bootstrap_bands(
+        values, tau, args.statistic, args.trim, args.bootstrap, args.level
+    )
+    date = datetime.now().strftime("%m-%d")
+    filename = os.path.join(
+        args.results_dir,
+        f"{date}_{args.key}_calc_time_profile_nsol{len(solvers)}_"
+        f"{args.solve_time}_{args.statistic}.png",
+    )
+    fig, _ = plot_performance_profile(
+        curves,
+        filename,
+        ylim=YLIM_LIST[0],
+        tau_max=TAU_MAX[0],
+        title=f"Wall time, {args.statistic} of {values.shape[2]} runs",
+        legend_labels=solver_names,
+        bands=bands,
+    )
+    plt.close(fig)
+    print(f"Written {filename}")
@@ -0,0 +1,127 @@
+# This file is part of camino-benchmark
+# Copyright (C) 2026  Andrea Ghezzi, Wim Van Roy, Sebastian Sager, Moritz Diehl
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""
+Content-addressed cache of solver results.
+
+A result is stored under the hash of (content of the .nl/.mod file, solver
+name and version, solver options, time limit), so a result is only reused
+when it was computed on the same model with the same solver configuration.
+The cache is shared by `run_shot.py`, `using_amplpy.py` and
+`parallel_runner.py` and lives in `~/.cache/camino-benchmark`; set the
+environment variable CAMINO_BENCHMARK_CACHE to another folder, or to "off"
+to disable it.
+"""
+
+import hashlib
+import json
+import os
+from shutil import copyfile
+
+CACHE_ENV = "CAMINO_BENCHMARK_CACHE"
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "camino-benchmark")
+
+_file_hashes = {}
+
+
+def file_hash(filename):
+    """Sha256 of the content of a file."""
+    stat = os.stat(filename)
+    memo_key = (os.path.abspath(filename), stat.st_size, stat.st_mtime)
+    if memo_key not in _file_hashes:
+        sha = hashlib.sha256()
+        with open(filename, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                sha.update(chunk)
+        _file_hashes[memo_key] = sha.hexdigest()
+    return _file_hashes[memo_key]
+
+
+def cache_key(model_file, solver, version, options, time_limit, repetition=0):
+    """
+    Key of a result, None if the model file does not exist.
+
+    :param repetition: index of a repeated solve, every repetition is a
+        separate sample and gets its own key
+    """
+    if not os.path.exists(model_file):
+        return None
+    key = {
+        "model": file_hash(model_file),
+        "solver": solver,
+        "version": version,
+        "options": options,
+        "time_limit": float(time_limit),
+    }
+    if repetition > 0:
+        key["repetition"] = repetition
+    content = json.dumps(key, sort_keys=True)
+    return hashlib.sha256(content.encode()).hexdigest()
+
+
+def package_version(*names):
+    """Installed versions of python packages, e.g. caminopy and casadi."""
+    from importlib.metadata import version, PackageNotFoundError
+
+    versions = []
+    for name in names:
+        try:
+            versions.append(f"{name} {version(name)}")
+        except PackageNotFoundError:
+            versions.append(f"{name} unknown")
+    return ", ".join(versions)
+
+
+class ResultCache:
+    """Results and their files stored by key."""
+
+    def __init__(self, folder):
+        self.folder = folder
+
+    def _path(self, key):
+        return os.path.join(self.folder, key[:2], key)
+
+    def get(self, key):
+        """Cached result of a key, None on a miss."""
+        if key is None:
+            return None
+        target = self._path(key) + ".json"
+        if not os.path.exists(target):
+            return None
+        with open(target, "r") as f:
+            return json.load(f)
+
+    def put(self, key, result, files=None):
+        """
+        Store a result and copies of its files.
+
+        :param files: dict of name in the cache -> file to copy
+        """
+        if key is None:
+            return
+        folder = self._path(key)
+        os.makedirs(folder, exist_ok=True)
+        for name, filename in (files or {}).items():
+            copyfile(filename, os.path.join(folder, name))
+        # Write the result last, it marks the entry as complete
+        tmp = folder + ".json.tmp"
+        with open(tmp, "w") as f:
+            json.dump(result, f)
+        os.replace(tmp, folder + ".json")
+
+    def restore(self, key, name, target):
+        """Copy a cached file of a key to target, False if it does not exist."""
+        source = os.path.join(self._path(key), name)
+        if not os.path.exists(source):
+            return False
+        copyfile(source, target)
+        return True
+
+
+def default_cache():
+    """Cache configured by the environment, None when disabled."""
+    folder = os.environ.get(CACHE_ENV, DEFAULT_CACHE_DIR)
+    if folder.lower() == "off":
+        return None
+    return ResultCache(folder)
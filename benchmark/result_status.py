@@ -0,0 +1,120 @@
+# This file is part of camino-benchmark
+# Copyright (C) 2026  Andrea Ghezzi, Wim Van Roy, Sebastian Sager, Moritz Diehl
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""
+Parse result columns into values and a status.
+
+The result tables mix numbers with the messages of failed runs, e.g. "CRASH",
+"FAILED", "NAN" or a Python error. Every failure is converted to inf, such
+that it counts as unsolved in the performance profiles, and its reason is
+kept in a categorical status.
+"""
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+
+# Substrings of the messages written instead of a value by failed runs
+FAILURE_MARKERS = [
+    "Objective",
+    "feasible",
+    "Error",
+    "Calling",
+    "g_val",
+    "CRASH",
+    "FAILED",
+    "empty",
+    "basic_string",
+    "No objective",
+    "Suffix values",
+    "for indices",
+    "has no attribute",
+]
+# Values written by runs that did not find a solution
+NO_SOLUTION = ["-inf", "-Infinity", "NAN"]
+# Larger absolute values are treated as unbounded or missing
+MAX_ABS_VALUE = 1e20
+
+NUMBER_PATTERN = r"^[+-]?((\d+\.?\d*|\.\d+)(e[+-]?\d+)?|inf|infinity|nan)$"
+
+STATUSES = [
+    "ok",
+    "missing",
+    "no_solution",
+    "zero",
+    "infinite",
+    "unparsable",
+] + FAILURE_MARKERS
+
+
+def to_numbers(column):
+    """Parse a column of numbers and strings, anything else becomes NaN."""
+    if column.dtype != object and not isinstance(column.dtype, pd.StringDtype):
+        return pd.to_numeric(column, errors="coerce").to_numpy(dtype=float, copy=True)
+    # Arrow parses the strings exactly like float(), i.e. correctly rounded
+    text = pc.utf8_trim_whitespace(pa.array(column.astype("string")))
+    number = pc.match_substring_regex(text, NUMBER_PATTERN, ignore_case=True)
+    values = pc.cast(pc.if_else(number, text, None), pa.float64())
+    return values.to_numpy(zero_copy_only=False).copy()
+
+
+def message_status(message):
+    """Status code of a single value that is not a number."""
+    if not isinstance(message, str):
+        return 0
+    for marker in FAILURE_MARKERS:
+        if marker in message:
+            return STATUSES.index(marker)
+    if message in NO_SOLUTION:
+        return STATUSES.index("no_solution")
+    if message.lower() == "nan":
+        return 0
+    return STATUSES.index("unparsable")
+
+
+def parse_column(column):
+    """
+    Parse a column of results.
+
+    :param column: Series with numbers and/or strings
+    :return: (float Series with inf for failures, categorical status Series)
+    """
+    values = to_numbers(column)
+    codes = np.zeros(len(column), dtype=np.int8)
+    if column.dtype == object or isinstance(column.dtype, pd.StringDtype):
+        # The string "0" is written by runs that did not report a value
+        zero = np.flatnonzero(values == 0)
+        zero = zero[(column.iloc[zero] == "0").to_numpy(dtype=bool)]
+        codes[zero] = STATUSES.index("zero")
+        # Messages repeat, each distinct one is classified once
+        nan = np.flatnonzero(np.isnan(values))
+        labels, messages = pd.factorize(column.iloc[nan])
+        message_codes = np.array([message_status(m) for m in messages] + [0])
+        codes[nan] = message_codes[labels]
+
+    failed = codes != 0
+    codes[np.isnan(values) & ~failed] = STATUSES.index("missing")
+    with np.errstate(invalid="ignore"):
+        infinite = (np.abs(values) > MAX_ABS_VALUE) & ~failed
+    codes[infinite & np.isneginf(values)] = STATUSES.index("no_solution")
+    codes[infinite & ~np.isneginf(values)] = STATUSES.index("infinite")
+    values[failed | infinite] = np.inf
+    status = pd.Categorical.from_codes(codes, STATUSES)
+    return (
+        pd.Series(values, index=column.index, name=column.name),
+        pd.Series(status, index=column.index, name=column.name),
+    )
+
+
+def normalize(data, columns):
+    """
+    Parse result columns of a table in place.
+
+    :return: DataFrame with the status of every parsed column
+    """
+    statuses = {}
+    for col in columns:
+        data[col], statuses[col] = parse_column(data[col])
+    return pd.DataFrame(statuses, index=data.index)
@@ -0,0 +1,235 @@
+# This file is part of camino-benchmark
+# Copyright (C) 2026  Andrea Ghezzi, Wim Van Roy, Sebastian Sager, Moritz Diehl
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""
+Columnar store of benchmark results.
+
+A store is a folder of Parquet files with one row per (run, solver,
+instance). Adding results writes a new file, nothing is rewritten; when the
+same (run, solver, instance) is added twice, the last one wins. The analysis
+scripts only read the columns they need:
+
+    python benchmark/results_store.py add <store> <run> <solver>=<source> ...
+    python benchmark/results_store.py import <store> <run> <cvx.csv> ...
+
+`add` takes a results folder, overview.json or journal.jsonl of a single
+solver, or one of the per-solver csv files (e.g. from `read_shot.py`).
+`import` converts merged tables written by `join_csv_using_pandas.py`.
+"""
+
+import os
+import uuid
+from sys import argv
+from time import time
+import numpy as np
+import pandas as pd
+from journal import load_overview
+from result_status import MAX_ABS_VALUE
+
+BENCHMARK_DIR = os.path.dirname(os.path.abspath(__file__))
+
+FLOAT_COLUMNS = [
+    "obj",
+    "dual_obj",
+    "load_time",
+    "calc_time",
+    "solver_time",
+    "python_time",
+]
+COUNT_COLUMNS = [
+    "iter_nr",
+    "NLP_runs",
+    "FNLP_runs",
+    "MIQP_runs",
+    "MILP_runs",
+    "MIP_runs",
+    "relaxed_MIP_runs",
+]
+COLUMNS = ["run", "solver", "name"] + FLOAT_COLUMNS + COUNT_COLUMNS + ["status"]
+
+# Solvers reporting the objective of the minimization form of the problem
+MINIMIZING_SOLVERS = ["sbmiqp", "bonmin"]
+
+
+def instance_set(solver):
+    """Instance set (name, primalbound, dualbound, objsense) of a solver."""
+    filename = (
+        "nonconvex_set_full.csv"
+        if solver.startswith("noncvx")
+        else "convex_set_full.csv"
+    )
+    return pd.read_csv(os.path.join(BENCHMARK_DIR, filename))
+
+
+def typed(frame):
+    """Cast a long table to the schema of the store."""
+    frame = frame.reindex(columns=COLUMNS)
+    for col in ["run", "solver", "name", "status"]:
+        frame[col] = frame[col].astype("string")
+    for col in FLOAT_COLUMNS:
+        frame[col] = pd.to_numeric(frame[col], errors="coerce").astype("float64")
+    for col in COUNT_COLUMNS:
+        frame[col] = pd.to_numeric(frame[col], errors="coerce").astype("Int64")
+    return frame
+
+
+def solver_rows(table, solver, run):
+    """
+    Convert the results of a single solver to rows of the store.
+
+    :param table: DataFrame with the columns of overview.json or to_csv.py
+    :return: typed DataFrame
+    """
+    table = table.copy()
+    table["name"] = table["path"].map(lambda x: os.path.basename(str(x)).split(".")[0])
+    obj = pd.to_numeric(table["obj"], errors="coerce")
+    failed = obj.isna() | np.isneginf(obj)
+    # SHOT writes the largest double when it found no solution, larger values
+    # are failures as in result_status.parse_column
+    infinite = ~failed & ~(obj.abs() <= MAX_ABS_VALUE)
+    # Failed rows of camino are [id, path, -inf, "FAILED", reason]
+    reason = table.iloc[:, 4].astype("string") if table.shape[1] > 4 else None
+    status = pd.Series("ok", index=table.index, dtype="string")
+    status[failed] = table.loc[failed, "obj"].astype("string")
+    status[infinite] = "infinite"
+    if reason is not None:
+        camino_failed = table["dual_obj"].astype("string") == "FAILED"
+        status[camino_failed] = reason[camino_failed]
+    for col in FLOAT_COLUMNS + COUNT_COLUMNS:
+        if col in table:
+            table[col] = pd.to_numeric(table[col], errors="coerce").mask(failed)
+    table["obj"] = obj.mask(failed | infinite, np.inf)
+
+    if any(s in solver for s in MINIMIZING_SOLVERS):
+        objsense = instance_set(solver).set_index("name")["objsense"]
+        maximize = table["name"].map(objsense).eq("max") & ~(failed | infinite)
+        table.loc[maximize, "obj"] = -table.loc[maximize, "obj"]
+    table["solver"] = solver
+    table["run"] = run
+    table["status"] = status
+    return typed(table)
+
+
+def read_source(source):
+    """Read the results of a single solver as a DataFrame."""
+    if source.endswith(".csv"):
+        return pd.read_csv(source, dtype=str)
+    data = load_overview(source)["data"]
+    header, rows = data[0], data[1:]
+    rows = [row + [None] * (len(header) - len(row)) for row in rows]
+    return pd.DataFrame(rows, columns=header)
+
+
+def merged_rows(merged_csv, run):
+    """Convert a merged table of join_csv_using_pandas.py to rows of the store."""
+    merged = pd.read_csv(merged_csv, dtype=str)
+    frames = []
+    solvers = sorted({col.split(".")[0] for col in merged.columns if "." in col})
+    for solver in solvers:
+        cols = [col for col in merged.columns if col.startswith(solver + ".")]
+        frame = merged[["name"] + cols].rename(
+            columns={col: col[len(solver) + 1 :] for col in cols}
+        )
+        obj = pd.to_numeric(frame["obj"], errors="coerce")
+        solved = obj.abs() <= MAX_ABS_VALUE
+        frame["obj"] = obj.where(solved, np.inf)
+        frame["status"] = np.where(solved, "ok", "failed")
+        frame["solver"] = solver
+        frame["run"] = run
+        frames.append(frame)
+    return typed(pd.concat(frames, ignore_index=True))
+
+
+def append(store, rows):
+    """Append typed rows to a store."""
+    os.makedirs(store, exist_ok=True)
+    # Parts are read in the order of their names, later parts win
+    filename = f"part-{time():017.6f}-{uuid.uuid4().hex[:8]}.parquet"
+    rows.to_parquet(os.path.join(store, filename), index=False)
+    return len(rows)
+
+
+def load(store, columns=None, runs=None, solvers=None):
+    """
+    Load a long table from a store.
+
+    :param columns: columns to read, None for all
+    :param runs: runs to keep, None for all
+    :param solvers: solvers to keep, None for all
+    :return: DataFrame with one row per (run, solver, instance)
+    """
+    keys = ["run", "solver", "name"]
+    columns = (
+        COLUMNS if columns is None else keys + [c for c in columns if c not in keys]
+    )
+    filters = []
+    if runs is not None:
+        filters.append(("run", "in", list(runs)))
+    if solvers is not None:
+        filters.append(("solver", "in", list(solvers)))
+    parts = sorted(f for f in os.listdir(store) if f.endswith(".parquet"))
+    frames = [
+        pd.read_parquet(
+            os.path.join(store, part), columns=columns, filters=filters or None
+        )
+        for part in parts
+    ]
+    if len(frames) == 0:
+        return typed(pd.DataFrame(columns=COLUMNS))[columns]
+    data = pd.concat(frames, ignore_index=True)
+    return data.drop_duplicates(keys, keep="last").reset_index(drop=True)
+
+
+def load_wide(store, solvers, metrics, instances=None, runs=None):
+    """
+    Load results in the layout of the merged csv files.
+
+    :param solvers: solvers, e.g. ["cvx_bonmin", "cvx_shot"]
+    :param metrics: columns per solver, e.g. ["obj", "calc_time"]
+    :param instances: instance set, by default the one of the first solver
+    :return: DataFrame with a column `<solver>.<metric>` per solver and metric
+    """
+    if instances is None:
+        instances = instance_set(solvers[0])
+    data = load(store, columns=metrics, runs=runs, solvers=solvers)
+    # Rows of the same solver in several runs, the last added is used
+    data = data.drop_duplicates(["solver", "name"], keep="last")
+    wide = data.pivot(index="name", columns="solver", values=metrics)
+    wide.columns = [f"{solver}.{metric}" for metric, solver in wide.columns]
+    wide = instances.merge(wide, how="left", left_on="name", right_index=True)
+    for solver in solvers:
+        for metric in metrics:
+            col = f"{solver}.{metric}"
+            if col not in wide:
+                wide[col] = np.nan
+            wide[col] = wide[col].astype("float64")
+            if metric in ("obj", "dual_obj"):
+                wide[col] = wide[col].fillna(np.inf)
+    return wide
+
+
+def read_table(source, solvers, metrics):
+    """Read a merged csv file or load the same columns from a store."""
+    if os.path.isdir(source):
+        return load_wide(source, solvers, metrics)
+    return pd.read_csv(source)
+
+
+if __name__ == "__main__":
+    if len(argv) < 5 or argv[1] not in ("add", "import"):
+        print("Usage: python results_store.py add <store> <run> <solver>=<source> ...")
+        print("       python results_store.py import <store> <run> <merged.csv> ...")
+        exit(1)
+
+    command, store, run = argv[1:4]
+    for arg in argv[4:]:
+        if command == "add":
+            solver, source = arg.split("=", 1)
+            if not os.path.exists(source):
+                print(f"Warning: File not found: {source}")
+                continue
+            rows = solver_rows(read_source(source), solver, run)
+        else:
+            rows = merged_rows(arg, run)
+        print(f"Added {append(store, rows)} rows of {arg}")
@@ -2,44 +2,48 @@
 # Copyright (C) 2025  Andrea Ghezzi, Wim Van Roy, Sebastian Sager, Moritz Diehl
 # SPDX-License-Identifier: GPL-3.0-or-later
 
-if [ "$#" -ne 3]; then
+if [ "$#" -ne 3 ]; then
     echo "Usage: $0 <mode> <path_to_file> <path_to_output>"
     echo "modes: compare, alpha, rho"
     echo "path_to_file: path to the folder with nl instances"
     echo "path_to_output: path to the folder to save the results"
+    echo "Set WORKERS to limit the number of concurrent solves (default: number of cores)"
+    echo "Set RACE=1 to drop dominated values of alpha and rho early, cf. racing.py"
     exit 1
 fi
 
 mode=$1
 path_to_file=$2
 path_to_output=$3
+workers=${WORKERS:-$(nproc)}
 
 mkdir -p $path_to_output
 
+# The instance lists, solvers and settings are in benchmark/experiments.json
 # REMOVED $path_to_file/ibs2.nl from camino lists!
 case "$mode" in
     compare)
         echo "Running comparison mode..."
+        python benchmark/parallel_runner.py compare $path_to_file $path_to_output --workers $workers
 
-        python -m camino batch s-b-miqp $path_to_output/cvx_sbmiqp $path_to_file/batch.nl $path_to_file/batch0812.nl $path_to_file/batchdes.nl $path_to_file/batchs101006m.nl $path_to_file/batchs121208m.nl $path_to_file/batchs151208m.nl $path_to_file/batchs201210m.nl $path_to_file/clay0203hfsg.nl $path_to_file/clay0204hfsg.nl $path_to_file/clay0205hfsg.nl $path_to_file/clay0303hfsg.nl $path_to_file/clay0304hfsg.nl $path_to_file/clay0305hfsg.nl $path_to_file/cvxnonsep_normcon20.nl $path_to_file/cvxnonsep_normcon30.nl $path_to_file/cvxnonsep_normcon40.nl $path_to_file/cvxnonsep_nsig20.nl $path_to_file/cvxnonsep_nsig20r.nl $path_to_file/cvxnonsep_nsig30.nl $path_to_file/cvxnonsep_nsig30r.nl $path_to_file/cvxnonsep_nsig40.nl $path_to_file/cvxnonsep_nsig40r.nl $path_to_file/cvxnonsep_pcon20.nl $path_to_file/cvxnonsep_pcon20r.nl $path_to_file/cvxnonsep_pcon30.nl $path_to_file/cvxnonsep_pcon30r.nl $path_to_file/cvxnonsep_pcon40.nl $path_to_file/cvxnonsep_pcon40r.nl $path_to_file/cvxnonsep_psig20.nl $path_to_file/cvxnonsep_psig20r.nl $path_to_file/cvxnonsep_psig30.nl $path_to_file/cvxnonsep_psig30r.nl $path_to_file/cvxnonsep_psig40.nl $path_to_file/cvxnonsep_psig40r.nl $path_to_file/enpro48pb.nl $path_to_file/enpro56pb.nl $path_to_file/ex1223.nl $path_to_file/ex1223b.nl $path_to_file/fac1.nl $path_to_file/fac2.nl $path_to_file/flay02h.nl $path_to_file/flay02m.nl $path_to_file/flay03h.nl $path_to_file/flay03m.nl $path_to_file/flay04h.nl $path_to_file/flay04m.nl $path_to_file/flay05h.nl $path_to_file/flay05m.nl $path_to_file/flay06h.nl $path_to_file/flay06m.nl $path_to_file/fo7.nl $path_to_file/fo7_2.nl $path_to_file/fo7_ar25_1.nl $path_to_file/fo7_ar2_1.nl $path_to_file/fo7_ar3_1.nl $path_to_file/fo7_ar4_1.nl $path_to_file/fo7_ar5_1.nl $path_to_file/fo8.nl $path_to_file/fo8_ar25_1.nl $path_to_file/fo8_ar2_1.nl $path_to_file/fo8_ar3_1.nl $path_to_file/fo8_ar4_1.nl $path_to_file/fo8_ar5_1.nl $path_to_file/fo9.nl $path_to_file/fo9_ar25_1.nl $path_to_file/fo9_ar2_1.nl $path_to_file/fo9_ar3_1.nl $path_to_file/fo9_ar4_1.nl $path_to_file/fo9_ar5_1.nl $path_to_file/gams01.nl $path_to_file/jit1.nl $path_to_file/m3.nl $path_to_file/m6.nl $path_to_file/m7.nl $path_to_file/m7_ar25_1.nl $path_to_file/m7_ar2_1.nl $path_to_file/m7_ar3_1.nl $path_to_file/m7_ar4_1.nl $path_to_file/m7_ar5_1.nl $path_to_file/no7_ar25_1.nl $path_to_file/no7_ar2_1.nl $path_to_file/no7_ar3_1.nl $path_to_file/no7_ar4_1.nl $path_to_file/no7_ar5_1.nl $path_to_file/o7.nl $path_to_file/o7_2.nl $path_to_file/o7_ar25_1.nl $path_to_file/o7_ar2_1.nl $path_to_file/o7_ar3_1.nl $path_to_file/o7_ar4_1.nl $path_to_file/o7_ar5_1.nl $path_to_file/o8_ar4_1.nl $path_to_file/o9_ar4_1.nl $path_to_file/p_ball_10b_5p_2d_h.nl $path_to_file/p_ball_10b_5p_3d_h.nl $path_to_file/p_ball_10b_5p_4d_h.nl $path_to_file/p_ball_10b_7p_3d_h.nl $path_to_file/p_ball_15b_5p_2d_h.nl $path_to_file/p_ball_20b_5p_2d_h.nl $path_to_file/p_ball_20b_5p_3d_h.nl $path_to_file/p_ball_30b_10p_2d_h.nl $path_to_file/p_ball_30b_5p_2d_h.nl $path_to_file/p_ball_30b_5p_3d_h.nl $path_to_file/p_ball_30b_7p_2d_h.nl $path_to_file/p_ball_40b_5p_3d_h.nl $path_to_file/p_ball_40b_5p_4d_h.nl $path_to_file/portfol_buyin.nl $path_to_file/portfol_card.nl $path_to_file/portfol_roundlot.nl $path_to_file/procurement2mot.nl $path_to_file/ravempb.nl $path_to_file/risk2bpb.nl $path_to_file/rsyn0805hfsg.nl $path_to_file/rsyn0805m.nl $path_to_file/rsyn0805m02hfsg.nl $path_to_file/rsyn0805m02m.nl $path_to_file/rsyn0805m03hfsg.nl $path_to_file/rsyn0805m03m.nl $path_to_file/rsyn0805m04hfsg.nl $path_to_file/rsyn0805m04m.nl $path_to_file/rsyn0810hfsg.nl $path_to_file/rsyn0810m.nl $path_to_file/rsyn0810m02hfsg.nl $path_to_file/rsyn0810m02m.nl $path_to_file/rsyn0810m03hfsg.nl $path_to_file/rsyn0810m03m.nl $path_to_file/rsyn0810m04hfsg.nl $path_to_file/rsyn0810m04m.nl $path_to_file/rsyn0815hfsg.nl $path_to_file/rsyn0815m.nl $path_to_file/rsyn0815m02hfsg.nl $path_to_file/rsyn0815m02m.nl $path_to_file/rsyn0815m03hfsg.nl $path_to_file/rsyn0815m03m.nl $path_to_file/rsyn0815m04hfsg.nl $path_to_file/rsyn0815m04m.nl $path_to_file/rsyn0820hfsg.nl $path_to_file/rsyn0820m.nl $path_to_file/rsyn0820m02hfsg.nl $path_to_file/rsyn0820m02m.nl $path_to_file/rsyn0820m03hfsg.nl $path_to_file/rsyn0820m03m.nl $path_to_file/rsyn0820m04hfsg.nl $path_to_file/rsyn0820m04m.nl $path_to_file/rsyn0830hfsg.nl $path_to_file/rsyn0830m.nl $path_to_file/rsyn0830m02hfsg.nl $path_to_file/rsyn0830m02m.nl $path_to_file/rsyn0830m03hfsg.nl $path_to_file/rsyn0830m03m.nl $path_to_file/rsyn0830m04hfsg.nl $path_to_file/rsyn0830m04m.nl $path_to_file/rsyn0840hfsg.nl $path_to_file/rsyn0840m.nl $path_to_file/rsyn0840m02hfsg.nl $path_to_file/rsyn0840m02m.nl $path_to_file/rsyn0840m03hfsg.nl $path_to_file/rsyn0840m03m.nl $path_to_file/rsyn0840m04hfsg.nl $path_to_file/rsyn0840m04m.nl $path_to_file/sssd08-04.nl $path_to_file/sssd12-05.nl $path_to_file/sssd15-04.nl $path_to_file/sssd15-06.nl $path_to_file/sssd15-08.nl $path_to_file/sssd16-07.nl $path_to_file/sssd18-06.nl $path_to_file/sssd18-08.nl $path_to_file/sssd20-04.nl $path_to_file/sssd20-08.nl $path_to_file/sssd22-08.nl $path_to_file/sssd25-04.nl $path_to_file/sssd25-08.nl $path_to_file/st_e14.nl $path_to_file/stockcycle.nl $path_to_file/syn05hfsg.nl $path_to_file/syn05m.nl $path_to_file/syn05m02hfsg.nl $path_to_file/syn05m02m.nl $path_to_file/syn05m03hfsg.nl $path_to_file/syn05m03m.nl $path_to_file/syn05m04hfsg.nl $path_to_file/syn05m04m.nl $path_to_file/syn10hfsg.nl $path_to_file/syn10m.nl $path_to_file/syn10m02hfsg.nl $path_to_file/syn10m02m.nl $path_to_file/syn10m03hfsg.nl $path_to_file/syn10m03m.nl $path_to_file/syn10m04hfsg.nl $path_to_file/syn10m04m.nl $path_to_file/syn15hfsg.nl $path_to_file/syn15m.nl $path_to_file/syn15m02hfsg.nl $path_to_file/syn15m02m.nl $path_to_file/syn15m03hfsg.nl $path_to_file/syn15m03m.nl $path_to_file/syn15m04hfsg.nl $path_to_file/syn15m04m.nl $path_to_file/syn20hfsg.nl $path_to_file/syn20m.nl $path_to_file/syn20m02hfsg.nl $path_to_file/syn20m02m.nl $path_to_file/syn20m03hfsg.nl $path_to_file/syn20m03m.nl $path_to_file/syn20m04hfsg.nl $path_to_file/syn20m04m.nl $path_to_file/syn30hfsg.nl $path_to_file/syn30m.nl $path_to_file/syn30m02hfsg.nl $path_to_file/syn30m02m.nl $path_to_file/syn30m03hfsg.nl $path_to_file/syn30m03m.nl $path_to_file/syn30m04hfsg.nl $path_to_file/syn30m04m.nl $path_to_file/syn40hfsg.nl $path_to_file/syn40m.nl $path_to_file/syn40m02hfsg.nl $path_to_file/syn40m02m.nl $path_to_file/syn40m03hfsg.nl $path_to_file/syn40m03m.nl $path_to_file/syn40m04hfsg.nl $path_to_file/syn40m04m.nl $path_to_file/synthes1.nl $path_to_file/synthes2.nl $path_to_file/synthes3.nl $path_to_file/tls12.nl $path_to_file/tls2.nl $path_to_file/tls4.nl $path_to_file/tls5.nl $path_to_file/tls6.nl $path_to_file/tls7.nl
-        python -m camino batch s-b-miqp $path_to_output/noncvx_sbmiqp $path_to_file/4stufen.nl $path_to_file/autocorr_bern20-05.nl $path_to_file/autocorr_bern20-10.nl $path_to_file/autocorr_bern20-15.nl $path_to_file/autocorr_bern25-06.nl $path_to_file/autocorr_bern25-13.nl $path_to_file/autocorr_bern25-19.nl $path_to_file/autocorr_bern25-25.nl $path_to_file/autocorr_bern30-04.nl $path_to_file/autocorr_bern30-08.nl $path_to_file/autocorr_bern30-15.nl $path_to_file/autocorr_bern30-23.nl $path_to_file/autocorr_bern30-30.nl $path_to_file/autocorr_bern35-04.nl $path_to_file/autocorr_bern35-09.nl $path_to_file/autocorr_bern35-18.nl $path_to_file/autocorr_bern35-26.nl $path_to_file/autocorr_bern35-35fix.nl $path_to_file/autocorr_bern40-05.nl $path_to_file/autocorr_bern40-10.nl $path_to_file/autocorr_bern40-20.nl $path_to_file/autocorr_bern40-30.nl $path_to_file/autocorr_bern40-40.nl $path_to_file/autocorr_bern45-05.nl $path_to_file/autocorr_bern45-11.nl $path_to_file/autocorr_bern45-23.nl $path_to_file/autocorr_bern45-34.nl $path_to_file/autocorr_bern45-45.nl $path_to_file/autocorr_bern50-06.nl $path_to_file/autocorr_bern50-13.nl $path_to_file/autocorr_bern50-25.nl $path_to_file/autocorr_bern50-38.nl $path_to_file/autocorr_bern50-50.nl $path_to_file/autocorr_bern55-06.nl $path_to_file/autocorr_bern55-14.nl $path_to_file/autocorr_bern55-28.nl $path_to_file/autocorr_bern55-41.nl $path_to_file/autocorr_bern55-55.nl $path_to_file/autocorr_bern60-08.nl $path_to_file/autocorr_bern60-15.nl $path_to_file/autocorr_bern60-30.nl $path_to_file/autocorr_bern60-45.nl $path_to_file/autocorr_bern60-60.nl $path_to_file/batch0812_nc.nl $path_to_file/batch_nc.nl $path_to_file/beuster.nl $path_to_file/casctanks.nl $path_to_file/case_1scv2.nl $path_to_file/cecil_13.nl $path_to_file/chp_partload.nl $path_to_file/chp_shorttermplan1a.nl $path_to_file/chp_shorttermplan1b.nl $path_to_file/chp_shorttermplan2a.nl $path_to_file/chp_shorttermplan2b.nl $path_to_file/chp_shorttermplan2c.nl $path_to_file/chp_shorttermplan2d.nl $path_to_file/contvar.nl $path_to_file/csched1.nl $path_to_file/csched1a.nl $path_to_file/csched2.nl $path_to_file/csched2a.nl $path_to_file/deb10.nl $path_to_file/deb6.nl $path_to_file/deb7.nl $path_to_file/deb8.nl $path_to_file/deb9.nl $path_to_file/eg_all_s.nl $path_to_file/eg_disc2_s.nl $path_to_file/eg_disc_s.nl $path_to_file/eg_int_s.nl $path_to_file/eniplac.nl $path_to_file/ex1221.nl $path_to_file/ex1222.nl $path_to_file/ex1224.nl $path_to_file/ex1225.nl $path_to_file/ex1226.nl $path_to_file/ex1233.nl $path_to_file/ex1243.nl $path_to_file/ex1244.nl $path_to_file/ex1252.nl $path_to_file/ex1252a.nl $path_to_file/ex3pb.nl $path_to_file/feedtray.nl $path_to_file/fin2bb.nl $path_to_file/gams02.nl $path_to_file/gams04.nl $path_to_file/gasnet.nl $path_to_file/gastrans.nl $path_to_file/gastrans040.nl $path_to_file/gastrans135.nl $path_to_file/gastrans582_cold13.nl $path_to_file/gastrans582_cold13_95.nl $path_to_file/gastrans582_cold17.nl $path_to_file/gastrans582_cold17_95.nl $path_to_file/gastrans582_cool12.nl $path_to_file/gastrans582_cool12_95.nl $path_to_file/gastrans582_cool14.nl $path_to_file/gastrans582_cool14_95.nl $path_to_file/gastrans582_freezing27.nl $path_to_file/gastrans582_freezing27_95.nl $path_to_file/gastrans582_freezing30.nl $path_to_file/gastrans582_freezing30_95.nl $path_to_file/gastrans582_mild10.nl $path_to_file/gastrans582_mild10_95.nl $path_to_file/gastrans582_mild11.nl $path_to_file/gastrans582_mild11_95.nl $path_to_file/gastrans582_warm15.nl $path_to_file/gastrans582_warm15_95.nl $path_to_file/gastrans582_warm31.nl $path_to_file/gastrans582_warm31_95.nl $path_to_file/gear4.nl $path_to_file/ghg_1veh.nl $path_to_file/ghg_2veh.nl $path_to_file/ghg_3veh.nl $path_to_file/gkocis.nl $path_to_file/hadamard_4.nl $path_to_file/hadamard_5.nl $path_to_file/hadamard_6.nl $path_to_file/hadamard_7.nl $path_to_file/hadamard_8.nl $path_to_file/hadamard_9.nl $path_to_file/hda.nl $path_to_file/heatexch_gen1.nl $path_to_file/heatexch_gen2.nl $path_to_file/heatexch_gen3.nl $path_to_file/heatexch_spec1.nl $path_to_file/heatexch_spec2.nl $path_to_file/heatexch_spec3.nl $path_to_file/heatexch_trigen.nl $path_to_file/hybriddynamic_var.nl $path_to_file/johnall.nl $path_to_file/kan_peaks_h1_n2_g24.nl $path_to_file/kan_peaks_h1_n2_g3.nl $path_to_file/kan_peaks_h1_n5.nl $path_to_file/kan_r3_h1_n3.nl $path_to_file/kan_r3_h1_n4.nl $path_to_file/kan_r3_h1_n5.nl $path_to_file/kan_r3_h1_n9.nl $path_to_file/kan_r5_h1_n3.nl $path_to_file/kan_r5_h1_n5.nl $path_to_file/kan_r5_h1_n8.nl $path_to_file/kport20.nl $path_to_file/kport40.nl $path_to_file/lip.nl $path_to_file/mbtd.nl $path_to_file/milinfract.nl $path_to_file/multiplants_mtg1a.nl $path_to_file/multiplants_mtg1b.nl $path_to_file/multiplants_mtg1c.nl $path_to_file/multiplants_mtg2.nl $path_to_file/multiplants_mtg5.nl $path_to_file/multiplants_mtg6.nl $path_to_file/multiplants_stg1.nl $path_to_file/multiplants_stg1a.nl $path_to_file/multiplants_stg1b.nl $path_to_file/multiplants_stg1c.nl $path_to_file/multiplants_stg5.nl $path_to_file/multiplants_stg6.nl $path_to_file/nvs01.nl $path_to_file/nvs05.nl $path_to_file/nvs08.nl $path_to_file/nvs21.nl $path_to_file/nvs22.nl $path_to_file/oaer.nl $path_to_file/oil.nl $path_to_file/oil2.nl $path_to_file/ortez.nl $path_to_file/parallel.nl $path_to_file/pooling_epa1.nl $path_to_file/pooling_epa2.nl $path_to_file/pooling_epa3.nl $path_to_file/primary.nl $path_to_file/procsel.nl $path_to_file/saa_2.nl $path_to_file/sepasequ_complex.nl $path_to_file/sepasequ_convent.nl $path_to_file/sfacloc1_2_80.nl $path_to_file/sfacloc1_2_90.nl $path_to_file/sfacloc1_2_95.nl $path_to_file/sfacloc1_3_80.nl $path_to_file/sfacloc1_3_90.nl $path_to_file/sfacloc1_3_95.nl $path_to_file/sfacloc1_4_80.nl $path_to_file/sfacloc1_4_90.nl $path_to_file/sfacloc1_4_95.nl $path_to_file/sfacloc2_2_80.nl $path_to_file/sfacloc2_2_90.nl $path_to_file/sfacloc2_2_95.nl $path_to_file/sfacloc2_3_80.nl $path_to_file/sfacloc2_3_90.nl $path_to_file/sfacloc2_3_95.nl $path_to_file/sfacloc2_4_80.nl $path_to_file/sfacloc2_4_90.nl $path_to_file/sfacloc2_4_95.nl $path_to_file/spring.nl $path_to_file/st_e15.nl $path_to_file/st_e29.nl $path_to_file/st_e32.nl $path_to_file/st_e35.nl $path_to_file/st_e36.nl $path_to_file/st_e38.nl $path_to_file/st_e40.nl $path_to_file/super3t.nl $path_to_file/supplychainp1_020306.nl $path_to_file/supplychainp1_022020.nl $path_to_file/supplychainp1_030510.nl $path_to_file/supplychainp1_053050.nl $path_to_file/supplychainr1_020306.nl $path_to_file/supplychainr1_022020.nl $path_to_file/supplychainr1_030510.nl $path_to_file/supplychainr1_053050.nl $path_to_file/synheat.nl $path_to_file/tanksize.nl $path_to_file/transswitch0009p.nl $path_to_file/transswitch0009r.nl $path_to_file/transswitch0014p.nl $path_to_file/transswitch0014r.nl $path_to_file/transswitch0030p.nl $path_to_file/transswitch0030r.nl $path_to_file/transswitch0039p.nl $path_to_file/transswitch0039r.nl $path_to_file/transswitch0057p.nl $path_to_file/transswitch0057r.nl $path_to_file/transswitch0118p.nl $path_to_file/transswitch0118r.nl $path_to_file/transswitch0300p.nl $path_to_file/transswitch0300r.nl $path_to_file/transswitch2383wpp.nl $path_to_file/transswitch2383wpr.nl $path_to_file/transswitch2736spp.nl $path_to_file/transswitch2736spr.nl $path_to_file/tspn05.nl $path_to_file/tspn08.nl $path_to_file/tspn10.nl $path_to_file/tspn12.nl $path_to_file/tspn15.nl $path_to_file/unitcommit2.nl $path_to_file/uselinear.nl $path_to_file/var_con10.nl $path_to_file/var_con5.nl $path_to_file/wager.nl $path_to_file/wastepaper3.nl $path_to_file/wastepaper4.nl $path_to_file/wastepaper5.nl $path_to_file/wastepaper6.nl $path_to_file/water4.nl $path_to_file/waternd1.nl $path_to_file/waternd2.nl $path_to_file/waterno2_01.nl $path_to_file/waterno2_02.nl $path_to_file/waterno2_03.nl $path_to_file/waterno2_04.nl $path_to_file/waterno2_06.nl $path_to_file/waterno2_09.nl $path_to_file/waterno2_12.nl $path_to_file/waterno2_18.nl $path_to_file/waterno2_24.nl $path_to_file/watertreatnd_conc.nl $path_to_file/watertreatnd_flow.nl $path_to_file/waterx.nl $path_to_file/waterz.nl $path_to_file/windfac.nl
-
-        python -m camino batch bonmin $path_to_output/cvx_bonmin $path_to_file/batch.nl $path_to_file/batch0812.nl $path_to_file/batchdes.nl $path_to_file/batchs101006m.nl $path_to_file/batchs121208m.nl $path_to_file/batchs151208m.nl $path_to_file/batchs201210m.nl $path_to_file/clay0203hfsg.nl $path_to_file/clay0204hfsg.nl $path_to_file/clay0205hfsg.nl $path_to_file/clay0303hfsg.nl $path_to_file/clay0304hfsg.nl $path_to_file/clay0305hfsg.nl $path_to_file/cvxnonsep_normcon20.nl $path_to_file/cvxnonsep_normcon30.nl $path_to_file/cvxnonsep_normcon40.nl $path_to_file/cvxnonsep_nsig20.nl $path_to_file/cvxnonsep_nsig20r.nl $path_to_file/cvxnonsep_nsig30.nl $path_to_file/cvxnonsep_nsig30r.nl $path_to_file/cvxnonsep_nsig40.nl $path_to_file/cvxnonsep_nsig40r.nl $path_to_file/cvxnonsep_pcon20.nl $path_to_file/cvxnonsep_pcon20r.nl $path_to_file/cvxnonsep_pcon30.nl $path_to_file/cvxnonsep_pcon30r.nl $path_to_file/cvxnonsep_pcon40.nl $path_to_file/cvxnonsep_pcon40r.nl $path_to_file/cvxnonsep_psig20.nl $path_to_file/cvxnonsep_psig20r.nl $path_to_file/cvxnonsep_psig30.nl $path_to_file/cvxnonsep_psig30r.nl $path_to_file/cvxnonsep_psig40.nl $path_to_file/cvxnonsep_psig40r.nl $path_to_file/enpro48pb.nl $path_to_file/enpro56pb.nl $path_to_file/ex1223.nl $path_to_file/ex1223b.nl $path_to_file/fac1.nl $path_to_file/fac2.nl $path_to_file/flay02h.nl $path_to_file/flay02m.nl $path_to_file/flay03h.nl $path_to_file/flay03m.nl $path_to_file/flay04h.nl $path_to_file/flay04m.nl $path_to_file/flay05h.nl $path_to_file/flay05m.nl $path_to_file/flay06h.nl $path_to_file/flay06m.nl $path_to_file/fo7.nl $path_to_file/fo7_2.nl $path_to_file/fo7_ar25_1.nl $path_to_file/fo7_ar2_1.nl $path_to_file/fo7_ar3_1.nl $path_to_file/fo7_ar4_1.nl $path_to_file/fo7_ar5_1.nl $path_to_file/fo8.nl $path_to_file/fo8_ar25_1.nl $path_to_file/fo8_ar2_1.nl $path_to_file/fo8_ar3_1.nl $path_to_file/fo8_ar4_1.nl $path_to_file/fo8_ar5_1.nl $path_to_file/fo9.nl $path_to_file/fo9_ar25_1.nl $path_to_file/fo9_ar2_1.nl $path_to_file/fo9_ar3_1.nl $path_to_file/fo9_ar4_1.nl $path_to_file/fo9_ar5_1.nl $path_to_file/gams01.nl $path_to_file/jit1.nl $path_to_file/m3.nl $path_to_file/m6.nl $path_to_file/m7.nl $path_to_file/m7_ar25_1.nl $path_to_file/m7_ar2_1.nl $path_to_file/m7_ar3_1.nl $path_to_file/m7_ar4_1.nl $path_to_file/m7_ar5_1.nl $path_to_file/no7_ar25_1.nl $path_to_file/no7_ar2_1.nl $path_to_file/no7_ar3_1.nl $path_to_file/no7_ar4_1.nl $path_to_file/no7_ar5_1.nl $path_to_file/o7.nl $path_to_file/o7_2.nl $path_to_file/o7_ar25_1.nl $path_to_file/o7_ar2_1.nl $path_to_file/o7_ar3_1.nl $path_to_file/o7_ar4_1.nl $path_to_file/o7_ar5_1.nl $path_to_file/o8_ar4_1.nl $path_to_file/o9_ar4_1.nl $path_to_file/p_ball_10b_5p_2d_h.nl $path_to_file/p_ball_10b_5p_3d_h.nl $path_to_file/p_ball_10b_5p_4d_h.nl $path_to_file/p_ball_10b_7p_3d_h.nl $path_to_file/p_ball_15b_5p_2d_h.nl $path_to_file/p_ball_20b_5p_2d_h.nl $path_to_file/p_ball_20b_5p_3d_h.nl $path_to_file/p_ball_30b_10p_2d_h.nl $path_to_file/p_ball_30b_5p_2d_h.nl $path_to_file/p_ball_30b_5p_3d_h.nl $path_to_file/p_ball_30b_7p_2d_h.nl $path_to_file/p_ball_40b_5p_3d_h.nl $path_to_file/p_ball_40b_5p_4d_h.nl $path_to_file/portfol_buyin.nl $path_to_file/portfol_card.nl $path_to_file/portfol_roundlot.nl $path_to_file/procurement2mot.nl $path_to_file/ravempb.nl $path_to_file/risk2bpb.nl $path_to_file/rsyn0805hfsg.nl $path_to_file/rsyn0805m.nl $path_to_file/rsyn0805m02hfsg.nl $path_to_file/rsyn0805m02m.nl $path_to_file/rsyn0805m03hfsg.nl $path_to_file/rsyn0805m03m.nl $path_to_file/rsyn0805m04hfsg.nl $path_to_file/rsyn0805m04m.nl $path_to_file/rsyn0810hfsg.nl $path_to_file/rsyn0810m.nl $path_to_file/rsyn0810m02hfsg.nl $path_to_file/rsyn0810m02m.nl $path_to_file/rsyn0810m03hfsg.nl $path_to_file/rsyn0810m03m.nl $path_to_file/rsyn0810m04hfsg.nl $path_to_file/rsyn0810m04m.nl $path_to_file/rsyn0815hfsg.nl $path_to_file/rsyn0815m.nl $path_to_file/rsyn0815m02hfsg.nl $path_to_file/rsyn0815m02m.nl $path_to_file/rsyn0815m03hfsg.nl $path_to_file/rsyn0815m03m.nl $path_to_file/rsyn0815m04hfsg.nl $path_to_file/rsyn0815m04m.nl $path_to_file/rsyn0820hfsg.nl $path_to_file/rsyn0820m.nl $path_to_file/rsyn0820m02hfsg.nl $path_to_file/rsyn0820m02m.nl $path_to_file/rsyn0820m03hfsg.nl $path_to_file/rsyn0820m03m.nl $path_to_file/rsyn0820m04hfsg.nl $path_to_file/rsyn0820m04m.nl $path_to_file/rsyn0830hfsg.nl $path_to_file/rsyn0830m.nl $path_to_file/rsyn0830m02hfsg.nl $path_to_file/rsyn0830m02m.nl $path_to_file/rsyn0830m03hfsg.nl $path_to_file/rsyn0830m03m.nl $path_to_file/rsyn0830m04hfsg.nl $path_to_file/rsyn0830m04m.nl $path_to_file/rsyn0840hfsg.nl $path_to_file/rsyn0840m.nl $path_to_file/rsyn0840m02hfsg.nl $path_to_file/rsyn0840m02m.nl $path_to_file/rsyn0840m03hfsg.nl $path_to_file/rsyn0840m03m.nl $path_to_file/rsyn0840m04hfsg.nl $path_to_file/rsyn0840m04m.nl $path_to_file/sssd08-04.nl $path_to_file/sssd12-05.nl $path_to_file/sssd15-04.nl $path_to_file/sssd15-06.nl $path_to_file/sssd15-08.nl $path_to_file/sssd16-07.nl $path_to_file/sssd18-06.nl $path_to_file/sssd18-08.nl $path_to_file/sssd20-04.nl $path_to_file/sssd20-08.nl $path_to_file/sssd22-08.nl $path_to_file/sssd25-04.nl $path_to_file/sssd25-08.nl $path_to_file/st_e14.nl $path_to_file/stockcycle.nl $path_to_file/syn05hfsg.nl $path_to_file/syn05m.nl $path_to_file/syn05m02hfsg.nl $path_to_file/syn05m02m.nl $path_to_file/syn05m03hfsg.nl $path_to_file/syn05m03m.nl $path_to_file/syn05m04hfsg.nl $path_to_file/syn05m04m.nl $path_to_file/syn10hfsg.nl $path_to_file/syn10m.nl $path_to_file/syn10m02hfsg.nl $path_to_file/syn10m02m.nl $path_to_file/syn10m03hfsg.nl $path_to_file/syn10m03m.nl $path_to_file/syn10m04hfsg.nl $path_to_file/syn10m04m.nl $path_to_file/syn15hfsg.nl $path_to_file/syn15m.nl $path_to_file/syn15m02hfsg.nl $path_to_file/syn15m02m.nl $path_to_file/syn15m03hfsg.nl $path_to_file/syn15m03m.nl $path_to_file/syn15m04hfsg.nl $path_to_file/syn15m04m.nl $path_to_file/syn20hfsg.nl $path_to_file/syn20m.nl $path_to_file/syn20m02hfsg.nl $path_to_file/syn20m02m.nl $path_to_file/syn20m03hfsg.nl $path_to_file/syn20m03m.nl $path_to_file/syn20m04hfsg.nl $path_to_file/syn20m04m.nl $path_to_file/syn30hfsg.nl $path_to_file/syn30m.nl $path_to_file/syn30m02hfsg.nl $path_to_file/syn30m02m.nl $path_to_file/syn30m03hfsg.nl $path_to_file/syn30m03m.nl $path_to_file/syn30m04hfsg.nl $path_to_file/syn30m04m.nl $path_to_file/syn40hfsg.nl $path_to_file/syn40m.nl $path_to_file/syn40m02hfsg.nl $path_to_file/syn40m02m.nl $path_to_file/syn40m03hfsg.nl $path_to_file/syn40m03m.nl $path_to_file/syn40m04hfsg.nl $path_to_file/syn40m04m.nl $path_to_file/synthes1.nl $path_to_file/synthes2.nl $path_to_file/synthes3.nl $path_to_file/tls12.nl $path_to_file/tls2.nl $path_to_file/tls4.nl $path_to_file/tls5.nl $path_to_file/tls6.nl $path_to_file/tls7.nl
-        python -m camino batch bonmin $path_to_output/noncvx_bonmin $path_to_file/4stufen.nl $path_to_file/autocorr_bern20-05.nl $path_to_file/autocorr_bern20-10.nl $path_to_file/autocorr_bern20-15.nl $path_to_file/autocorr_bern25-06.nl $path_to_file/autocorr_bern25-13.nl $path_to_file/autocorr_bern25-19.nl $path_to_file/autocorr_bern25-25.nl $path_to_file/autocorr_bern30-04.nl $path_to_file/autocorr_bern30-08.nl $path_to_file/autocorr_bern30-15.nl $path_to_file/autocorr_bern30-23.nl $path_to_file/autocorr_bern30-30.nl $path_to_file/autocorr_bern35-04.nl $path_to_file/autocorr_bern35-09.nl $path_to_file/autocorr_bern35-18.nl $path_to_file/autocorr_bern35-26.nl $path_to_file/autocorr_bern35-35fix.nl $path_to_file/autocorr_bern40-05.nl $path_to_file/autocorr_bern40-10.nl $path_to_file/autocorr_bern40-20.nl $path_to_file/autocorr_bern40-30.nl $path_to_file/autocorr_bern40-40.nl $path_to_file/autocorr_bern45-05.nl $path_to_file/autocorr_bern45-11.nl $path_to_file/autocorr_bern45-23.nl $path_to_file/autocorr_bern45-34.nl $path_to_file/autocorr_bern45-45.nl $path_to_file/autocorr_bern50-06.nl $path_to_file/autocorr_bern50-13.nl $path_to_file/autocorr_bern50-25.nl $path_to_file/autocorr_bern50-38.nl $path_to_file/autocorr_bern50-50.nl $path_to_file/autocorr_bern55-06.nl $path_to_file/autocorr_bern55-14.nl $path_to_file/autocorr_bern55-28.nl $path_to_file/autocorr_bern55-41.nl $path_to_file/autocorr_bern55-55.nl $path_to_file/autocorr_bern60-08.nl $path_to_file/autocorr_bern60-15.nl $path_to_file/autocorr_bern60-30.nl $path_to_file/autocorr_bern60-45.nl $path_to_file/autocorr_bern60-60.nl $path_to_file/batch0812_nc.nl $path_to_file/batch_nc.nl $path_to_file/beuster.nl $path_to_file/casctanks.nl $path_to_file/case_1scv2.nl $path_to_file/cecil_13.nl $path_to_file/chp_partload.nl $path_to_file/chp_shorttermplan1a.nl $path_to_file/chp_shorttermplan1b.nl $path_to_file/chp_shorttermplan2a.nl $path_to_file/chp_shorttermplan2b.nl $path_to_file/chp_shorttermplan2c.nl $path_to_file/chp_shorttermplan2d.nl $path_to_file/contvar.nl $path_to_file/csched1.nl $path_to_file/csched1a.nl $path_to_file/csched2.nl $path_to_file/csched2a.nl $path_to_file/deb10.nl $path_to_file/deb6.nl $path_to_file/deb7.nl $path_to_file/deb8.nl $path_to_file/deb9.nl $path_to_file/eg_all_s.nl $path_to_file/eg_disc2_s.nl $path_to_file/eg_disc_s.nl $path_to_file/eg_int_s.nl $path_to_file/eniplac.nl $path_to_file/ex1221.nl $path_to_file/ex1222.nl $path_to_file/ex1224.nl $path_to_file/ex1225.nl $path_to_file/ex1226.nl $path_to_file/ex1233.nl $path_to_file/ex1243.nl $path_to_file/ex1244.nl $path_to_file/ex1252.nl $path_to_file/ex1252a.nl $path_to_file/ex3pb.nl $path_to_file/feedtray.nl $path_to_file/fin2bb.nl $path_to_file/fuzzy.nl $path_to_file/gams02.nl $path_to_file/gams04.nl $path_to_file/gasnet.nl $path_to_file/gastrans.nl $path_to_file/gastrans040.nl $path_to_file/gastrans135.nl $path_to_file/gastrans582_cold13.nl $path_to_file/gastrans582_cold13_95.nl $path_to_file/gastrans582_cold17.nl $path_to_file/gastrans582_cold17_95.nl $path_to_file/gastrans582_cool12.nl $path_to_file/gastrans582_cool12_95.nl $path_to_file/gastrans582_cool14.nl $path_to_file/gastrans582_cool14_95.nl $path_to_file/gastrans582_freezing27.nl $path_to_file/gastrans582_freezing27_95.nl $path_to_file/gastrans582_freezing30.nl $path_to_file/gastrans582_freezing30_95.nl $path_to_file/gastrans582_mild10.nl $path_to_file/gastrans582_mild10_95.nl $path_to_file/gastrans582_mild11.nl $path_to_file/gastrans582_mild11_95.nl $path_to_file/gastrans582_warm15.nl $path_to_file/gastrans582_warm15_95.nl $path_to_file/gastrans582_warm31.nl $path_to_file/gastrans582_warm31_95.nl $path_to_file/gear4.nl $path_to_file/ghg_1veh.nl $path_to_file/ghg_2veh.nl $path_to_file/ghg_3veh.nl $path_to_file/gkocis.nl $path_to_file/hadamard_4.nl $path_to_file/hadamard_5.nl $path_to_file/hadamard_6.nl $path_to_file/hadamard_7.nl $path_to_file/hadamard_8.nl $path_to_file/hadamard_9.nl $path_to_file/hda.nl $path_to_file/heatexch_gen1.nl $path_to_file/heatexch_gen2.nl $path_to_file/heatexch_gen3.nl $path_to_file/heatexch_spec1.nl $path_to_file/heatexch_spec2.nl $path_to_file/heatexch_spec3.nl $path_to_file/heatexch_trigen.nl $path_to_file/hybriddynamic_var.nl $path_to_file/johnall.nl $path_to_file/kan_peaks_h1_n2_g24.nl $path_to_file/kan_peaks_h1_n2_g3.nl $path_to_file/kan_peaks_h1_n5.nl $path_to_file/kan_r3_h1_n3.nl $path_to_file/kan_r3_h1_n4.nl $path_to_file/kan_r3_h1_n5.nl $path_to_file/kan_r3_h1_n9.nl $path_to_file/kan_r5_h1_n3.nl $path_to_file/kan_r5_h1_n5.nl $path_to_file/kan_r5_h1_n8.nl $path_to_file/kport20.nl $path_to_file/kport40.nl $path_to_file/lip.nl $path_to_file/mbtd.nl $path_to_file/milinfract.nl $path_to_file/multiplants_mtg1a.nl $path_to_file/multiplants_mtg1b.nl $path_to_file/multiplants_mtg1c.nl $path_to_file/multiplants_mtg2.nl $path_to_file/multiplants_mtg5.nl $path_to_file/multiplants_mtg6.nl $path_to_file/multiplants_stg1.nl $path_to_file/multiplants_stg1a.nl $path_to_file/multiplants_stg1b.nl $path_to_file/multiplants_stg1c.nl $path_to_file/multiplants_stg5.nl $path_to_file/multiplants_stg6.nl $path_to_file/nvs01.nl $path_to_file/nvs05.nl $path_to_file/nvs08.nl $path_to_file/nvs21.nl $path_to_file/nvs22.nl $path_to_file/oaer.nl $path_to_file/oil.nl $path_to_file/oil2.nl $path_to_file/ortez.nl $path_to_file/parallel.nl $path_to_file/pooling_epa1.nl $path_to_file/pooling_epa2.nl $path_to_file/pooling_epa3.nl $path_to_file/primary.nl $path_to_file/procsel.nl $path_to_file/saa_2.nl $path_to_file/sepasequ_complex.nl $path_to_file/sepasequ_convent.nl $path_to_file/sfacloc1_2_80.nl $path_to_file/sfacloc1_2_90.nl $path_to_file/sfacloc1_2_95.nl $path_to_file/sfacloc1_3_80.nl $path_to_file/sfacloc1_3_90.nl $path_to_file/sfacloc1_3_95.nl $path_to_file/sfacloc1_4_80.nl $path_to_file/sfacloc1_4_90.nl $path_to_file/sfacloc1_4_95.nl $path_to_file/sfacloc2_2_80.nl $path_to_file/sfacloc2_2_90.nl $path_to_file/sfacloc2_2_95.nl $path_to_file/sfacloc2_3_80.nl $path_to_file/sfacloc2_3_90.nl $path_to_file/sfacloc2_3_95.nl $path_to_file/sfacloc2_4_80.nl $path_to_file/sfacloc2_4_90.nl $path_to_file/sfacloc2_4_95.nl $path_to_file/spring.nl $path_to_file/st_e15.nl $path_to_file/st_e29.nl $path_to_file/st_e32.nl $path_to_file/st_e35.nl $path_to_file/st_e36.nl $path_to_file/st_e38.nl $path_to_file/st_e40.nl $path_to_file/super3t.nl $path_to_file/supplychainp1_020306.nl $path_to_file/supplychainp1_022020.nl $path_to_file/supplychainp1_030510.nl $path_to_file/supplychainp1_053050.nl $path_to_file/supplychainr1_020306.nl $path_to_file/supplychainr1_022020.nl $path_to_file/supplychainr1_030510.nl $path_to_file/supplychainr1_053050.nl $path_to_file/synheat.nl $path_to_file/tanksize.nl $path_to_file/transswitch0009p.nl $path_to_file/transswitch0009r.nl $path_to_file/transswitch0014p.nl $path_to_file/transswitch0014r.nl $path_to_file/transswitch0030p.nl $path_to_file/transswitch0030r.nl $path_to_file/transswitch0039p.nl $path_to_file/transswitch0039r.nl $path_to_file/transswitch0057p.nl $path_to_file/transswitch0057r.nl $path_to_file/transswitch0118p.nl $path_to_file/transswitch0118r.nl $path_to_file/transswitch0300p.nl $path_to_file/transswitch0300r.nl $path_to_file/transswitch2383wpp.nl $path_to_file/transswitch2383wpr.nl $path_to_file/transswitch2736spp.nl $path_to_file/transswitch2736spr.nl $path_to_file/tspn05.nl $path_to_file/tspn08.nl $path_to_file/tspn10.nl $path_to_file/tspn12.nl $path_to_file/tspn15.nl $path_to_file/unitcommit2.nl $path_to_file/uselinear.nl $path_to_file/var_con10.nl $path_to_file/var_con5.nl $path_to_file/wager.nl $path_to_file/wastepaper3.nl $path_to_file/wastepaper4.nl $path_to_file/wastepaper5.nl $path_to_file/wastepaper6.nl $path_to_file/water4.nl $path_to_file/waternd1.nl $path_to_file/waternd2.nl $path_to_file/waterno2_01.nl $path_to_file/waterno2_02.nl $path_to_file/waterno2_03.nl $path_to_file/waterno2_04.nl $path_to_file/waterno2_06.nl $path_to_file/waterno2_09.nl $path_to_file/waterno2_12.nl $path_to_file/waterno2_18.nl $path_to_file/waterno2_24.nl $path_to_file/watertreatnd_conc.nl $path_to_file/watertreatnd_flow.nl $path_to_file/waterx.nl $path_to_file/waterz.nl $path_to_file/windfac.nl
-
-        python -m camino batch s-b-miqp-early-exit $path_to_output/cvx_sbmiqp_ee $path_to_file/batch.nl $path_to_file/batch0812.nl $path_to_file/batchdes.nl $path_to_file/batchs101006m.nl $path_to_file/batchs121208m.nl $path_to_file/batchs151208m.nl $path_to_file/batchs201210m.nl $path_to_file/clay0203hfsg.nl $path_to_file/clay0204hfsg.nl $path_to_file/clay0205hfsg.nl $path_to_file/clay0303hfsg.nl $path_to_file/clay0304hfsg.nl $path_to_file/clay0305hfsg.nl $path_to_file/cvxnonsep_normcon20.nl $path_to_file/cvxnonsep_normcon30.nl $path_to_file/cvxnonsep_normcon40.nl $path_to_file/cvxnonsep_nsig20.nl $path_to_file/cvxnonsep_nsig20r.nl $path_to_file/cvxnonsep_nsig30.nl $path_to_file/cvxnonsep_nsig30r.nl $path_to_file/cvxnonsep_nsig40.nl $path_to_file/cvxnonsep_nsig40r.nl $path_to_file/cvxnonsep_pcon20.nl $path_to_file/cvxnonsep_pcon20r.nl $path_to_file/cvxnonsep_pcon30.nl $path_to_file/cvxnonsep_pcon30r.nl $path_to_file/cvxnonsep_pcon40.nl $path_to_file/cvxnonsep_pcon40r.nl $path_to_file/cvxnonsep_psig20.nl $path_to_file/cvxnonsep_psig20r.nl $path_to_file/cvxnonsep_psig30.nl $path_to_file/cvxnonsep_psig30r.nl $path_to_file/cvxnonsep_psig40.nl $path_to_file/cvxnonsep_psig40r.nl $path_to_file/enpro48pb.nl $path_to_file/enpro56pb.nl $path_to_file/ex1223.nl $path_to_file/ex1223b.nl $path_to_file/fac1.nl $path_to_file/fac2.nl $path_to_file/flay02h.nl $path_to_file/flay02m.nl $path_to_file/flay03h.nl $path_to_file/flay03m.nl $path_to_file/flay04h.nl $path_to_file/flay04m.nl $path_to_file/flay05h.nl $path_to_file/flay05m.nl $path_to_file/flay06h.nl $path_to_file/flay06m.nl $path_to_file/fo7.nl $path_to_file/fo7_2.nl $path_to_file/fo7_ar25_1.nl $path_to_file/fo7_ar2_1.nl $path_to_file/fo7_ar3_1.nl $path_to_file/fo7_ar4_1.nl $path_to_file/fo7_ar5_1.nl $path_to_file/fo8.nl $path_to_file/fo8_ar25_1.nl $path_to_file/fo8_ar2_1.nl $path_to_file/fo8_ar3_1.nl $path_to_file/fo8_ar4_1.nl $path_to_file/fo8_ar5_1.nl $path_to_file/fo9.nl $path_to_file/fo9_ar25_1.nl $path_to_file/fo9_ar2_1.nl $path_to_file/fo9_ar3_1.nl $path_to_file/fo9_ar4_1.nl $path_to_file/fo9_ar5_1.nl $path_to_file/gams01.nl $path_to_file/jit1.nl $path_to_file/m3.nl $path_to_file/m6.nl $path_to_file/m7.nl $path_to_file/m7_ar25_1.nl $path_to_file/m7_ar2_1.nl $path_to_file/m7_ar3_1.nl $path_to_file/m7_ar4_1.nl $path_to_file/m7_ar5_1.nl $path_to_file/no7_ar25_1.nl $path_to_file/no7_ar2_1.nl $path_to_file/no7_ar3_1.nl $path_to_file/no7_ar4_1.nl $path_to_file/no7_ar5_1.nl $path_to_file/o7.nl $path_to_file/o7_2.nl $path_to_file/o7_ar25_1.nl $path_to_file/o7_ar2_1.nl $path_to_file/o7_ar3_1.nl $path_to_file/o7_ar4_1.nl $path_to_file/o7_ar5_1.nl $path_to_file/o8_ar4_1.nl $path_to_file/o9_ar4_1.nl $path_to_file/p_ball_10b_5p_2d_h.nl $path_to_file/p_ball_10b_5p_3d_h.nl $path_to_file/p_ball_10b_5p_4d_h.nl $path_to_file/p_ball_10b_7p_3d_h.nl $path_to_file/p_ball_15b_5p_2d_h.nl $path_to_file/p_ball_20b_5p_2d_h.nl $path_to_file/p_ball_20b_5p_3d_h.nl $path_to_file/p_ball_30b_10p_2d_h.nl $path_to_file/p_ball_30b_5p_2d_h.nl $path_to_file/p_ball_30b_5p_3d_h.nl $path_to_file/p_ball_30b_7p_2d_h.nl $path_to_file/p_ball_40b_5p_3d_h.nl $path_to_file/p_ball_40b_5p_4d_h.nl $path_to_file/portfol_buyin.nl $path_to_file/portfol_card.nl $path_to_file/portfol_roundlot.nl $path_to_file/procurement2mot.nl $path_to_file/ravempb.nl $path_to_file/risk2bpb.nl $path_to_file/rsyn0805hfsg.nl $path_to_file/rsyn0805m.nl $path_to_file/rsyn0805m02hfsg.nl $path_to_file/rsyn0805m02m.nl $path_to_file/rsyn0805m03hfsg.nl $path_to_file/rsyn0805m03m.nl $path_to_file/rsyn0805m04hfsg.nl $path_to_file/rsyn0805m04m.nl $path_to_file/rsyn0810hfsg.nl $path_to_file/rsyn0810m.nl $path_to_file/rsyn0810m02hfsg.nl $path_to_file/rsyn0810m02m.nl $path_to_file/rsyn0810m03hfsg.nl $path_to_file/rsyn0810m03m.nl $path_to_file/rsyn0810m04hfsg.nl $path_to_file/rsyn0810m04m.nl $path_to_file/rsyn0815hfsg.nl $path_to_file/rsyn0815m.nl $path_to_file/rsyn0815m02hfsg.nl $path_to_file/rsyn0815m02m.nl $path_to_file/rsyn0815m03hfsg.nl $path_to_file/rsyn0815m03m.nl $path_to_file/rsyn0815m04hfsg.nl $path_to_file/rsyn0815m04m.nl $path_to_file/rsyn0820hfsg.nl $path_to_file/rsyn0820m.nl $path_to_file/rsyn0820m02hfsg.nl $path_to_file/rsyn0820m02m.nl $path_to_file/rsyn0820m03hfsg.nl $path_to_file/rsyn0820m03m.nl $path_to_file/rsyn0820m04hfsg.nl $path_to_file/rsyn0820m04m.nl $path_to_file/rsyn0830hfsg.nl $path_to_file/rsyn0830m.nl $path_to_file/rsyn0830m02hfsg.nl $path_to_file/rsyn0830m02m.nl $path_to_file/rsyn0830m03hfsg.nl $path_to_file/rsyn0830m03m.nl $path_to_file/rsyn0830m04hfsg.nl $path_to_file/rsyn0830m04m.nl $path_to_file/rsyn0840hfsg.nl $path_to_file/rsyn0840m.nl $path_to_file/rsyn0840m02hfsg.nl $path_to_file/rsyn0840m02m.nl $path_to_file/rsyn0840m03hfsg.nl $path_to_file/rsyn0840m03m.nl $path_to_file/rsyn0840m04hfsg.nl $path_to_file/rsyn0840m04m.nl $path_to_file/sssd08-04.nl $path_to_file/sssd12-05.nl $path_to_file/sssd15-04.nl $path_to_file/sssd15-06.nl $path_to_file/sssd15-08.nl $path_to_file/sssd16-07.nl $path_to_file/sssd18-06.nl $path_to_file/sssd18-08.nl $path_to_file/sssd20-04.nl $path_to_file/sssd20-08.nl $path_to_file/sssd22-08.nl $path_to_file/sssd25-04.nl $path_to_file/sssd25-08.nl $path_to_file/st_e14.nl $path_to_file/stockcycle.nl $path_to_file/syn05hfsg.nl $path_to_file/syn05m.nl $path_to_file/syn05m02hfsg.nl $path_to_file/syn05m02m.nl $path_to_file/syn05m03hfsg.nl $path_to_file/syn05m03m.nl $path_to_file/syn05m04hfsg.nl $path_to_file/syn05m04m.nl $path_to_file/syn10hfsg.nl $path_to_file/syn10m.nl $path_to_file/syn10m02hfsg.nl $path_to_file/syn10m02m.nl $path_to_file/syn10m03hfsg.nl $path_to_file/syn10m03m.nl $path_to_file/syn10m04hfsg.nl $path_to_file/syn10m04m.nl $path_to_file/syn15hfsg.nl $path_to_file/syn15m.nl $path_to_file/syn15m02hfsg.nl $path_to_file/syn15m02m.nl $path_to_file/syn15m03hfsg.nl $path_to_file/syn15m03m.nl $path_to_file/syn15m04hfsg.nl $path_to_file/syn15m04m.nl $path_to_file/syn20hfsg.nl $path_to_file/syn20m.nl $path_to_file/syn20m02hfsg.nl $path_to_file/syn20m02m.nl $path_to_file/syn20m03hfsg.nl $path_to_file/syn20m03m.nl $path_to_file/syn20m04hfsg.nl $path_to_file/syn20m04m.nl $path_to_file/syn30hfsg.nl $path_to_file/syn30m.nl $path_to_file/syn30m02hfsg.nl $path_to_file/syn30m02m.nl $path_to_file/syn30m03hfsg.nl $path_to_file/syn30m03m.nl $path_to_file/syn30m04hfsg.nl $path_to_file/syn30m04m.nl $path_to_file/syn40hfsg.nl $path_to_file/syn40m.nl $path_to_file/syn40m02hfsg.nl $path_to_file/syn40m02m.nl $path_to_file/syn40m03hfsg.nl $path_to_file/syn40m03m.nl $path_to_file/syn40m04hfsg.nl $path_to_file/syn40m04m.nl $path_to_file/synthes1.nl $path_to_file/synthes2.nl $path_to_file/synthes3.nl $path_to_file/tls12.nl $path_to_file/tls2.nl $path_to_file/tls4.nl $path_to_file/tls5.nl $path_to_file/tls6.nl $path_to_file/tls7.nl
-        python -m camino batch s-b-miqp-early-exit $path_to_output/noncvx_sbmiqp_ee $path_to_file/4stufen.nl $path_to_file/autocorr_bern20-05.nl $path_to_file/autocorr_bern20-10.nl $path_to_file/autocorr_bern20-15.nl $path_to_file/autocorr_bern25-06.nl $path_to_file/autocorr_bern25-13.nl $path_to_file/autocorr_bern25-19.nl $path_to_file/autocorr_bern25-25.nl $path_to_file/autocorr_bern30-04.nl $path_to_file/autocorr_bern30-08.nl $path_to_file/autocorr_bern30-15.nl $path_to_file/autocorr_bern30-23.nl $path_to_file/autocorr_bern30-30.nl $path_to_file/autocorr_bern35-04.nl $path_to_file/autocorr_bern35-09.nl $path_to_file/autocorr_bern35-18.nl $path_to_file/autocorr_bern35-26.nl $path_to_file/autocorr_bern35-35fix.nl $path_to_file/autocorr_bern40-05.nl $path_to_file/autocorr_bern40-10.nl $path_to_file/autocorr_bern40-20.nl $path_to_file/autocorr_bern40-30.nl $path_to_file/autocorr_bern40-40.nl $path_to_file/autocorr_bern45-05.nl $path_to_file/autocorr_bern45-11.nl $path_to_file/autocorr_bern45-23.nl $path_to_file/autocorr_bern45-34.nl $path_to_file/autocorr_bern45-45.nl $path_to_file/autocorr_bern50-06.nl $path_to_file/autocorr_bern50-13.nl $path_to_file/autocorr_bern50-25.nl $path_to_file/autocorr_bern50-38.nl $path_to_file/autocorr_bern50-50.nl $path_to_file/autocorr_bern55-06.nl $path_to_file/autocorr_bern55-14.nl $path_to_file/autocorr_bern55-28.nl $path_to_file/autocorr_bern55-41.nl $path_to_file/autocorr_bern55-55.nl $path_to_file/autocorr_bern60-08.nl $path_to_file/autocorr_bern60-15.nl $path_to_file/autocorr_bern60-30.nl $path_to_file/autocorr_bern60-45.nl $path_to_file/autocorr_bern60-60.nl $path_to_file/batch0812_nc.nl $path_to_file/batch_nc.nl $path_to_file/beuster.nl $path_to_file/casctanks.nl $path_to_file/case_1scv2.nl $path_to_file/cecil_13.nl $path_to_file/chp_partload.nl $path_to_file/chp_shorttermplan1a.nl $path_to_file/chp_shorttermplan1b.nl $path_to_file/chp_shorttermplan2a.nl $path_to_file/chp_shorttermplan2b.nl $path_to_file/chp_shorttermplan2c.nl $path_to_file/chp_shorttermplan2d.nl $path_to_file/contvar.nl $path_to_file/csched1.nl $path_to_file/csched1a.nl $path_to_file/csched2.nl $path_to_file/csched2a.nl $path_to_file/deb10.nl $path_to_file/deb6.nl $path_to_file/deb7.nl $path_to_file/deb8.nl $path_to_file/deb9.nl $path_to_file/eg_all_s.nl $path_to_file/eg_disc2_s.nl $path_to_file/eg_disc_s.nl $path_to_file/eg_int_s.nl $path_to_file/eniplac.nl $path_to_file/ex1221.nl $path_to_file/ex1222.nl $path_to_file/ex1224.nl $path_to_file/ex1225.nl $path_to_file/ex1226.nl $path_to_file/ex1233.nl $path_to_file/ex1243.nl $path_to_file/ex1244.nl $path_to_file/ex1252.nl $path_to_file/ex1252a.nl $path_to_file/ex3pb.nl $path_to_file/feedtray.nl $path_to_file/fin2bb.nl $path_to_file/gams02.nl $path_to_file/gams04.nl $path_to_file/gasnet.nl $path_to_file/gastrans.nl $path_to_file/gastrans040.nl $path_to_file/gastrans135.nl $path_to_file/gastrans582_cold13.nl $path_to_file/gastrans582_cold13_95.nl $path_to_file/gastrans582_cold17.nl $path_to_file/gastrans582_cold17_95.nl $path_to_file/gastrans582_cool12.nl $path_to_file/gastrans582_cool12_95.nl $path_to_file/gastrans582_cool14.nl $path_to_file/gastrans582_cool14_95.nl $path_to_file/gastrans582_freezing27.nl $path_to_file/gastrans582_freezing27_95.nl $path_to_file/gastrans582_freezing30.nl $path_to_file/gastrans582_freezing30_95.nl $path_to_file/gastrans582_mild10.nl $path_to_file/gastrans582_mild10_95.nl $path_to_file/gastrans582_mild11.nl $path_to_file/gastrans582_mild11_95.nl $path_to_file/gastrans582_warm15.nl $path_to_file/gastrans582_warm15_95.nl $path_to_file/gastrans582_warm31.nl $path_to_file/gastrans582_warm31_95.nl $path_to_file/gear4.nl $path_to_file/ghg_1veh.nl $path_to_file/ghg_2veh.nl $path_to_file/ghg_3veh.nl $path_to_file/gkocis.nl $path_to_file/hadamard_4.nl $path_to_file/hadamard_5.nl $path_to_file/hadamard_6.nl $path_to_file/hadamard_7.nl $path_to_file/hadamard_8.nl $path_to_file/hadamard_9.nl $path_to_file/hda.nl $path_to_file/heatexch_gen1.nl $path_to_file/heatexch_gen2.nl $path_to_file/heatexch_gen3.nl $path_to_file/heatexch_spec1.nl $path_to_file/heatexch_spec2.nl $path_to_file/heatexch_spec3.nl $path_to_file/heatexch_trigen.nl $path_to_file/hybriddynamic_var.nl $path_to_file/johnall.nl $path_to_file/kan_peaks_h1_n2_g24.nl $path_to_file/kan_peaks_h1_n2_g3.nl $path_to_file/kan_peaks_h1_n5.nl $path_to_file/kan_r3_h1_n3.nl $path_to_file/kan_r3_h1_n4.nl $path_to_file/kan_r3_h1_n5.nl $path_to_file/kan_r3_h1_n9.nl $path_to_file/kan_r5_h1_n3.nl $path_to_file/kan_r5_h1_n5.nl $path_to_file/kan_r5_h1_n8.nl $path_to_file/kport20.nl $path_to_file/kport40.nl $path_to_file/lip.nl $path_to_file/mbtd.nl $path_to_file/milinfract.nl $path_to_file/multiplants_mtg1a.nl $path_to_file/multiplants_mtg1b.nl $path_to_file/multiplants_mtg1c.nl $path_to_file/multiplants_mtg2.nl $path_to_file/multiplants_mtg5.nl $path_to_file/multiplants_mtg6.nl $path_to_file/multiplants_stg1.nl $path_to_file/multiplants_stg1a.nl $path_to_file/multiplants_stg1b.nl $path_to_file/multiplants_stg1c.nl $path_to_file/multiplants_stg5.nl $path_to_file/multiplants_stg6.nl $path_to_file/nvs01.nl $path_to_file/nvs05.nl $path_to_file/nvs08.nl $path_to_file/nvs21.nl $path_to_file/nvs22.nl $path_to_file/oaer.nl $path_to_file/oil.nl $path_to_file/oil2.nl $path_to_file/ortez.nl $path_to_file/parallel.nl $path_to_file/pooling_epa1.nl $path_to_file/pooling_epa2.nl $path_to_file/pooling_epa3.nl $path_to_file/primary.nl $path_to_file/procsel.nl $path_to_file/saa_2.nl $path_to_file/sepasequ_complex.nl $path_to_file/sepasequ_convent.nl $path_to_file/sfacloc1_2_80.nl $path_to_file/sfacloc1_2_90.nl $path_to_file/sfacloc1_2_95.nl $path_to_file/sfacloc1_3_80.nl $path_to_file/sfacloc1_3_90.nl $path_to_file/sfacloc1_3_95.nl $path_to_file/sfacloc1_4_80.nl $path_to_file/sfacloc1_4_90.nl $path_to_file/sfacloc1_4_95.nl $path_to_file/sfacloc2_2_80.nl $path_to_file/sfacloc2_2_90.nl $path_to_file/sfacloc2_2_95.nl $path_to_file/sfacloc2_3_80.nl $path_to_file/sfacloc2_3_90.nl $path_to_file/sfacloc2_3_95.nl $path_to_file/sfacloc2_4_80.nl $path_to_file/sfacloc2_4_90.nl $path_to_file/sfacloc2_4_95.nl $path_to_file/spring.nl $path_to_file/st_e15.nl $path_to_file/st_e29.nl $path_to_file/st_e32.nl $path_to_file/st_e35.nl $path_to_file/st_e36.nl $path_to_file/st_e38.nl $path_to_file/st_e40.nl $path_to_file/super3t.nl $path_to_file/supplychainp1_020306.nl $path_to_file/supplychainp1_022020.nl $path_to_file/supplychainp1_030510.nl $path_to_file/supplychainp1_053050.nl $path_to_file/supplychainr1_020306.nl $path_to_file/supplychainr1_022020.nl $path_to_file/supplychainr1_030510.nl $path_to_file/supplychainr1_053050.nl $path_to_file/synheat.nl $path_to_file/tanksize.nl $path_to_file/transswitch0009p.nl $path_to_file/transswitch0009r.nl $path_to_file/transswitch0014p.nl $path_to_file/transswitch0014r.nl $path_to_file/transswitch0030p.nl $path_to_file/transswitch0030r.nl $path_to_file/transswitch0039p.nl $path_to_file/transswitch0039r.nl $path_to_file/transswitch0057p.nl $path_to_file/transswitch0057r.nl $path_to_file/transswitch0118p.nl $path_to_file/transswitch0118r.nl $path_to_file/transswitch0300p.nl $path_to_file/transswitch0300r.nl $path_to_file/transswitch2383wpp.nl $path_to_file/transswitch2383wpr.nl $path_to_file/transswitch2736spp.nl $path_to_file/transswitch2736spr.nl $path_to_file/tspn05.nl $path_to_file/tspn08.nl $path_to_file/tspn10.nl $path_to_file/tspn12.nl $path_to_file/tspn15.nl $path_to_file/unitcommit2.nl $path_to_file/uselinear.nl $path_to_file/var_con10.nl $path_to_file/var_con5.nl $path_to_file/wager.nl $path_to_file/wastepaper3.nl $path_to_file/wastepaper4.nl $path_to_file/wastepaper5.nl $path_to_file/wastepaper6.nl $path_to_file/water4.nl $path_to_file/waternd1.nl $path_to_file/waternd2.nl $path_to_file/waterno2_01.nl $path_to_file/waterno2_02.nl $path_to_file/waterno2_03.nl $path_to_file/waterno2_04.nl $path_to_file/waterno2_06.nl $path_to_file/waterno2_09.nl $path_to_file/waterno2_12.nl $path_to_file/waterno2_18.nl $path_to_file/waterno2_24.nl $path_to_file/watertreatnd_conc.nl $path_to_file/watertreatnd_flow.nl $path_to_file/waterx.nl $path_to_file/waterz.nl $path_to_file/windfac.nl
-
-        python benchmark/run_shot.py cvx $path_to_file $path_to_output/cvx_shot
-        python benchmark/run_shot.py noncvx $path_to_file $path_to_output/noncvx_shot
+        python benchmark/run_shot.py cvx $path_to_file $path_to_output/cvx_shot --workers $workers
+        python benchmark/run_shot.py noncvx $path_to_file $path_to_output/noncvx_shot --workers $workers
         ;;
     alpha)
         echo "Running alpha tuning mode..."
-        python -m camino batch s-b-miqp-early-exit $path_to_output/cvx_alpha_X $path_to_file/batch.nl $path_to_file/batch0812.nl $path_to_file/batchdes.nl $path_to_file/batchs101006m.nl $path_to_file/batchs121208m.nl $path_to_file/batchs151208m.nl $path_to_file/batchs201210m.nl $path_to_file/clay0203hfsg.nl $path_to_file/clay0204hfsg.nl $path_to_file/clay0205hfsg.nl $path_to_file/clay0303hfsg.nl $path_to_file/clay0304hfsg.nl $path_to_file/clay0305hfsg.nl $path_to_file/cvxnonsep_normcon20.nl $path_to_file/cvxnonsep_normcon30.nl $path_to_file/cvxnonsep_normcon40.nl $path_to_file/cvxnonsep_nsig20.nl $path_to_file/cvxnonsep_nsig20r.nl $path_to_file/cvxnonsep_nsig30.nl $path_to_file/cvxnonsep_nsig30r.nl $path_to_file/cvxnonsep_nsig40.nl $path_to_file/cvxnonsep_nsig40r.nl $path_to_file/cvxnonsep_pcon20.nl $path_to_file/cvxnonsep_pcon20r.nl $path_to_file/cvxnonsep_pcon30.nl $path_to_file/cvxnonsep_pcon30r.nl $path_to_file/cvxnonsep_pcon40.nl $path_to_file/cvxnonsep_pcon40r.nl $path_to_file/cvxnonsep_psig20.nl $path_to_file/cvxnonsep_psig20r.nl $path_to_file/cvxnonsep_psig30.nl $path_to_file/cvxnonsep_psig30r.nl $path_to_file/cvxnonsep_psig40.nl $path_to_file/cvxnonsep_psig40r.nl $path_to_file/enpro48pb.nl $path_to_file/enpro56pb.nl $path_to_file/ex1223.nl $path_to_file/ex1223b.nl $path_to_file/fac1.nl $path_to_file/fac2.nl $path_to_file/flay02h.nl $path_to_file/flay02m.nl $path_to_file/flay03h.nl $path_to_file/flay03m.nl $path_to_file/flay04h.nl $path_to_file/flay04m.nl $path_to_file/flay05h.nl $path_to_file/flay05m.nl $path_to_file/flay06h.nl $path_to_file/flay06m.nl $path_to_file/fo7.nl $path_to_file/fo7_2.nl $path_to_file/fo7_ar25_1.nl $path_to_file/fo7_ar2_1.nl $path_to_file/fo7_ar3_1.nl $path_to_file/fo7_ar4_1.nl $path_to_file/fo7_ar5_1.nl $path_to_file/fo8.nl $path_to_file/fo8_ar25_1.nl $path_to_file/fo8_ar2_1.nl $path_to_file/fo8_ar3_1.nl $path_to_file/fo8_ar4_1.nl $path_to_file/fo8_ar5_1.nl $path_to_file/fo9.nl $path_to_file/fo9_ar25_1.nl $path_to_file/fo9_ar2_1.nl $path_to_file/fo9_ar3_1.nl $path_to_file/fo9_ar4_1.nl $path_to_file/fo9_ar5_1.nl $path_to_file/gams01.nl $path_to_file/jit1.nl $path_to_file/m3.nl $path_to_file/m6.nl $path_to_file/m7.nl $path_to_file/m7_ar25_1.nl $path_to_file/m7_ar2_1.nl $path_to_file/m7_ar3_1.nl $path_to_file/m7_ar4_1.nl $path_to_file/m7_ar5_1.nl $path_to_file/no7_ar25_1.nl $path_to_file/no7_ar2_1.nl $path_to_file/no7_ar3_1.nl $path_to_file/no7_ar4_1.nl $path_to_file/no7_ar5_1.nl $path_to_file/o7.nl $path_to_file/o7_2.nl $path_to_file/o7_ar25_1.nl $path_to_file/o7_ar2_1.nl $path_to_file/o7_ar3_1.nl $path_to_file/o7_ar4_1.nl $path_to_file/o7_ar5_1.nl $path_to_file/o8_ar4_1.nl $path_to_file/o9_ar4_1.nl $path_to_file/p_ball_10b_5p_2d_h.nl $path_to_file/p_ball_10b_5p_3d_h.nl $path_to_file/p_ball_10b_5p_4d_h.nl $path_to_file/p_ball_10b_7p_3d_h.nl $path_to_file/p_ball_15b_5p_2d_h.nl $path_to_file/p_ball_20b_5p_2d_h.nl $path_to_file/p_ball_20b_5p_3d_h.nl $path_to_file/p_ball_30b_10p_2d_h.nl $path_to_file/p_ball_30b_5p_2d_h.nl $path_to_file/p_ball_30b_5p_3d_h.nl $path_to_file/p_ball_30b_7p_2d_h.nl $path_to_file/p_ball_40b_5p_3d_h.nl $path_to_file/p_ball_40b_5p_4d_h.nl $path_to_file/portfol_buyin.nl $path_to_file/portfol_card.nl $path_to_file/portfol_roundlot.nl $path_to_file/procurement2mot.nl $path_to_file/ravempb.nl $path_to_file/risk2bpb.nl $path_to_file/rsyn0805hfsg.nl $path_to_file/rsyn0805m.nl $path_to_file/rsyn0805m02hfsg.nl $path_to_file/rsyn0805m02m.nl $path_to_file/rsyn0805m03hfsg.nl $path_to_file/rsyn0805m03m.nl $path_to_file/rsyn0805m04hfsg.nl $path_to_file/rsyn0805m04m.nl $path_to_file/rsyn0810hfsg.nl $path_to_file/rsyn0810m.nl $path_to_file/rsyn0810m02hfsg.nl $path_to_file/rsyn0810m02m.nl $path_to_file/rsyn0810m03hfsg.nl $path_to_file/rsyn0810m03m.nl $path_to_file/rsyn0810m04hfsg.nl $path_to_file/rsyn0810m04m.nl $path_to_file/rsyn0815hfsg.nl $path_to_file/rsyn0815m.nl $path_to_file/rsyn0815m02hfsg.nl $path_to_file/rsyn0815m02m.nl $path_to_file/rsyn0815m03hfsg.nl $path_to_file/rsyn0815m03m.nl $path_to_file/rsyn0815m04hfsg.nl $path_to_file/rsyn0815m04m.nl $path_to_file/rsyn0820hfsg.nl $path_to_file/rsyn0820m.nl $path_to_file/rsyn0820m02hfsg.nl $path_to_file/rsyn0820m02m.nl $path_to_file/rsyn0820m03hfsg.nl $path_to_file/rsyn0820m03m.nl $path_to_file/rsyn0820m04hfsg.nl $path_to_file/rsyn0820m04m.nl $path_to_file/rsyn0830hfsg.nl $path_to_file/rsyn0830m.nl $path_to_file/rsyn0830m02hfsg.nl $path_to_file/rsyn0830m02m.nl $path_to_file/rsyn0830m03hfsg.nl $path_to_file/rsyn0830m03m.nl $path_to_file/rsyn0830m04hfsg.nl $path_to_file/rsyn0830m04m.nl $path_to_file/rsyn0840hfsg.nl $path_to_file/rsyn0840m.nl $path_to_file/rsyn0840m02hfsg.nl $path_to_file/rsyn0840m02m.nl $path_to_file/rsyn0840m03hfsg.nl $path_to_file/rsyn0840m03m.nl $path_to_file/rsyn0840m04hfsg.nl $path_to_file/rsyn0840m04m.nl $path_to_file/sssd08-04.nl $path_to_file/sssd12-05.nl $path_to_file/sssd15-04.nl $path_to_file/sssd15-06.nl $path_to_file/sssd15-08.nl $path_to_file/sssd16-07.nl $path_to_file/sssd18-06.nl $path_to_file/sssd18-08.nl $path_to_file/sssd20-04.nl $path_to_file/sssd20-08.nl $path_to_file/sssd22-08.nl $path_to_file/sssd25-04.nl $path_to_file/sssd25-08.nl $path_to_file/st_e14.nl $path_to_file/stockcycle.nl $path_to_file/syn05hfsg.nl $path_to_file/syn05m.nl $path_to_file/syn05m02hfsg.nl $path_to_file/syn05m02m.nl $path_to_file/syn05m03hfsg.nl $path_to_file/syn05m03m.nl $path_to_file/syn05m04hfsg.nl $path_to_file/syn05m04m.nl $path_to_file/syn10hfsg.nl $path_to_file/syn10m.nl $path_to_file/syn10m02hfsg.nl $path_to_file/syn10m02m.nl $path_to_file/syn10m03hfsg.nl $path_to_file/syn10m03m.nl $path_to_file/syn10m04hfsg.nl $path_to_file/syn10m04m.nl $path_to_file/syn15hfsg.nl $path_to_file/syn15m.nl $path_to_file/syn15m02hfsg.nl $path_to_file/syn15m02m.nl $path_to_file/syn15m03hfsg.nl $path_to_file/syn15m03m.nl $path_to_file/syn15m04hfsg.nl $path_to_file/syn15m04m.nl $path_to_file/syn20hfsg.nl $path_to_file/syn20m.nl $path_to_file/syn20m02hfsg.nl $path_to_file/syn20m02m.nl $path_to_file/syn20m03hfsg.nl $path_to_file/syn20m03m.nl $path_to_file/syn20m04hfsg.nl $path_to_file/syn20m04m.nl $path_to_file/syn30hfsg.nl $path_to_file/syn30m.nl $path_to_file/syn30m02hfsg.nl $path_to_file/syn30m02m.nl $path_to_file/syn30m03hfsg.nl $path_to_file/syn30m03m.nl $path_to_file/syn30m04hfsg.nl $path_to_file/syn30m04m.nl $path_to_file/syn40hfsg.nl $path_to_file/syn40m.nl $path_to_file/syn40m02hfsg.nl $path_to_file/syn40m02m.nl $path_to_file/syn40m03hfsg.nl $path_to_file/syn40m03m.nl $path_to_file/syn40m04hfsg.nl $path_to_file/syn40m04m.nl $path_to_file/synthes1.nl $path_to_file/synthes2.nl $path_to_file/synthes3.nl $path_to_file/tls12.nl $path_to_file/tls2.nl $path_to_file/tls4.nl $path_to_file/tls5.nl $path_to_file/tls6.nl $path_to_file/tls7.nl
+        if [ "${RACE:-0}" = "1" ]; then
+            python benchmark/racing.py alpha $path_to_file $path_to_output --workers $workers
+        else
+            python benchmark/parallel_runner.py alpha $path_to_file $path_to_output --workers $workers
+        fi
         ;;
     rho)
         echo "Running rho tuning mode..."
-        python -m camino batch s-b-miqp $path_to_output/noncvx_rho_X $path_to_file/autocorr_bern20-05.nl $path_to_file/autocorr_bern20-10.nl $path_to_file/autocorr_bern20-15.nl $path_to_file/autocorr_bern25-06.nl $path_to_file/autocorr_bern25-13.nl $path_to_file/autocorr_bern25-19.nl $path_to_file/autocorr_bern25-25.nl $path_to_file/autocorr_bern30-04.nl $path_to_file/autocorr_bern30-08.nl $path_to_file/autocorr_bern30-15.nl $path_to_file/autocorr_bern30-23.nl $path_to_file/autocorr_bern30-30.nl $path_to_file/autocorr_bern35-04.nl $path_to_file/autocorr_bern35-09.nl $path_to_file/autocorr_bern35-18.nl $path_to_file/autocorr_bern35-26.nl $path_to_file/autocorr_bern35-35fix.nl $path_to_file/autocorr_bern40-05.nl $path_to_file/autocorr_bern40-10.nl $path_to_file/autocorr_bern40-20.nl $path_to_file/autocorr_bern40-30.nl $path_to_file/autocorr_bern40-40.nl $path_to_file/autocorr_bern45-05.nl $path_to_file/autocorr_bern45-11.nl $path_to_file/autocorr_bern45-23.nl $path_to_file/autocorr_bern45-34.nl $path_to_file/autocorr_bern45-45.nl $path_to_file/autocorr_bern50-06.nl $path_to_file/autocorr_bern50-13.nl $path_to_file/autocorr_bern50-25.nl $path_to_file/autocorr_bern50-38.nl $path_to_file/autocorr_bern50-50.nl $path_to_file/autocorr_bern55-06.nl $path_to_file/autocorr_bern55-14.nl $path_to_file/autocorr_bern55-28.nl $path_to_file/autocorr_bern55-41.nl $path_to_file/autocorr_bern55-55.nl $path_to_file/autocorr_bern60-08.nl $path_to_file/autocorr_bern60-15.nl $path_to_file/autocorr_bern60-30.nl $path_to_file/autocorr_bern60-45.nl $path_to_file/autocorr_bern60-60.nl $path_to_file/batch0812_nc.nl $path_to_file/batch_nc.nl $path_to_file/casctanks.nl $path_to_file/cecil_13.nl $path_to_file/chp_shorttermplan1a.nl $path_to_file/contvar.nl $path_to_file/csched1.nl $path_to_file/csched1a.nl $path_to_file/csched2.nl $path_to_file/csched2a.nl $path_to_file/deb10.nl $path_to_file/deb6.nl $path_to_file/deb7.nl $path_to_file/deb8.nl $path_to_file/deb9.nl $path_to_file/eg_all_s.nl $path_to_file/eg_disc2_s.nl $path_to_file/eg_disc_s.nl $path_to_file/eg_int_s.nl $path_to_file/ex1221.nl $path_to_file/ex1222.nl $path_to_file/ex1224.nl $path_to_file/ex1225.nl $path_to_file/ex1226.nl $path_to_file/ex1233.nl $path_to_file/ex1243.nl $path_to_file/ex1244.nl $path_to_file/ex1252.nl $path_to_file/ex1252a.nl $path_to_file/ex3pb.nl $path_to_file/feedtray.nl $path_to_file/fin2bb.nl $path_to_file/gastrans.nl $path_to_file/gastrans040.nl $path_to_file/gastrans135.nl $path_to_file/gear4.nl $path_to_file/ghg_1veh.nl $path_to_file/ghg_2veh.nl $path_to_file/ghg_3veh.nl $path_to_file/gkocis.nl $path_to_file/hadamard_4.nl $path_to_file/hadamard_5.nl $path_to_file/hadamard_6.nl $path_to_file/hadamard_7.nl $path_to_file/hadamard_8.nl $path_to_file/heatexch_gen1.nl $path_to_file/heatexch_spec1.nl $path_to_file/heatexch_spec2.nl $path_to_file/hybriddynamic_var.nl $path_to_file/johnall.nl $path_to_file/kan_peaks_h1_n2_g24.nl $path_to_file/kan_peaks_h1_n2_g3.nl $path_to_file/kan_peaks_h1_n5.nl $path_to_file/kan_r3_h1_n3.nl $path_to_file/kan_r3_h1_n9.nl $path_to_file/kan_r5_h1_n3.nl $path_to_file/kan_r5_h1_n5.nl $path_to_file/kan_r5_h1_n8.nl $path_to_file/kport20.nl $path_to_file/kport40.nl $path_to_file/lip.nl $path_to_file/mbtd.nl $path_to_file/multiplants_mtg1a.nl $path_to_file/multiplants_mtg1b.nl $path_to_file/multiplants_mtg1c.nl $path_to_file/multiplants_mtg2.nl $path_to_file/multiplants_mtg5.nl $path_to_file/multiplants_mtg6.nl $path_to_file/multiplants_stg1.nl $path_to_file/multiplants_stg1a.nl $path_to_file/multiplants_stg1b.nl $path_to_file/multiplants_stg1c.nl $path_to_file/multiplants_stg5.nl $path_to_file/multiplants_stg6.nl $path_to_file/nvs01.nl $path_to_file/nvs05.nl $path_to_file/nvs08.nl $path_to_file/nvs21.nl $path_to_file/nvs22.nl $path_to_file/parallel.nl $path_to_file/pooling_epa1.nl $path_to_file/pooling_epa2.nl $path_to_file/pooling_epa3.nl $path_to_file/procsel.nl $path_to_file/saa_2.nl $path_to_file/sepasequ_complex.nl $path_to_file/sepasequ_convent.nl $path_to_file/sfacloc1_2_80.nl $path_to_file/sfacloc1_2_90.nl $path_to_file/sfacloc1_2_95.nl $path_to_file/sfacloc1_3_80.nl $path_to_file/sfacloc1_3_90.nl $path_to_file/sfacloc1_3_95.nl $path_to_file/sfacloc1_4_80.nl $path_to_file/sfacloc1_4_90.nl $path_to_file/sfacloc1_4_95.nl $path_to_file/sfacloc2_2_80.nl $path_to_file/sfacloc2_2_90.nl $path_to_file/sfacloc2_2_95.nl $path_to_file/sfacloc2_3_80.nl $path_to_file/sfacloc2_3_90.nl $path_to_file/sfacloc2_3_95.nl $path_to_file/sfacloc2_4_80.nl $path_to_file/sfacloc2_4_90.nl $path_to_file/sfacloc2_4_95.nl $path_to_file/spring.nl $path_to_file/st_e15.nl $path_to_file/st_e29.nl $path_to_file/st_e32.nl $path_to_file/st_e36.nl $path_to_file/st_e38.nl $path_to_file/supplychainp1_020306.nl $path_to_file/supplychainp1_022020.nl $path_to_file/supplychainp1_030510.nl $path_to_file/supplychainr1_020306.nl $path_to_file/supplychainr1_022020.nl $path_to_file/supplychainr1_030510.nl $path_to_file/synheat.nl $path_to_file/tanksize.nl $path_to_file/transswitch0014p.nl $path_to_file/transswitch0030p.nl $path_to_file/transswitch0039p.nl $path_to_file/transswitch0118p.nl $path_to_file/tspn05.nl $path_to_file/tspn08.nl $path_to_file/tspn10.nl $path_to_file/tspn12.nl $path_to_file/tspn15.nl $path_to_file/unitcommit2.nl $path_to_file/var_con10.nl $path_to_file/var_con5.nl $path_to_file/wastepaper3.nl $path_to_file/wastepaper4.nl $path_to_file/wastepaper5.nl $path_to_file/wastepaper6.nl $path_to_file/water4.nl $path_to_file/waternd1.nl $path_to_file/waternd2.nl $path_to_file/waterno2_01.nl $path_to_file/waterno2_02.nl $path_to_file/waterno2_03.nl $path_to_file/waterno2_04.nl $path_to_file/waterno2_06.nl $path_to_file/waterx.nl $path_to_file/windfac.nl
+        if [ "${RACE:-0}" = "1" ]; then
+            python benchmark/racing.py rho $path_to_file $path_to_output --workers $workers
+        else
+            python benchmark/parallel_runner.py rho $path_to_file $path_to_output --workers $workers
+        fi
         ;;
     *)
         echo "Error: Mode '$mode' is not recognized."
@@ -2,555 +2,292 @@
 # Copyright (C) 2025  Andrea Ghezzi, Wim Van Roy, Sebastian Sager, Moritz Diehl
 # SPDX-License-Identifier: GPL-3.0-or-later
 
+"""
+Solve the problems with SHOT.
 
+Up to `--workers` instances are solved concurrently, each SHOT process is
+pinned to its own core, its output is streamed to `<results_folder>/<name>.log`
+and it is killed when exceeding the wall-clock or memory limit. The status of
+every instance (OK, ERROR, TIMEOUT, OOM) is recorded in the journal of the
+results folder, the results themselves are the `<name>.osrl` files. The
+instances and the time limit are read from the experiment spec, cf.
+experiment.py. With `--repetitions k` all instances are solved k times, in
+rounds, repetition r > 0 in `<results_folder>/rep<r>`, cf. repetitions.py.
+
+Successful results are stored in the result cache (cf. result_cache.py) and
+an instance is only solved again when the .nl file, the SHOT version or the
+options changed.
+"""
+
+import os
 import subprocess
-from shutil import copyfile
-from time import time
-from os import path, mkdir
-from sys import argv
+from argparse import ArgumentParser
+from time import time, sleep
+from os import path
+from experiment import load_spec, repetition_folder, set_instances
+from journal import Journal, RunningJobs
+from result_cache import cache_key, default_cache
+from scheduler import RuntimeEstimator, order_longest_first
 
-# Convex problems
-cvx_problems = [
-    "batch.nl",
-    "batch0812.nl",
-    "batchdes.nl",
-    "batchs101006m.nl",
-    "batchs121208m.nl",
-    "batchs151208m.nl",
-    "batchs201210m.nl",
-    "clay0203hfsg.nl",
-    "clay0204hfsg.nl",
-    "clay0205hfsg.nl",
-    "clay0303hfsg.nl",
-    "clay0304hfsg.nl",
-    "clay0305hfsg.nl",
-    "cvxnonsep_normcon20.nl",
-    "cvxnonsep_normcon30.nl",
-    "cvxnonsep_normcon40.nl",
-    "cvxnonsep_nsig20.nl",
-    "cvxnonsep_nsig20r.nl",
-    "cvxnonsep_nsig30.nl",
-    "cvxnonsep_nsig30r.nl",
-    "cvxnonsep_nsig40.nl",
-    "cvxnonsep_nsig40r.nl",
-    "cvxnonsep_pcon20.nl",
-    "cvxnonsep_pcon20r.nl",
-    "cvxnonsep_pcon30.nl",
-    "cvxnonsep_pcon30r.nl",
-    "cvxnonsep_pcon40.nl",
-    "cvxnonsep_pcon40r.nl",
-    "cvxnonsep_psig20.nl",
-    "cvxnonsep_psig20r.nl",
-    "cvxnonsep_psig30.nl",
-    "cvxnonsep_psig30r.nl",
-    "cvxnonsep_psig40.nl",
-    "cvxnonsep_psig40r.nl",
-    "enpro48pb.nl",
-    "enpro56pb.nl",
-    "ex1223.nl",
-    "ex1223b.nl",
-    "fac1.nl",
-    "fac2.nl",
-    "flay02h.nl",
-    "flay02m.nl",
-    "flay03h.nl",
-    "flay03m.nl",
-    "flay04h.nl",
-    "flay04m.nl",
-    "flay05h.nl",
-    "flay05m.nl",
-    "flay06h.nl",
-    "flay06m.nl",
-    "fo7.nl",
-    "fo7_2.nl",
-    "fo7_ar25_1.nl",
-    "fo7_ar2_1.nl",
-    "fo7_ar3_1.nl",
-    "fo7_ar4_1.nl",
-    "fo7_ar5_1.nl",
-    "fo8.nl",
-    "fo8_ar25_1.nl",
-    "fo8_ar2_1.nl",
-    "fo8_ar3_1.nl",
-    "fo8_ar4_1.nl",
-    "fo8_ar5_1.nl",
-    "fo9.nl",
-    "fo9_ar25_1.nl",
-    "fo9_ar2_1.nl",
-    "fo9_ar3_1.nl",
-    "fo9_ar4_1.nl",
-    "fo9_ar5_1.nl",
-    "gams01.nl",
-    "ibs2.nl",
-    "jit1.nl",
-    "m3.nl",
-    "m6.nl",
-    "m7.nl",
-    "m7_ar25_1.nl",
-    "m7_ar2_1.nl",
-    "m7_ar3_1.nl",
-    "m7_ar4_1.nl",
-    "m7_ar5_1.nl",
-    "no7_ar25_1.nl",
-    "no7_ar2_1.nl",
-    "no7_ar3_1.nl",
-    "no7_ar4_1.nl",
-    "no7_ar5_1.nl",
-    "o7.nl",
-    "o7_2.nl",
-    "o7_ar25_1.nl",
-    "o7_ar2_1.nl",
-    "o7_ar3_1.nl",
-    "o7_ar4_1.nl",
-    "o7_ar5_1.nl",
-    "o8_ar4_1.nl",
-    "o9_ar4_1.nl",
-    "p_ball_10b_5p_2d_h.nl",
-    "p_ball_10b_5p_3d_h.nl",
-    "p_ball_10b_5p_4d_h.nl",
-    "p_ball_10b_7p_3d_h.nl",
-    "p_ball_15b_5p_2d_h.nl",
-    "p_ball_20b_5p_2d_h.nl",
-    "p_ball_20b_5p_3d_h.nl",
-    "p_ball_30b_10p_2d_h.nl",
-    "p_ball_30b_5p_2d_h.nl",
-    "p_ball_30b_5p_3d_h.nl",
-    "p_ball_30b_7p_2d_h.nl",
-    "p_ball_40b_5p_3d_h.nl",
-    "p_ball_40b_5p_4d_h.nl",
-    "portfol_buyin.nl",
-    "portfol_card.nl",
-    "portfol_roundlot.nl",
-    "procurement2mot.nl",
-    "ravempb.nl",
-    "risk2bpb.nl",
-    "rsyn0805hfsg.nl",
-    "rsyn0805m.nl",
-    "rsyn0805m02hfsg.nl",
-    "rsyn0805m02m.nl",
-    "rsyn0805m03hfsg.nl",
-    "rsyn0805m03m.nl",
-    "rsyn0805m04hfsg.nl",
-    "rsyn0805m04m.nl",
-    "rsyn0810hfsg.nl",
-    "rsyn0810m.nl",
-    "rsyn0810m02hfsg.nl",
-    "rsyn0810m02m.nl",
-    "rsyn0810m03hfsg.nl",
-    "rsyn0810m03m.nl",
-    "rsyn0810m04hfsg.nl",
-    "rsyn0810m04m.nl",
-    "rsyn0815hfsg.nl",
-    "rsyn0815m.nl",
-    "rsyn0815m02hfsg.nl",
-    "rsyn0815m02m.nl",
-    "rsyn0815m03hfsg.nl",
-    "rsyn0815m03m.nl",
-    "rsyn0815m04hfsg.nl",
-    "rsyn0815m04m.nl",
-    "rsyn0820hfsg.nl",
-    "rsyn0820m.nl",
-    "rsyn0820m02hfsg.nl",
-    "rsyn0820m02m.nl",
-    "rsyn0820m03hfsg.nl",
-    "rsyn0820m03m.nl",
-    "rsyn0820m04hfsg.nl",
-    "rsyn0820m04m.nl",
-    "rsyn0830hfsg.nl",
-    "rsyn0830m.nl",
-    "rsyn0830m02hfsg.nl",
-    "rsyn0830m02m.nl",
-    "rsyn0830m03hfsg.nl",
-    "rsyn0830m03m.nl",
-    "rsyn0830m04hfsg.nl",
-    "rsyn0830m04m.nl",
-    "rsyn0840hfsg.nl",
-    "rsyn0840m.nl",
-    "rsyn0840m02hfsg.nl",
-    "rsyn0840m02m.nl",
-    "rsyn0840m03hfsg.nl",
-    "rsyn0840m03m.nl",
-    "rsyn0840m04hfsg.nl",
-    "rsyn0840m04m.nl",
-    "sssd08-04.nl",
-    "sssd12-05.nl",
-    "sssd15-04.nl",
-    "sssd15-06.nl",
-    "sssd15-08.nl",
-    "sssd16-07.nl",
-    "sssd18-06.nl",
-    "sssd18-08.nl",
-    "sssd20-04.nl",
-    "sssd20-08.nl",
-    "sssd22-08.nl",
-    "sssd25-04.nl",
-    "sssd25-08.nl",
-    "st_e14.nl",
-    "stockcycle.nl",
-    "syn05hfsg.nl",
-    "syn05m.nl",
-    "syn05m02hfsg.nl",
-    "syn05m02m.nl",
-    "syn05m03hfsg.nl",
-    "syn05m03m.nl",
-    "syn05m04hfsg.nl",
-    "syn05m04m.nl",
-    "syn10hfsg.nl",
-    "syn10m.nl",
-    "syn10m02hfsg.nl",
-    "syn10m02m.nl",
-    "syn10m03hfsg.nl",
-    "syn10m03m.nl",
-    "syn10m04hfsg.nl",
-    "syn10m04m.nl",
-    "syn15hfsg.nl",
-    "syn15m.nl",
-    "syn15m02hfsg.nl",
-    "syn15m02m.nl",
-    "syn15m03hfsg.nl",
-    "syn15m03m.nl",
-    "syn15m04hfsg.nl",
-    "syn15m04m.nl",
-    "syn20hfsg.nl",
-    "syn20m.nl",
-    "syn20m02hfsg.nl",
-    "syn20m02m.nl",
-    "syn20m03hfsg.nl",
-    "syn20m03m.nl",
-    "syn20m04hfsg.nl",
-    "syn20m04m.nl",
-    "syn30hfsg.nl",
-    "syn30m.nl",
-    "syn30m02hfsg.nl",
-    "syn30m02m.nl",
-    "syn30m03hfsg.nl",
-    "syn30m03m.nl",
-    "syn30m04hfsg.nl",
-    "syn30m04m.nl",
-    "syn40hfsg.nl",
-    "syn40m.nl",
-    "syn40m02hfsg.nl",
-    "syn40m02m.nl",
-    "syn40m03hfsg.nl",
-    "syn40m03m.nl",
-    "syn40m04hfsg.nl",
-    "syn40m04m.nl",
-    "synthes1.nl",
-    "synthes2.nl",
-    "synthes3.nl",
-    "tls12.nl",
-    "tls2.nl",
-    "tls4.nl",
-    "tls5.nl",
-    "tls6.nl",
-    "tls7.nl",
-]
+TIME_LIMIT = 300.0
+# Extra wall time before a SHOT process that ignores its time limit is killed
+KILL_GRACE = 60
+POLL_INTERVAL = 0.5
+HEADER = ["id", "path", "status", "returncode", "wall_time", "max_rss"]
 
-# Nonconvex problems -- removed because breaking "gastrans.nl",
-noncvx_problems = [
-    "4stufen.nl",
-    "autocorr_bern20-05.nl",
-    "autocorr_bern20-10.nl",
-    "autocorr_bern20-15.nl",
-    "autocorr_bern25-06.nl",
-    "autocorr_bern25-13.nl",
-    "autocorr_bern25-19.nl",
-    "autocorr_bern25-25.nl",
-    "autocorr_bern30-04.nl",
-    "autocorr_bern30-08.nl",
-    "autocorr_bern30-15.nl",
-    "autocorr_bern30-23.nl",
-    "autocorr_bern30-30.nl",
-    "autocorr_bern35-04.nl",
-    "autocorr_bern35-09.nl",
-    "autocorr_bern35-18.nl",
-    "autocorr_bern35-26.nl",
-    "autocorr_bern35-35fix.nl",
-    "autocorr_bern40-05.nl",
-    "autocorr_bern40-10.nl",
-    "autocorr_bern40-20.nl",
-    "autocorr_bern40-30.nl",
-    "autocorr_bern40-40.nl",
-    "autocorr_bern45-05.nl",
-    "autocorr_bern45-11.nl",
-    "autocorr_bern45-23.nl",
-    "autocorr_bern45-34.nl",
-    "autocorr_bern45-45.nl",
-    "autocorr_bern50-06.nl",
-    "autocorr_bern50-13.nl",
-    "autocorr_bern50-25.nl",
-    "autocorr_bern50-38.nl",
-    "autocorr_bern50-50.nl",
-    "autocorr_bern55-06.nl",
-    "autocorr_bern55-14.nl",
-    "autocorr_bern55-28.nl",
-    "autocorr_bern55-41.nl",
-    "autocorr_bern55-55.nl",
-    "autocorr_bern60-08.nl",
-    "autocorr_bern60-15.nl",
-    "autocorr_bern60-30.nl",
-    "autocorr_bern60-45.nl",
-    "autocorr_bern60-60.nl",
-    "batch0812_nc.nl",
-    "batch_nc.nl",
-    "beuster.nl",
-    "casctanks.nl",
-    "case_1scv2.nl",
-    "cecil_13.nl",
-    "chp_partload.nl",
-    "chp_shorttermplan1a.nl",
-    "chp_shorttermplan1b.nl",
-    "chp_shorttermplan2a.nl",
-    "chp_shorttermplan2b.nl",
-    "chp_shorttermplan2c.nl",
-    "chp_shorttermplan2d.nl",
-    "contvar.nl",
-    "csched1.nl",
-    "csched1a.nl",
-    "csched2.nl",
-    "csched2a.nl",
-    "deb10.nl",
-    "deb6.nl",
-    "deb7.nl",
-    "deb8.nl",
-    "deb9.nl",
-    "eg_all_s.nl",
-    "eg_disc2_s.nl",
-    "eg_disc_s.nl",
-    "eg_int_s.nl",
-    "eniplac.nl",
-    "ex1221.nl",
-    "ex1222.nl",
-    "ex1224.nl",
-    "ex1225.nl",
-    "ex1226.nl",
-    "ex1233.nl",
-    "ex1243.nl",
-    "ex1244.nl",
-    "ex1252.nl",
-    "ex1252a.nl",
-    "ex3pb.nl",
-    "feedtray.nl",
-    "fin2bb.nl",
-    "gams02.nl",
-    "gams04.nl",
-    "gasnet.nl",
-    "gastrans040.nl",
-    "gastrans135.nl",
-    "gastrans582_cold13.nl",
-    "gastrans582_cold13_95.nl",
-    "gastrans582_cold17.nl",
-    "gastrans582_cold17_95.nl",
-    "gastrans582_cool12.nl",
-    "gastrans582_cool12_95.nl",
-    "gastrans582_cool14.nl",
-    "gastrans582_cool14_95.nl",
-    "gastrans582_freezing27.nl",
-    "gastrans582_freezing27_95.nl",
-    "gastrans582_freezing30.nl",
-    "gastrans582_freezing30_95.nl",
-    "gastrans582_mild10.nl",
-    "gastrans582_mild10_95.nl",
-    "gastrans582_mild11.nl",
-    "gastrans582_mild11_95.nl",
-    "gastrans582_warm15.nl",
-    "gastrans582_warm15_95.nl",
-    "gastrans582_warm31.nl",
-    "gastrans582_warm31_95.nl",
-    "gear4.nl",
-    "ghg_1veh.nl",
-    "ghg_2veh.nl",
-    "ghg_3veh.nl",
-    "gkocis.nl",
-    "hadamard_4.nl",
-    "hadamard_5.nl",
-    "hadamard_6.nl",
-    "hadamard_7.nl",
-    "hadamard_8.nl",
-    "hadamard_9.nl",
-    "hda.nl",
-    "heatexch_gen1.nl",
-    "heatexch_gen2.nl",
-    "heatexch_gen3.nl",
-    "heatexch_spec1.nl",
-    "heatexch_spec2.nl",
-    "heatexch_spec3.nl",
-    "heatexch_trigen.nl",
-    "hybriddynamic_var.nl",
-    "johnall.nl",
-    "kan_peaks_h1_n2_g24.nl",
-    "kan_peaks_h1_n2_g3.nl",
-    "kan_peaks_h1_n5.nl",
-    "kan_r3_h1_n3.nl",
-    "kan_r3_h1_n4.nl",
-    "kan_r3_h1_n5.nl",
-    "kan_r3_h1_n9.nl",
-    "kan_r5_h1_n3.nl",
-    "kan_r5_h1_n5.nl",
-    "kan_r5_h1_n8.nl",
-    "kport20.nl",
-    "kport40.nl",
-    "lip.nl",
-    "mbtd.nl",
-    "milinfract.nl",
-    "multiplants_mtg1a.nl",
-    "multiplants_mtg1b.nl",
-    "multiplants_mtg1c.nl",
-    "multiplants_mtg2.nl",
-    "multiplants_mtg5.nl",
-    "multiplants_mtg6.nl",
-    "multiplants_stg1.nl",
-    "multiplants_stg1a.nl",
-    "multiplants_stg1b.nl",
-    "multiplants_stg1c.nl",
-    "multiplants_stg5.nl",
-    "multiplants_stg6.nl",
-    "nvs01.nl",
-    "nvs05.nl",
-    "nvs08.nl",
-    "nvs21.nl",
-    "nvs22.nl",
-    "oaer.nl",
-    "oil.nl",
-    "oil2.nl",
-    "ortez.nl",
-    "parallel.nl",
-    "pooling_epa1.nl",
-    "pooling_epa2.nl",
-    "pooling_epa3.nl",
-    "primary.nl",
-    "procsel.nl",
-    "saa_2.nl",
-    "sepasequ_complex.nl",
-    "sepasequ_convent.nl",
-    "sfacloc1_2_80.nl",
-    "sfacloc1_2_90.nl",
-    "sfacloc1_2_95.nl",
-    "sfacloc1_3_80.nl",
-    "sfacloc1_3_90.nl",
-    "sfacloc1_3_95.nl",
-    "sfacloc1_4_80.nl",
-    "sfacloc1_4_90.nl",
-    "sfacloc1_4_95.nl",
-    "sfacloc2_2_80.nl",
-    "sfacloc2_2_90.nl",
-    "sfacloc2_2_95.nl",
-    "sfacloc2_3_80.nl",
-    "sfacloc2_3_90.nl",
-    "sfacloc2_3_95.nl",
-    "sfacloc2_4_80.nl",
-    "sfacloc2_4_90.nl",
-    "sfacloc2_4_95.nl",
-    "spring.nl",
-    "st_e15.nl",
-    "st_e29.nl",
-    "st_e32.nl",
-    "st_e35.nl",
-    "st_e36.nl",
-    "st_e38.nl",
-    "st_e40.nl",
-    "super3t.nl",
-    "supplychainp1_020306.nl",
-    "supplychainp1_022020.nl",
-    "supplychainp1_030510.nl",
-    "supplychainp1_053050.nl",
-    "supplychainr1_020306.nl",
-    "supplychainr1_022020.nl",
-    "supplychainr1_030510.nl",
-    "supplychainr1_053050.nl",
-    "synheat.nl",
-    "tanksize.nl",
-    "transswitch0009p.nl",
-    "transswitch0009r.nl",
-    "transswitch0014p.nl",
-    "transswitch0014r.nl",
-    "transswitch0030p.nl",
-    "transswitch0030r.nl",
-    "transswitch0039p.nl",
-    "transswitch0039r.nl",
-    "transswitch0057p.nl",
-    "transswitch0057r.nl",
-    "transswitch0118p.nl",
-    "transswitch0118r.nl",
-    "transswitch0300p.nl",
-    "transswitch0300r.nl",
-    "transswitch2383wpp.nl",
-    "transswitch2383wpr.nl",
-    "transswitch2736spp.nl",
-    "transswitch2736spr.nl",
-    "tspn05.nl",
-    "tspn08.nl",
-    "tspn10.nl",
-    "tspn12.nl",
-    "tspn15.nl",
-    "unitcommit2.nl",
-    "uselinear.nl",
-    "var_con10.nl",
-    "var_con5.nl",
-    "wager.nl",
-    "wastepaper3.nl",
-    "wastepaper4.nl",
-    "wastepaper5.nl",
-    "wastepaper6.nl",
-    "water4.nl",
-    "waternd1.nl",
-    "waternd2.nl",
-    "waterno2_01.nl",
-    "waterno2_02.nl",
-    "waterno2_03.nl",
-    "waterno2_04.nl",
-    "waterno2_06.nl",
-    "waterno2_09.nl",
-    "waterno2_12.nl",
-    "waterno2_18.nl",
-    "waterno2_24.nl",
-    "watertreatnd_conc.nl",
-    "watertreatnd_flow.nl",
-    "waterx.nl",
-    "waterz.nl",
-    "windfac.nl",
-]
 
-if len(argv) != 4:
-    print(
-        "Usage: python run_shot.py <problem type 'cvx', 'noncvx'> <root_folder_minlp> <results_folder>"
-    )
-    exit()
+def shot_options(time_limit=TIME_LIMIT):
+    """Options of SHOT as used in the paper."""
+    return [
+        "--absgap=0.01",
+        "--relgap=0.01",
+        f"--timelimit={time_limit}",
+        "--threads=1",
+        "Subsolver.Ipopt.LinearSolver=1",
+        "Dual.TreeStrategy=1",
+    ]
 
-problem_type = argv[1]
-root_folder_minlp = argv[2]
-results_folder = argv[3]
-if not path.exists(f"{results_folder}"):
-    mkdir(results_folder)
 
-if problem_type == "cvx":
-    problems = cvx_problems
-elif problem_type == "noncvx":
-    problems = noncvx_problems
-else:
-    raise ValueError("problem type must be either 'cvx' or 'noncvx'!")
+def shot_command(problem_file, osrl_file, time_limit=TIME_LIMIT):
+    """SHOT call as used in the paper, single threaded."""
+    return ["SHOT", problem_file] + shot_options(time_limit) + [f"--osrl={osrl_file}"]
 
-for problem in problems:
-    t = time()
-    print(f"START {problem}")
-    name = problem[:-3]
-    if path.exists(f"{results_folder}/{name}.osrl"):
-        copyfile(f"{results_folder}/{name}.osrl", f"{name}.osrl")
+
+def shot_version():
+    """Version string reported by SHOT."""
+    try:
+        output = subprocess.run(
+            ["SHOT", "--version"], capture_output=True, text=True, timeout=60
+        ).stdout
+    except (OSError, subprocess.SubprocessError):
+        return "unknown"
+    lines = [line.strip() for line in output.splitlines() if line.strip()]
+    return lines[0] if lines else "unknown"
+
+
+def read_rss(pid):
+    """Resident set size of a process in bytes, 0 if not available."""
+    try:
+        with open(f"/proc/{pid}/status", "r") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) * 1024
+    except (OSError, ValueError):
+        pass
+    return 0
+
+
+def pin_to_core(core):
+    """Return a preexec_fn pinning the child process to a single core."""
+
+    def pin():
+        if hasattr(os, "sched_setaffinity"):
+            os.sched_setaffinity(0, {core})
+
+    return pin
+
+
+def run_parallel(
+    jobs,
+    root_folder_minlp,
+    journal,
+    workers,
+    timeout,
+    max_rss,
+    cache=None,
+    time_limit=TIME_LIMIT,
+    running_jobs=None,
+):
+    """
+    Run SHOT on the jobs with at most `workers` concurrent processes.
+
+    :param jobs: list of (id, problem, cache key) tuples
+    :param journal: Journal of the results folder
+    :param timeout: wall-clock limit per process in seconds
+    :param max_rss: memory limit per process in bytes, None for no limit
+    :param cache: ResultCache to store successful results in
+    :param time_limit: time limit of SHOT in seconds
+    :param running_jobs: RunningJobs to record the running jobs in
+    """
+    results_folder = journal.folder
+    if hasattr(os, "sched_getaffinity"):
+        cores = sorted(os.sched_getaffinity(0))
     else:
-        try:
-            subprocess.check_output(
-                [
-                    "SHOT",
-                    f"{root_folder_minlp}/{problem}",
-                    "--absgap=0.01",
-                    "--relgap=0.01",
-                    "--timelimit=300.0",
-                    "--threads=1",
-                    "Subsolver.Ipopt.LinearSolver=1",
-                    "Dual.TreeStrategy=1",
-                    f"--osrl={results_folder}/{name}.osrl",
-                ]
+        cores = list(range(os.cpu_count()))
+    if workers > len(cores):
+        print(f"Warning: only {len(cores)} cores available for {workers} workers")
+    free_cores = cores[:workers]
+    pending = list(jobs)
+    running = {}
+    while pending or running:
+        while pending and free_cores:
+            idx, problem, key = pending.pop(0)
+            name = problem[:-3]
+            core = free_cores.pop(0)
+            log = open(path.join(results_folder, f"{name}.log"), "w")
+            process = subprocess.Popen(
+                shot_command(
+                    path.join(root_folder_minlp, problem),
+                    path.join(results_folder, f"{name}.osrl"),
+                    time_limit,
+                ),
+                stdout=log,
+                stderr=subprocess.STDOUT,
+                preexec_fn=pin_to_core(core),
             )
-            print(f"Took {time() - t}")
-        except Exception as e:
-            print(e)
+            print(f"START {problem} on core {core}")
+            if running_jobs is not None:
+                running_jobs.start(results_folder, name)
+            running[process.pid] = [process, idx, problem, key, core, log, time(), 0]
+
+        sleep(POLL_INTERVAL)
+        for pid, (process, idx, problem, key, core, log, t, peak) in list(
+            running.items()
+        ):
+            rss = read_rss(pid)
+            peak = max(peak, rss)
+            running[pid][-1] = peak
+            returncode = process.poll()
+            if returncode is None:
+                if time() - t > timeout:
+                    status = "TIMEOUT"
+                elif max_rss is not None and rss > max_rss:
+                    status = "OOM"
+                else:
+                    continue
+                process.kill()
+                returncode = process.wait()
+            else:
+                status = "OK" if returncode == 0 else "ERROR"
+            log.close()
+            del running[pid]
+            free_cores.append(core)
+            print(f"{status} {problem}, took {time() - t}")
+            if running_jobs is not None:
+                running_jobs.stop(results_folder, problem[:-3])
+            record = {
+                "id": idx,
+                "path": problem,
+                "status": status,
+                "returncode": returncode,
+                "wall_time": time() - t,
+                "max_rss": peak,
+                "key": key,
+            }
+            journal.add(record)
+            osrl_file = path.join(results_folder, f"{problem[:-3]}.osrl")
+            if cache is not None and status == "OK" and path.exists(osrl_file):
+                cache.put(key, record, {f"{problem[:-3]}.osrl": osrl_file})
+    return journal
+
+
+def pending_jobs(
+    journal, problems, root_folder_minlp, version, time_limit, repetition=0, cache=None
+):
+    """
+    Jobs of the problems that are not solved yet, cached results are restored.
+
+    :return: list of (id, problem, cache key) tuples, cf. run_parallel
+    """
+    jobs = []
+    for idx, problem in enumerate(problems):
+        name = problem[:-3]
+        osrl_file = path.join(journal.folder, f"{name}.osrl")
+        key = cache_key(
+            path.join(root_folder_minlp, problem),
+            "SHOT",
+            version,
+            shot_options(time_limit),
+            time_limit,
+            repetition,
+        )
+        previous = journal.records.get(idx)
+        if previous is not None and previous.get("key") == key:
+            if path.exists(osrl_file) or previous["status"] != "OK":
+                # Solved before with the same SHOT version and options
+                continue
+        cached = cache.get(key) if cache is not None else None
+        if cached is not None:
+            cache.restore(key, f"{name}.osrl", osrl_file)
+            journal.add(dict(cached, id=idx, path=problem))
+            print(f"CACHED {problem}")
+        else:
+            jobs.append((idx, problem, key))
+    return jobs
+
+
+if __name__ == "__main__":
+    parser = ArgumentParser(description="Solve the problems with SHOT")
+    parser.add_argument("problem_type", help="'cvx' or 'noncvx'")
+    parser.add_argument("root_folder_minlp", help="folder with the nl instances")
+    parser.add_argument("results_folder", help="folder to save the osrl files")
+    parser.add_argument(
+        "--workers", type=int, default=1, help="number of concurrent SHOT processes"
+    )
+    parser.add_argument(
+        "--timeout",
+        type=float,
+        default=None,
+        help="wall-clock limit per instance in seconds (default: time limit + 60)",
+    )
+    parser.add_argument(
+        "--memory", type=float, default=None, help="memory limit per instance in GB"
+    )
+    parser.add_argument(
+        "--spec", default=None, help="experiment spec (default: experiments.json)"
+    )
+    parser.add_argument(
+        "--repetitions",
+        type=int,
+        default=None,
+        help="solve every instance k times, in <results_folder>/rep<r> (default: from the spec)",
+    )
+    args = parser.parse_args()
+
+    problem_type = args.problem_type
+    root_folder_minlp = args.root_folder_minlp
+    results_folder = args.results_folder
+    os.makedirs(results_folder, exist_ok=True)
+
+    spec = load_spec(args.spec)
+    if problem_type not in spec["instance_sets"]:
+        raise ValueError("problem type must be either 'cvx' or 'noncvx'!")
+    problems = [name + ".nl" for name in set_instances(spec, problem_type, "shot")]
+    time_limit = float(spec["solvers"]["shot"].get("time_limit", spec["time_limit"]))
+    timeout = time_limit + KILL_GRACE if args.timeout is None else args.timeout
+
+    repetitions = spec.get("repetitions", 1)
+    if args.repetitions is not None:
+        repetitions = args.repetitions
+
+    cache = default_cache()
+    version = shot_version()
+    estimator = RuntimeEstimator()
+    max_rss = None if args.memory is None else args.memory * 1024**3
+    running_jobs = RunningJobs(results_folder, args.workers)
+    t = time()
+    # Repetitions are solved in rounds, cf. parallel_runner.py
+    for repetition in range(repetitions):
+        folder = repetition_folder(results_folder, repetition)
+        journal = Journal(folder, "shot", len(problems), HEADER)
+        jobs = pending_jobs(
+            journal, problems, root_folder_minlp, version, time_limit, repetition, cache
+        )
+        estimates = [
+            estimator.estimate(f"{problem_type}_shot", problem[:-3])
+            for _, problem, _ in jobs
+        ]
+        jobs, _ = order_longest_first(jobs, estimates)
+        run_parallel(
+            jobs,
+            root_folder_minlp,
+            journal,
+            args.workers,
+            timeout,
+            max_rss,
+            cache,
+            time_limit,
+            running_jobs,
+        )
+    running_jobs.close()
+    print(f"Took {time() - t}")
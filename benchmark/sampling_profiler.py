@@ -0,0 +1,204 @@
+# This file is part of camino-benchmark
+# Copyright (C) 2026  Andrea Ghezzi, Wim Van Roy, Sebastian Sager, Moritz Diehl
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""
+Sampling profiler of the Python overhead of CAMINO.
+
+With `parallel_runner.py --profile` every solve runs under a
+SamplingProfiler: a background thread reads the stack of the solving thread
+with `sys._current_frames` every `--profile-interval` seconds, no changes to
+CAMINO are needed. The stacks of an instance are written as folded stacks
+(`frame;frame;frame count`, the input of flamegraph.pl and speedscope) to
+`<group>/profile_<i>.folded`.
+
+Native code holding the GIL, e.g. most of the time spent in the subsolvers
+called through CasADi, delays the sampler. The samples therefore mostly
+show where the Python time (`python_time` in the results) is spent.
+
+The stacks of all instances are aggregated per algorithm with
+
+    python benchmark/sampling_profiler.py <results_dir> [--top 30]
+
+which writes `profile_<algorithm>.folded` and the ranked table of the hot
+functions `profile_<algorithm>.csv` to the results folder.
+"""
+
+import glob
+import os
+import sys
+import threading
+from argparse import ArgumentParser
+from collections import Counter
+import pandas as pd
+from journal import load_overview
+
+INTERVAL = 0.005
+# Profiles of single instances, not the aggregated profile_<algorithm>.folded
+PROFILE_PATTERN = "profile_[0-9]*.folded"
+
+
+def frame_label(code):
+    """Label of a frame, module path and qualified name of the function."""
+    filename = code.co_filename.replace(os.sep, "/")
+    if "site-packages/" in filename:
+        filename = filename.rsplit("site-packages/", 1)[1]
+    else:
+        filename = os.path.basename(filename)
+    return f"{filename}:{getattr(code, 'co_qualname', code.co_name)}"
+
+
+class SamplingProfiler:
+    """Sample the stack of the calling thread from a background thread."""
+
+    def __init__(self, interval=INTERVAL):
+        self.interval = interval
+        self.stacks = Counter()
+        self.samples = 0
+        self._labels = {}
+
+    def __enter__(self):
+        self.start(sys._getframe(1))
+        return self
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def start(self, caller=None):
+        """Start sampling, the frames above `caller` are left out of the stacks."""
+        self.thread_id = threading.get_ident()
+        caller = caller or sys._getframe(1)
+        self._skip = 0
+        while caller.f_back is not None:
+            self._skip += 1
+            caller = caller.f_back
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._sample, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Stop sampling."""
+        self._stop.set()
+        self._thread.join()
+
+    def _label(self, code):
+        label = self._labels.get(code)
+        if label is None:
+            label = self._labels[code] = frame_label(code)
+        return label
+
+    def _sample(self):
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            stack = []
+            while frame is not None:
+                stack.append(self._label(frame.f_code))
+                frame = frame.f_back
+            if len(stack) > self._skip:
+                self.stacks[";".join(reversed(stack[: len(stack) - self._skip]))] += 1
+                self.samples += 1
+
+    def write(self, filename):
+        """Write the folded stacks."""
+        write_folded(self.stacks, filename)
+
+
+def write_folded(stacks, filename):
+    """Write stacks in the folded format, one `stack count` per line."""
+    with open(filename, "w") as f:
+        for stack, count in sorted(stacks.items()):
+            f.write(f"{stack} {count}\n")
+
+
+def read_folded(filename):
+    """Read a file of folded stacks as a Counter."""
+    stacks = Counter()
+    with open(filename, "r") as f:
+        for line in f:
+            stack, _, count = line.rstrip("\n").rpartition(" ")
+            if stack:
+                stacks[stack] += int(count)
+    return stacks
+
+
+def hot_functions(profiles):
+    """
+    Rank the functions of the stacks of several instances.
+
+    :param profiles: list of Counter of folded stacks, one per instance
+    :return: DataFrame with the self and total (inclusive) samples of every
+        function, their share of all samples and the number of instances in
+        which the function was sampled, sorted on the self samples
+    """
+    own, total, instances = Counter(), Counter(), Counter()
+    samples = 0
+    for stacks in profiles:
+        seen = set()
+        for stack, count in stacks.items():
+            frames = stack.split(";")
+            own[frames[-1]] += count
+            for frame in set(frames):
+                total[frame] += count
+            seen.update(frames)
+            samples += count
+        instances.update(seen)
+    table = pd.DataFrame(
+        {
+            "self": pd.Series(own, dtype=int),
+            "total": pd.Series(total, dtype=int),
+            "instances": pd.Series(instances, dtype=int),
+        }
+    ).fillna(0)
+    table = table.astype(int)
+    table.insert(1, "self_share", table["self"] / max(samples, 1))
+    table.insert(3, "total_share", table["total"] / max(samples, 1))
+    table.index.name = "function"
+    return table.sort_values(["self", "total"], ascending=False)
+
+
+def profile_folders(results_dir):
+    """Results folders containing profiles, grouped by algorithm."""
+    folders = {}
+    for folder in sorted(
+        glob.glob(os.path.join(results_dir, "**", ""), recursive=True)
+    ):
+        if len(glob.glob(os.path.join(folder, PROFILE_PATTERN))) == 0:
+            continue
+        try:
+            algorithm = load_overview(folder).get("algorithm")
+        except (OSError, ValueError):
+            algorithm = None
+        algorithm = algorithm or os.path.basename(os.path.normpath(folder))
+        folders.setdefault(algorithm, []).append(folder)
+    return folders
+
+
+if __name__ == "__main__":
+    parser = ArgumentParser(description="Aggregate the sampled stacks per algorithm")
+    parser.add_argument("results_dir", help="output folder of parallel_runner.py")
+    parser.add_argument("--top", type=int, default=30, help="rows of the table shown")
+    args = parser.parse_args()
+
+    folders = profile_folders(args.results_dir)
+    if len(folders) == 0:
+        print(f"No profiles in {args.results_dir}, run parallel_runner.py --profile")
+        exit(1)
+
+    pd.set_option("display.width", 200)
+    pd.set_option("display.max_colwidth", 100)
+    for algorithm, group_folders in folders.items():
+        profiles = [
+            read_folded(f)
+            for folder in group_folders
+            for f in sorted(glob.glob(os.path.join(folder, PROFILE_PATTERN)))
+        ]
+        merged = sum(profiles, Counter())
+        filename = os.path.join(args.results_dir, f"profile_{algorithm}.folded")
+        write_folded(merged, filename)
+        table = hot_functions(profiles)
+        table.to_csv(os.path.join(args.results_dir, f"profile_{algorithm}.csv"))
+        print(
+            f"=== {algorithm}: {len(profiles)} instances, {sum(merged.values())} samples"
+        )
+        print(table.head(args.top).to_string(float_format="{:.3f}".format))
+        print(f"Written {filename} and profile_{algorithm}.csv")
@@ -0,0 +1,143 @@
+# This file is part of camino-benchmark
+# Copyright (C) 2026  Andrea Ghezzi, Wim Van Roy, Sebastian Sager, Moritz Diehl
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""
+Longest-job-first scheduling of benchmark jobs.
+
+The expected solve time of a job is taken from previous results, i.e. the
+`<solver>.calc_time` columns of the merged `cvx.csv`/`noncvx.csv` files and
+`wall_time_noncvx_sbmiqp.json`. For instances without history the time is
+estimated from the problem size (`nvars`, `ncons`, `nz`) in
+`minlplib_instancedata.csv`. The same estimates balance the shards of a
+matrix run on several machines, cf. `--shard` of parallel_runner.py.
+"""
+
+import glob
+import heapq
+import json
+import os
+import numpy as np
+import pandas as pd
+
+BENCHMARK_DIR = os.path.dirname(os.path.abspath(__file__))
+TIME_LIMIT = 300
+SIZE_COLUMNS = ["nvars", "ncons", "nz"]
+
+
+def default_history_files():
+    """Result files shipped with the repository."""
+    results_dir = os.path.join(os.path.dirname(BENCHMARK_DIR), "results")
+    files = sorted(glob.glob(os.path.join(results_dir, "*", "cvx.csv")))
+    files += sorted(glob.glob(os.path.join(results_dir, "*", "noncvx.csv")))
+    files.append(os.path.join(BENCHMARK_DIR, "wall_time_noncvx_sbmiqp.json"))
+    return files
+
+
+def load_history(files):
+    """
+    Load previous solve times.
+
+    :param files: list of merged csv files or json files with calc_time
+    :return: DataFrame with columns name, solver, calc_time
+    """
+    frames = []
+    for f in files:
+        if not os.path.exists(f):
+            print(f"Warning: File not found: {f}")
+            continue
+        if f.endswith(".json"):
+            with open(f, "r") as fh:
+                data = pd.DataFrame(json.load(fh))
+        else:
+            data = pd.read_csv(f, index_col="name")
+        data = data[[col for col in data.columns if col.endswith(".calc_time")]]
+        data.columns = [col.split(".")[0] for col in data.columns]
+        data = data.apply(pd.to_numeric, errors="coerce")
+        data.index.name = "name"
+        data = data.reset_index().melt(
+            id_vars="name", var_name="solver", value_name="calc_time"
+        )
+        frames.append(data.dropna())
+    if len(frames) == 0:
+        return pd.DataFrame(columns=["name", "solver", "calc_time"])
+    history = pd.concat(frames, ignore_index=True)
+    history["calc_time"] = history["calc_time"].clip(lower=0, upper=TIME_LIMIT)
+    return history
+
+
+def fit_size_model(per_instance, instancedata):
+    """Fit log(time) as a linear function of the log problem size."""
+    sizes = np.log1p(instancedata[SIZE_COLUMNS].astype(float))
+    known = sizes.index.intersection(per_instance.index)
+    if len(known) <= len(SIZE_COLUMNS):
+        return None
+    A = np.column_stack([np.ones(len(known)), sizes.loc[known].to_numpy()])
+    b = np.log(per_instance.loc[known].to_numpy() + 1e-3)
+    coef, *_ = np.linalg.lstsq(A, b, rcond=None)
+    return coef
+
+
+class RuntimeEstimator:
+    """Estimate the solve time of (solver, instance) pairs."""
+
+    def __init__(self, history_files=None, instancedata=None):
+        if history_files is None:
+            history_files = default_history_files()
+        if instancedata is None:
+            instancedata = os.path.join(BENCHMARK_DIR, "minlplib_instancedata.csv")
+        history = load_history(history_files)
+        self.per_solver = history.groupby(["solver", "name"])["calc_time"].median()
+        self.per_instance = history.groupby("name")["calc_time"].median()
+        self.instancedata = pd.read_csv(instancedata, sep=";", index_col="name")
+        self.size_coef = fit_size_model(self.per_instance, self.instancedata)
+        self.default = (
+            float(self.per_instance.median()) if len(self.per_instance) else 1.0
+        )
+
+    def estimate(self, solver, name):
+        """Expected solve time in seconds."""
+        if (solver, name) in self.per_solver.index:
+            return float(self.per_solver[(solver, name)])
+        if name in self.per_instance.index:
+            return float(self.per_instance[name])
+        if self.size_coef is not None and name in self.instancedata.index:
+            size = np.log1p(self.instancedata.loc[name, SIZE_COLUMNS].astype(float))
+            estimate = np.exp(self.size_coef[0] + size.to_numpy() @ self.size_coef[1:])
+            return float(min(estimate, TIME_LIMIT))
+        return self.default
+
+
+def predict_makespan(durations, workers):
+    """Makespan of list scheduling the durations in the given order."""
+    finish = [0.0] * workers
+    for duration in durations:
+        heapq.heappush(finish, heapq.heappop(finish) + duration)
+    return max(finish)
+
+
+def order_longest_first(items, estimates):
+    """Sort items on decreasing expected duration."""
+    order = sorted(range(len(items)), key=lambda i: -estimates[i])
+    return [items[i] for i in order], [estimates[i] for i in order]
+
+
+def partition_longest_first(keys, estimates, parts):
+    """
+    Partition items into parts of about the same expected duration.
+
+    The items are assigned longest first to the part with the least expected
+    duration so far; ties are broken on the keys, such that every process
+    computes the same partition.
+
+    :param keys: unique sortable key of every item
+    :return: part of every item, in 0..parts-1
+    """
+    order = sorted(range(len(keys)), key=lambda i: (-estimates[i], keys[i]))
+    loads = [(0.0, part) for part in range(parts)]
+    assignment = [0] * len(keys)
+    for i in order:
+        load, part = heapq.heappop(loads)
+        assignment[i] = part
+        heapq.heappush(loads, (load + estimates[i], part))
+    return assignment
@@ -0,0 +1,239 @@
+# This file is part of camino-benchmark
+# Copyright (C) 2026  Andrea Ghezzi, Wim Van Roy, Sebastian Sager, Moritz Diehl
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""
+Select stratified subsets of the instance sets for quick regression runs.
+
+The instances are stratified by
+
+- size: terciles of log(nvars) + log(ncons) + log(nz),
+- nonlinearity: the operators (`op*` columns) and the counts of quadratic,
+  polynomial and signomial constraints and objectives (`n*cons`, `n*func`)
+  in minlplib_instancedata.csv,
+- runtime: the expected solve time of the previous results (cf. scheduler.py),
+
+and taken in a seeded order that keeps every prefix proportional to the
+strata, until the expected solve time of the subset reaches the budget. Of
+several seeds, the subset whose performance profiles on the previous results
+are closest to the ones of the full set is kept:
+
+    python benchmark/select_instances.py <key: cvx, noncvx> <budget> <output.csv>
+
+e.g. `cvx 600 benchmark/convex_set_smoke.csv` for a 10 minute smoke set.
+The output has the format of `convex_set_full.csv` and is accepted by
+`parallel_runner.py --instances`.
+"""
+
+import glob
+import os
+from argparse import ArgumentParser
+import numpy as np
+import pandas as pd
+from create_plot import performance_ratios
+from result_status import parse_column
+from scheduler import BENCHMARK_DIR, SIZE_COLUMNS, RuntimeEstimator
+
+# Operators of the nonlinearity classes, and the counts of the classes without
+# operators in minlplib_instancedata.csv; the first matching class is used
+NONLINEARITY_CLASSES = {
+    "nonsmooth": ["opabs", "opmin", "opmod", "opsignpower"],
+    "transcendental": [
+        "opexp",
+        "oplog",
+        "oplog10",
+        "opcentropy",
+        "operrorf",
+        "opgamma",
+        "optanh",
+        "opsin",
+        "opcos",
+    ],
+    "algebraic": [
+        "opmul",
+        "opsqr",
+        "opsqrt",
+        "opdiv",
+        "oppower",
+        "oprpower",
+        "opcvpower",
+        "opvcpower",
+    ],
+    "signomial": ["nsignomcons", "nsignomfunc"],
+    "polynomial": ["npolynomcons", "npolynomfunc"],
+    "quadratic": ["nquadcons", "nquadfunc"],
+}
+# Upper bounds of the runtime classes in seconds
+RUNTIME_CLASSES = {"easy": 10, "medium": 100, "hard": np.inf}
+SIZE_CLASSES = ["small", "medium", "large"]
+SET_FILES = {"cvx": "convex_set_full.csv", "noncvx": "nonconvex_set_full.csv"}
+
+
+def nonlinearity_class(instancedata):
+    """Nonlinearity class of every instance."""
+    classes = pd.Series("linear", index=instancedata.index)
+    for name, ops in reversed(NONLINEARITY_CLASSES.items()):
+        present = instancedata.reindex(columns=ops).fillna(False).astype(bool)
+        classes[present.any(axis=1)] = name
+    return classes
+
+
+def strata(names, instancedata, expected):
+    """
+    Stratum of every instance.
+
+    :param names: instance names
+    :param expected: Series of the expected solve time of the instances
+    :return: DataFrame with the size, nonlinearity and runtime class
+    """
+    data = instancedata.reindex(names)
+    size = np.log1p(data[SIZE_COLUMNS].astype(float)).sum(axis=1)
+    runtime_bins = [-np.inf] + list(RUNTIME_CLASSES.values())
+    return pd.DataFrame(
+        {
+            "size": pd.qcut(size.rank(method="first"), 3, labels=SIZE_CLASSES),
+            "nonlinearity": nonlinearity_class(data),
+            "runtime": pd.cut(
+                expected.reindex(names), runtime_bins, labels=list(RUNTIME_CLASSES)
+            ),
+        },
+        index=pd.Index(names, name="name"),
+    )
+
+
+def proportional_order(stratum, rng):
+    """
+    Random order of the instances such that every prefix is stratified.
+
+    The i-th of the n instances of a stratum gets the key (i + u) / n, with the
+    instances of a stratum shuffled and u uniform in [0, 1).
+    """
+    codes = stratum.astype(str).agg("/".join, axis=1)
+    key = np.empty(len(codes))
+    for members in codes.groupby(codes).indices.values():
+        members = rng.permutation(members)
+        key[members] = (np.arange(len(members)) + rng.random()) / len(members)
+    return codes.index[np.argsort(key, kind="stable")]
+
+
+def fill_budget(order, expected, budget):
+    """Take the instances in order while the expected solve time fits the budget."""
+    cost = expected.reindex(order).to_numpy()
+    return list(order[: max(1, int(np.searchsorted(np.cumsum(cost), budget, "right")))])
+
+
+def profile_distance(history, subset, tau_max=10):
+    """
+    Largest distance between the performance profiles of a subset and the full set.
+
+    :param history: DataFrame of the previous results, instances x solvers
+    :return: maximum over the solvers and tau of the difference of the profiles
+    """
+    ratios = np.minimum(performance_ratios(history.to_numpy()), tau_max)
+    inside = history.index.isin(subset)
+    if not inside.any():
+        return 1.0
+    distance = 0.0
+    for j in range(ratios.shape[1]):
+        full = np.sort(ratios[:, j])
+        part = np.sort(ratios[inside, j])
+        tau = np.unique(full)
+        diff = np.searchsorted(full, tau, "right") / len(full) - np.searchsorted(
+            part, tau, "right"
+        ) / len(part)
+        distance = max(distance, float(np.abs(diff).max()))
+    return distance
+
+
+def load_profile_history(key, files=None):
+    """Previous calc_time and obj columns of the merged csv files."""
+    if files is None:
+        results_dir = os.path.join(os.path.dirname(BENCHMARK_DIR), "results")
+        files = sorted(glob.glob(os.path.join(results_dir, "*", f"{key}.csv")))
+    tables = []
+    for f in files:
+        data = pd.read_csv(f, index_col="name")
+        cols = [c for c in data.columns if c.endswith((".calc_time", ".obj"))]
+        table = pd.DataFrame(index=data.index)
+        for col in cols:
+            table[f"{os.path.basename(os.path.dirname(f))}/{col}"] = parse_column(
+                data[col]
+            )[0]
+        tables.append(table)
+    if len(tables) == 0:
+        return pd.DataFrame()
+    history = pd.concat(tables, axis=1)
+    return history[~history.index.duplicated()]
+
+
+def select(key, budget, solver=None, seeds=range(20), estimator=None, history=None):
+    """
+    Select a stratified subset of an instance set.
+
+    :param key: cvx or noncvx
+    :param budget: expected solve time of the subset in seconds, for a single solver
+    :param solver: solver of the expected times, default: s-b-miqp
+    :param seeds: seeds to try, the subset closest to the full set is kept
+    :return: (list of names, strata, expected times, profile distance, seed)
+    """
+    names = pd.read_csv(os.path.join(BENCHMARK_DIR, SET_FILES[key]))["name"]
+    solver = solver or f"{key}_sbmiqp"
+    estimator = estimator or RuntimeEstimator()
+    expected = pd.Series([estimator.estimate(solver, n) for n in names], index=names)
+    stratum = strata(names, estimator.instancedata, expected)
+    if history is None:
+        history = load_profile_history(key)
+    history = history.reindex(names)
+    # Metrics that are comparable on the instances of the set
+    columns = sorted({col.rsplit(".", 1)[1] for col in history.columns})
+    by_metric = [
+        history[[c for c in history.columns if c.endswith("." + m)]] for m in columns
+    ]
+
+    best = None
+    for seed in seeds:
+        rng = np.random.default_rng(seed)
+        subset = fill_budget(proportional_order(stratum, rng), expected, budget)
+        distance = max(
+            [profile_distance(table, subset) for table in by_metric], default=0.0
+        )
+        if best is None or distance < best[3]:
+            best = (subset, stratum, expected, distance, seed)
+    return best
+
+
+if __name__ == "__main__":
+    parser = ArgumentParser(description="Select a stratified subset of instances")
+    parser.add_argument("key", choices=list(SET_FILES))
+    parser.add_argument("budget", type=float, help="expected solve time in seconds")
+    parser.add_argument("output", help="csv file of the subset")
+    parser.add_argument(
+        "--solver", help="solver of the expected solve times (default: <key>_sbmiqp)"
+    )
+    parser.add_argument("--seeds", type=int, default=20, help="number of seeds")
+    parser.add_argument("--seed", type=int, default=0, help="first seed")
+    args = parser.parse_args()
+
+    subset, stratum, expected, distance, seed = select(
+        args.key,
+        args.budget,
+        args.solver,
+        range(args.seed, args.seed + args.seeds),
+    )
+    full = pd.read_csv(os.path.join(BENCHMARK_DIR, SET_FILES[args.key]))
+    full[full["name"].isin(subset)].to_csv(args.output, index=False)
+
+    print(f"Selected {len(subset)}/{len(full)} instances with seed {seed}")
+    print(f"Expected solve time {expected[subset].sum():.0f}s of {expected.sum():.0f}s")
+    print(
+        f"Largest distance of the performance profiles to the full set {distance:.3f}"
+    )
+    for col in stratum.columns:
+        counts = pd.DataFrame(
+            {
+                "full": stratum[col].value_counts(),
+                "subset": stratum.loc[subset, col].value_counts(),
+            }
+        )
+        print(counts.to_string())
+    print(f"Written {args.output}")
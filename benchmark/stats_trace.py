@@ -0,0 +1,220 @@
+# This file is part of camino-benchmark
+# Copyright (C) 2026  Andrea Ghezzi, Wim Van Roy, Sebastian Sager, Moritz Diehl
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""
+Per-iteration trace of the `stats_<i>.pkl` files of CAMINO.
+
+Every `Stats.save` of a run appends a snapshot to its pickle if
+`WITH_LOG_DATA` is set. The nl loader of CAMINO turns it off, i.e. the
+per-iteration snapshots are only saved by `parallel_runner.py --trace`,
+otherwise a pickle holds the final snapshot only. The trace is a long table with one row per (instance, snapshot, subproblem type), holding the
+bounds at the snapshot and the cumulative counters of the subproblem:
+
+    python benchmark/stats_trace.py <results_folder> ... [--refresh]
+
+The pickles of a folder are read in a pool of processes and the table is
+cached in `<results_folder>/trace.parquet`. The cache is used as long as no
+pickle was added, removed or changed.
+"""
+
+import hashlib
+import os
+import pickle
+import re
+from argparse import ArgumentParser
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+from journal import instance_name, load_overview
+
+TRACE_NAME = "trace.parquet"
+STATS_PATTERN = re.compile(r"^stats_(\d+)\.pkl$")
+# Key of the fingerprint of the pickles in the metadata of the cache
+FINGERPRINT_KEY = b"camino_benchmark.stats"
+# Version of the columns, a cache of another version is rebuilt
+TRACE_VERSION = 2
+
+# Values of a snapshot, shared by all subproblems. The time is counted from
+# the start of the solve, total_wall_time and the objective f_star are only
+# set in the last snapshot.
+SNAPSHOT_COLUMNS = {
+    "iter_nr": "Int64",
+    "best_iter": "Int64",
+    "iter_type": "string",
+    "lb": "float64",
+    "ub": "float64",
+    "time": "float64",
+    "total_wall_time": "float64",
+    "f_star": "float64",
+    "success": "boolean",
+}
+# Counters per subproblem, stored as "<subproblem>.<counter>" by CAMINO
+SUBPROBLEM_COLUMNS = {
+    "runs": "Int64",
+    "iter": "Int64",
+    "time": "float64",
+    "time_wall": "float64",
+}
+COLUMNS = (
+    ["solver", "idx", "name", "snapshot"]
+    + list(SNAPSHOT_COLUMNS)
+    + ["subproblem"]
+    + [f"sub_{col}" for col in SUBPROBLEM_COLUMNS]
+)
+
+
+def stats_files(folder):
+    """Pickles of a results folder, sorted by instance index."""
+    files = []
+    for entry in os.scandir(folder):
+        match = STATS_PATTERN.match(entry.name)
+        if match:
+            files.append((int(match.group(1)), entry))
+    return sorted(files, key=lambda x: x[0])
+
+
+def fingerprint(files):
+    """Fingerprint of the name, size and modification time of the pickles."""
+    h = hashlib.sha256(f"{TRACE_VERSION};".encode())
+    for _, entry in files:
+        stat = entry.stat()
+        h.update(f"{entry.name}:{stat.st_size}:{stat.st_mtime_ns};".encode())
+    return h.hexdigest()
+
+
+def scalar(value):
+    """Scalar value of a statistic, None for arrays and other objects."""
+    if isinstance(value, (bool, int, float, str)):
+        return value
+    try:
+        array = np.asarray(value, dtype=float)
+    except (TypeError, ValueError):
+        return None
+    return array.item() if array.size == 1 else None
+
+
+def snapshot_rows(snapshot):
+    """Rows of a single snapshot, one per subproblem type."""
+    shared = {col: scalar(snapshot.get(col)) for col in SNAPSHOT_COLUMNS}
+    subproblems = sorted(
+        {key.rsplit(".", 1)[0] for key in snapshot if key.endswith(".runs")}
+    )
+    if len(subproblems) == 0:
+        return [dict(shared, subproblem=None)]
+    rows = []
+    for subproblem in subproblems:
+        row = dict(shared, subproblem=subproblem)
+        for col in SUBPROBLEM_COLUMNS:
+            row[f"sub_{col}"] = scalar(snapshot.get(f"{subproblem}.{col}"))
+        rows.append(row)
+    return rows
+
+
+def read_stats(filename):
+    """
+    Read the rows of a single pickle, executed in a worker process.
+
+    Snapshots with a solution pool are stored once per pool entry, only the
+    first entry is kept.
+    """
+    with open(filename, "rb") as f:
+        snapshots = pickle.load(f)
+    snapshots = [s for s in snapshots if s.get("sol_pool_idx", 0) == 0]
+    return [
+        dict(row, snapshot=number)
+        for number, snapshot in enumerate(snapshots)
+        for row in snapshot_rows(snapshot)
+    ]
+
+
+def instance_names(folder):
+    """Instance name of every index of a results folder."""
+    try:
+        data = load_overview(folder)["data"]
+    except (OSError, ValueError):
+        return {}
+    return {row[0]: instance_name(row[1]) for row in data[1:]}
+
+
+def read_trace(folder, workers=None):
+    """
+    Read the pickles of a results folder into a trace table.
+
+    :param folder: results folder of a single solver
+    :param workers: number of processes, default: number of cores
+    :return: DataFrame with COLUMNS
+    """
+    files = stats_files(folder)
+    names = instance_names(folder)
+    solver = os.path.basename(os.path.normpath(folder))
+    with ProcessPoolExecutor(workers) as pool:
+        results = pool.map(read_stats, [entry.path for _, entry in files], chunksize=16)
+        rows = [
+            dict(row, solver=solver, idx=idx, name=names.get(idx))
+            for (idx, _), stats in zip(files, results)
+            for row in stats
+        ]
+    trace = pd.DataFrame(rows).reindex(columns=COLUMNS)
+    for col in ["solver", "name", "subproblem"]:
+        trace[col] = trace[col].astype("string")
+    trace["idx"] = trace["idx"].astype("int64")
+    trace["snapshot"] = trace["snapshot"].astype("int64")
+    for col, dtype in SNAPSHOT_COLUMNS.items():
+        trace[col] = trace[col].astype(dtype)
+    for col, dtype in SUBPROBLEM_COLUMNS.items():
+        trace[f"sub_{col}"] = trace[f"sub_{col}"].astype(dtype)
+    return trace
+
+
+def load_trace(folder, columns=None, refresh=False, workers=None):
+    """
+    Load the trace of a results folder, using the cache if it is up to date.
+
+    :param columns: columns to read, None for all
+    :param refresh: read the pickles even if the cache is up to date
+    :return: DataFrame
+    """
+    cache = os.path.join(folder, TRACE_NAME)
+    key = fingerprint(stats_files(folder)).encode()
+    if not refresh and os.path.exists(cache):
+        metadata = pq.read_schema(cache).metadata or {}
+        if metadata.get(FINGERPRINT_KEY) == key:
+            return pd.read_parquet(cache, columns=columns)
+
+    trace = read_trace(folder, workers)
+    table = pa.Table.from_pandas(trace, preserve_index=False)
+    table = table.replace_schema_metadata(
+        {**(table.schema.metadata or {}), FINGERPRINT_KEY: key}
+    )
+    pq.write_table(table, cache)
+    return trace if columns is None else trace[columns]
+
+
+def final_snapshots(trace):
+    """Rows of the last snapshot of every instance."""
+    last = trace.groupby(["solver", "idx"])["snapshot"].transform("max")
+    return trace[trace["snapshot"] == last]
+
+
+if __name__ == "__main__":
+    parser = ArgumentParser(description="Read the stats pickles of CAMINO")
+    parser.add_argument("folders", nargs="+", help="results folders")
+    parser.add_argument("--refresh", action="store_true", help="ignore the cache")
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args()
+
+    for folder in args.folders:
+        trace = load_trace(folder, refresh=args.refresh, workers=args.workers)
+        final = final_snapshots(trace)
+        print(
+            f"{folder}: {trace['idx'].nunique()} instances, "
+            f"{trace.groupby('idx')['snapshot'].nunique().sum()} snapshots, "
+            f"{len(trace)} rows"
+        )
+        summary = final.groupby("subproblem")[
+            ["sub_runs", "sub_iter", "sub_time_wall"]
+        ].sum()
+        print(summary.to_string())
@@ -5,15 +5,21 @@
 
 from sys import argv
 import csv
-from camino.utils.data import read_json
+from journal import load_overview
 from os import path
 
+if len(argv) != 3:
+    print(
+        "Usage: python to_csv.py <overview.json | journal.jsonl | results_folder> <output.csv>"
+    )
+    exit(1)
+
 if argv[1] == argv[2]:
     raise Exception("Same arguments")
 if path.exists(argv[2]):
     raise Exception("CSV already exists!")
 
-data = read_json(argv[1])
+data = load_overview(argv[1])
 with open(argv[2], "w") as f:
     cf = csv.writer(f, dialect="excel")
     for line in data["data"]:
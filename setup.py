@@ -19,6 +19,7 @@ setup(
     install_requires=[
         "caminopy>=0.1.2",
         "lxml>=5.4.0",
+        "pyarrow",
     ],
     classifiers=[
         "Development Status :: 3 - Alpha",
@@ -0,0 +1,71 @@
+# This file is part of camino-benchmark
+# Copyright (C) 2026  Andrea Ghezzi, Wim Van Roy, Sebastian Sager, Moritz Diehl
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+import numpy as np
+from anytime_metrics import read_events, shot_events, shot_log_events
+
+SHOT_LOG = """\
+ Main iteration step
+╶──────────────────────────────────────────────────────────────────────────────────╴
+
+    Iteration     │  Time  │  Dual cuts  │     Objective value     │   Objective gap   │     Current solution
+     #: type      │  tot.  │   + | tot.  │       dual | primal     │    abs. | rel.    │    obj.fn. | max.err.
+╶─────────────────┴────────┴─────────────┴─────────────────────────┴───────────────────┴──────────────────────────────╴
+
+     1: LP               0.00           5 | 5         -inf | inf           inf | inf          -3.00e+06 | 5.26e+02 (4)
+     2: LP               0.01           4 | 9         -inf | inf           inf | inf          -1.43e+06 | 2.51e+02 (4)
+     3: MILP-O-F         0.03           4 | 13   2.67e+05 | inf           inf | inf           2.67e+05 | 1.12e+02 (4)
+        NLPFIX           0.04                    2.67e+05 | 2.86e+05  1.89e+04 | 6.61e-02
+     4: MILP-O-F         0.05           4 | 17   2.80e+05 | 2.86e+05  6.35e+03 | 2.22e-02    2.80e+05 | 2.47e+01 (4)
+     5: MILP-O           0.07                    2.86e+05 | 2.86e+05  0.00e+00 | 0.00e+00
+
+ Objective bound (dual)                     2.86e+05
+ Total solution time:                       0.07
+"""
+
+SHOT_OSRL = """\
+<?xml version="1.0" encoding="UTF-8"?>
+<osrl xmlns="os.optimizationservices.org">
+<optimization numberOfSolutions="1">
+<otherResults>
+<other name="PrimalObjectiveBound" value="2.86e+05"/>
+<other name="DualObjectiveBound" value="2.80e+05"/>
+</otherResults>
+<time type="Total">300.5</time>
+</optimization>
+</osrl>
+"""
+
+
+def test_shot_log_events(tmp_path):
+    log_file = tmp_path / "ex.log"
+    log_file.write_text(SHOT_LOG)
+    rows = shot_log_events(log_file)
+    assert [row[0] for row in rows] == [0.0, 0.01, 0.03, 0.04, 0.05, 0.07]
+    assert rows[0][1:] == [-np.inf, np.inf]
+    assert rows[3][1:] == [2.67e05, 2.86e05]
+    assert rows[-1][1:] == [2.86e05, 2.86e05]
+
+
+def test_shot_events_fall_back_to_osrl(tmp_path):
+    (tmp_path / "solved.log").write_text(SHOT_LOG)
+    (tmp_path / "solved.osrl").write_text(SHOT_OSRL)
+    # Killed before the main iteration step
+    (tmp_path / "killed.log").write_text(" Problem reformulation\n")
+    (tmp_path / "killed.osrl").write_text(SHOT_OSRL)
+    events = shot_events(tmp_path, "shot")
+    assert (events["name"] == "solved").sum() == 6
+    killed = events[events["name"] == "killed"]
+    assert killed[["time", "dual", "primal"]].values.tolist() == [
+        [300.5, 2.80e05, 2.86e05]
+    ]
+    assert (events["solver"] == "shot").all()
+
+
+def test_read_events_final_only(tmp_path):
+    # Solvers of AMPL only write the final result
+    (tmp_path / "overview.json").write_text("{}")
+    assert read_events(tmp_path, "cvx_bonmin") is None
+    (tmp_path / "ex.log").write_text(SHOT_LOG)
+    assert len(read_events(tmp_path, "cvx_shot")) == 6
@@ -0,0 +1,19 @@
+# This file is part of camino-benchmark
+# Copyright (C) 2026  Andrea Ghezzi, Wim Van Roy, Sebastian Sager, Moritz Diehl
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+import json
+from urllib.request import urlopen
+from dashboard import serve
+
+
+def test_serve_on_loopback():
+    server = serve(0, {"text": "", "status": {"eta": 1.0}})
+    try:
+        host, port = server.server_address[:2]
+        assert host == "127.0.0.1"
+        with urlopen(f"http://127.0.0.1:{port}/status.json") as response:
+            assert json.load(response) == {"eta": 1.0}
+    finally:
+        server.shutdown()
+        server.server_close()
@@ -0,0 +1,54 @@
+# This file is part of camino-benchmark
+# Copyright (C) 2026  Andrea Ghezzi, Wim Van Roy, Sebastian Sager, Moritz Diehl
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from camino.settings import Settings
+from parallel_runner import (
+    HEADER,
+    Job,
+    failed_row,
+    job_key,
+    store_cached,
+    trace_jobs,
+    with_settings,
+)
+from result_cache import ResultCache
+
+
+def make_job(settings, nl_file="ex.nl"):
+    return Job("cvx_sbmiqp", 0, nl_file, "s-b-miqp", settings, 300.0, 0, [])
+
+
+def test_trace_jobs(tmp_path):
+    nl_file = tmp_path / "ex.nl"
+    nl_file.write_text("g3 1 1 0\n")
+    job = make_job({"WITH_DEBUG": False}, str(nl_file))
+    (traced,) = trace_jobs([job])
+    assert traced.settings == {"WITH_DEBUG": False, "WITH_LOG_DATA": True}
+    assert job.settings == {"WITH_DEBUG": False}
+    assert job_key(traced, "1") != job_key(job, "1")
+
+
+def test_with_settings_overrides_loader():
+    def load_problem(*args):
+        # The nl loader of CAMINO turns the log data off
+        s = Settings()
+        s.WITH_LOG_DATA = False
+        return None, None, s
+
+    (job,) = trace_jobs([make_job({})])
+    _, _, s = with_settings(load_problem, job.settings, job.time_limit)("ex.nl")
+    assert s.WITH_LOG_DATA
+    assert s.TIME_LIMIT == 300.0
+
+
+def test_store_cached_skips_crashes(tmp_path):
+    cache = ResultCache(str(tmp_path / "cache"))
+    job = make_job({})
+    crashed = dict(zip(HEADER, failed_row(job, "CRASH")))
+    store_cached(job, cache, "aa-crash", crashed, str(tmp_path))
+    assert cache.get("aa-crash") is None
+    # Failures of the solver are reproducible and cached
+    failed = dict(zip(HEADER, failed_row(job, "Infeasible problem")))
+    store_cached(job, cache, "aa-failed", failed, str(tmp_path))
+    assert cache.get("aa-failed")["load_time"] == "Infeasible problem"
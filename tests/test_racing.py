@@ -0,0 +1,22 @@
+# This file is part of camino-benchmark
+# Copyright (C) 2026  Andrea Ghezzi, Wim Van Roy, Sebastian Sager, Moritz Diehl
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+import numpy as np
+from parallel_runner import HEADER
+from racing import record_scores
+
+
+def test_record_scores_failed_record():
+    solved = dict(zip(HEADER, [0, "ex.nl", 1.0, 0.5, 0.1, 2.0]))
+    slower = dict(zip(HEADER, [0, "ex.nl", 1.0, 0.5, 0.1, 4.0]))
+    worse = dict(zip(HEADER, [0, "ex.nl", 3.0, 0.5, 0.1, 1.0]))
+    # Failed rows of the runner only have the columns up to load_time
+    failed = dict(zip(HEADER, [0, "ex.nl", -np.inf, "FAILED", "CRASH"]))
+    scores = record_scores([solved, slower, worse, failed], 300.0)
+    assert scores.tolist() == [2.0, 4.0, 600.0, 600.0]
+
+
+def test_record_scores_all_failed():
+    failed = dict(zip(HEADER, [0, "ex.nl", -np.inf, "FAILED", "TIMEOUT"]))
+    assert record_scores([failed, failed], 300.0).tolist() == [600.0, 600.0]
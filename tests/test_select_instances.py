@@ -0,0 +1,53 @@
+# This file is part of camino-benchmark
+# Copyright (C) 2026  Andrea Ghezzi, Wim Van Roy, Sebastian Sager, Moritz Diehl
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+import os
+import numpy as np
+import pandas as pd
+import pytest
+from scheduler import BENCHMARK_DIR
+from select_instances import nonlinearity_class
+
+
+@pytest.fixture(scope="module")
+def instancedata():
+    return pd.read_csv(
+        os.path.join(BENCHMARK_DIR, "minlplib_instancedata.csv"),
+        sep=";",
+        index_col="name",
+    )
+
+
+@pytest.mark.parametrize(
+    "name, expected",
+    [
+        ("cvxnonsep_nsig20", "signomial"),
+        ("cvxnonsep_psig20", "signomial"),
+        ("flay02h", "signomial"),
+        ("autocorr_bern20-05", "polynomial"),
+        ("acopf_case1354pegase_qcqp", "quadratic"),
+    ],
+)
+def test_classes_without_operators(instancedata, name, expected):
+    assert nonlinearity_class(instancedata.loc[[name]])[name] == expected
+
+
+def test_no_linear_instances_in_the_sets(instancedata):
+    for set_file in ["convex_set_full.csv", "nonconvex_set_full.csv"]:
+        names = pd.read_csv(os.path.join(BENCHMARK_DIR, set_file))["name"]
+        classes = nonlinearity_class(instancedata.reindex(names))
+        assert "linear" not in set(classes)
+
+
+def test_operators_before_counts():
+    data = pd.DataFrame(
+        {
+            "opexp": [True, np.nan, np.nan, np.nan],
+            "nsignomfunc": [1, 1, 0, 0],
+            "npolynomcons": [0, 2, 0, 0],
+            "nquadcons": [3, 3, 3, 0],
+        },
+        index=["transcendental", "signomial", "quadratic", "linear"],
+    )
+    assert list(nonlinearity_class(data)) == list(data.index)